@@ -0,0 +1,298 @@
+import heapq
+import tkinter as tk
+
+import numpy as np
+import pytest
+
+from tktween.tween import TweenDirector
+
+
+class FakeInterpreter:
+    """Evaluates the commands issued through a CommandBatch against fake widgets."""
+
+    def __init__(self):
+        self.widgets = {}
+        # Every evaluated command, with batched commands unpacked
+        self.log = []
+
+
+    def register(self, widget):
+        self.widgets[str(widget)] = widget
+
+
+    def get(self, path):
+        widget = self.widgets.get(path)
+        if widget is None or getattr(widget, 'destroyed', False):
+            raise tk.TclError(f'bad window path name "{path}"')
+        return widget
+
+
+    def splitlist(self, value):
+        return tuple(value)
+
+
+    def call(self, *args):
+        if args[0] == 'foreach':
+            for command in args[2]:
+                self.call(*command)
+            return
+        if args[0] == 'lmap':
+            # Only the error collecting loop of CommandBatch.flush
+            errors = []
+            for command in args[2]:
+                try:
+                    self.call(*command)
+                except tk.TclError as error:
+                    errors.append(str(error))
+            return tuple(errors)
+        self.log.append(args)
+        if args[0] == 'place':
+            self.get(args[2]).place_configure(*args[3:])
+            return
+        path, command, element, *rest = args
+        canvas = self.get(path)
+        for item in canvas.find_withtag(element):
+            pts = np.array(canvas.items[item], dtype=np.float64).reshape(-1, 2)
+            if command == 'coords':
+                pts = np.array(rest, dtype=np.float64).reshape(-1, 2)
+            elif command == 'move':
+                pts += rest
+            elif command == 'scale':
+                x, y, sx, sy = rest
+                pts = (x, y) + (sx, sy) * (pts - (x, y))
+            elif command == 'itemconfigure':
+                canvas.options[item].update(zip((key[1:] for key in rest[0::2]), rest[1::2]))
+            canvas.items[item] = pts.ravel().tolist()
+
+
+class FakeCanvas:
+    """The subset of `tk.Canvas` used by scenes, without a display."""
+
+    def __init__(self, width=100, height=100):
+        self.items: dict[int, list[float]] = {}
+        self.options: dict[int, dict] = {}
+        self.tags: dict[int, set[str]] = {}
+        self.types: dict[int, str] = {}
+        self.width = width
+        self.height = height
+        # Canvas coordinates of the top left corner of the visible region
+        self.scroll = (0, 0)
+        self.tk = FakeInterpreter()
+        self.tk.register(self)
+
+
+    def __str__(self):
+        return '.canvas'
+
+
+    def create(self, *coords, tags=(), type='polygon', **options):
+        item = len(self.items) + 1
+        self.items[item] = [float(c) for c in coords]
+        self.types[item] = type
+        self.options[item] = dict(options)
+        self.tags[item] = set(tags)
+        return item
+
+
+    def coords(self, item):
+        return self.items[item]
+
+
+    def type(self, item):
+        return self.types[self.find_withtag(item)[0]]
+
+
+    def find_all(self):
+        return tuple(self.items)
+
+
+    def find_withtag(self, tag):
+        if isinstance(tag, int):
+            return (tag,) if tag in self.items else ()
+        return tuple(item for item, tags in self.tags.items() if tag in tags)
+
+
+    def bbox(self, tag):
+        items = self.find_withtag(tag)
+        if not items:
+            return None
+        pts = np.concatenate([np.array(self.items[item]).reshape(-1, 2) for item in items])
+        return (*pts.min(axis=0), *pts.max(axis=0))
+
+
+    def itemconfigure(self, item, option=None):
+        item = self.find_withtag(item)[0]
+        return (option, '', '', '', self.options[item].get(option, ''))
+
+
+    def bind(self, sequence, func, add=None):
+        pass
+
+
+    def addtag_withtag(self, newtag, tag_or_id):
+        for item in self.find_withtag(tag_or_id):
+            self.tags[item].add(newtag)
+
+
+    def winfo_exists(self):
+        return 1
+
+
+    def canvasx(self, x):
+        return x + self.scroll[0]
+
+
+    def canvasy(self, y):
+        return y + self.scroll[1]
+
+
+    def winfo_width(self):
+        return self.width
+
+
+    def winfo_height(self):
+        return self.height
+
+
+@pytest.fixture
+def canvas():
+    return FakeCanvas()
+
+
+class FakeWidget:
+    """A widget managed by `place`, the subset of `tk.Widget` used by the widget animators."""
+
+    def __init__(self, name='.widget', x=0, y=0, width=10, height=10, placed=True):
+        self.name = name
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        # Placing a widget maps it, as long as its parent is viewable
+        self.placed = placed
+        self.parent_viewable = True
+        self.destroyed = False
+        self.tk = FakeInterpreter()
+        self.tk.register(self)
+
+
+    def __str__(self):
+        return self.name
+
+
+    def _check(self):
+        if self.destroyed:
+            raise tk.TclError(f'bad window path name "{self.name}"')
+
+
+    def place_configure(self, *options):
+        self._check()
+        for key, value in zip(options[0::2], options[1::2]):
+            setattr(self, key[1:], value)
+        self.placed = True
+
+
+    def destroy(self):
+        self.destroyed = True
+
+
+    def update_idletasks(self):
+        pass
+
+
+    def winfo_exists(self):
+        return int(not self.destroyed)
+
+
+    def winfo_viewable(self):
+        self._check()
+        return int(self.placed and self.parent_viewable)
+
+
+    def winfo_x(self):
+        self._check()
+        return int(round(self.x))
+
+
+    def winfo_y(self):
+        self._check()
+        return int(round(self.y))
+
+
+    def winfo_width(self):
+        self._check()
+        return int(round(self.width))
+
+
+    def winfo_height(self):
+        self._check()
+        return int(round(self.height))
+
+
+@pytest.fixture
+def widget():
+    return FakeWidget()
+
+
+class FakeRoot:
+    """An event loop for `after` callbacks driven by a fake clock."""
+
+    def __init__(self):
+        self.now = 0.0
+        self._timers = []
+        self._canceled = set()
+        self._ids = 0
+
+
+    def clock(self):
+        return self.now
+
+
+    def _push(self, due, func, args):
+        self._ids += 1
+        heapq.heappush(self._timers, (due, self._ids, func, args))
+        return self._ids
+
+
+    def after(self, ms, func, *args):
+        return self._push(self.now + ms / 1000, func, args)
+
+
+    def after_idle(self, func, *args):
+        return self._push(self.now, func, args)
+
+
+    def after_cancel(self, timer_id):
+        self._canceled.add(timer_id)
+
+
+    def bind_all(self, sequence, func, add=None):
+        pass
+
+
+    def run(self, until=float('inf')):
+        """Run all callbacks due up to `until` and advance the clock."""
+        while self._timers and self._timers[0][0] <= until:
+            due, timer_id, func, args = heapq.heappop(self._timers)
+            if timer_id in self._canceled:
+                continue
+            self.now = max(self.now, due)
+            func(*args)
+        if until != float('inf'):
+            self.now = max(self.now, until)
+
+
+@pytest.fixture
+def root():
+    return FakeRoot()
+
+
+@pytest.fixture
+def director(root):
+    TweenDirector._instance = None
+    director = TweenDirector.get()
+    director.root = root
+    director.clock = root.clock
+    director.suspend_hidden = False
+    yield director
+    TweenDirector._instance = None
@@ -0,0 +1,52 @@
+import tkinter as tk
+
+import pytest
+
+from tktween.batch import CommandBatch
+
+
+@pytest.fixture
+def interp():
+    return tk.Tcl()
+
+
+def test_frame_is_evaluated_in_one_call(interp):
+    batch = CommandBatch()
+    batch.begin()
+    for word in ('a', 'b', 'c'):
+        batch.call(interp, 'lappend', '::log', word)
+    assert not interp.call('info', 'exists', '::log')
+
+    batch.flush()
+    assert interp.splitlist(interp.getvar('::log')) == ('a', 'b', 'c')
+    assert (batch.num_commands, batch.num_calls, batch.calls_saved) == (3, 1, 2)
+
+    # Outside of a frame commands run immediately
+    batch.call(interp, 'lappend', '::log', 'd')
+    assert interp.splitlist(interp.getvar('::log'))[-1] == 'd'
+
+
+def test_sync_keeps_buffering(interp):
+    batch = CommandBatch()
+    batch.begin()
+    batch.call(interp, 'set', '::x', 'a')
+    batch.sync()
+    assert interp.getvar('::x') == 'a'
+    assert batch.deferred
+
+    batch.call(interp, 'set', '::x', 'b')
+    assert interp.getvar('::x') == 'a'
+    batch.flush()
+    assert interp.getvar('::x') == 'b'
+
+
+def test_failing_command_does_not_abort_frame(interp):
+    batch = CommandBatch()
+    batch.begin()
+    batch.call(interp, 'lappend', '::log', 'a')
+    batch.call(interp, 'no_such_command')
+    batch.call(interp, 'lappend', '::log', 'b')
+    with pytest.raises(tk.TclError, match='no_such_command'):
+        batch.flush()
+    assert interp.splitlist(interp.getvar('::log')) == ('a', 'b')
+    assert not batch.deferred
@@ -0,0 +1,110 @@
+import numpy as np
+import pytest
+
+from tktween.canvas import FillColor, Morph, Rotate, Scale, Translate, subdivide
+from tktween.tween import CanvasTween, Tween
+
+
+@pytest.mark.parametrize('animator, retarget', [
+    (Translate(dx=100), {'dx': 300}),
+    (Scale(2.0), {'scale': 4.0}),
+    (Rotate(90), {'angle': 180}),
+])
+def test_revert_after_retarget(director, root, canvas, animator, retarget):
+    item = canvas.create(0, 0, 10, 10)
+    handle = CanvasTween(animator, duration=1.0).run(canvas, item)
+    root.run(until=0.5)
+    assert canvas.items[item] != [0, 0, 10, 10]
+
+    assert handle.retarget(**retarget) == 1
+    root.run(until=0.75)
+    handle.cancel(revert=True)
+    np.testing.assert_allclose(canvas.items[item], [0, 0, 10, 10], atol=1e-9)
+
+
+def test_revert_fill_after_retarget(director, root, canvas):
+    item = canvas.create(0, 0, 10, 10, fill='#FF0000')
+    handle = CanvasTween(FillColor(end_color='#0000FF'), duration=1.0).run(canvas, item)
+    root.run(until=0.5)
+    handle.retarget(end_color='#00FF00')
+    root.run(until=0.75)
+    handle.cancel(revert=True)
+    assert canvas.options[item]['fill'] == '#FF0000'
+
+
+def test_chained_fill_starts_from_previous_end(director, root, canvas):
+    director.fps = 20
+    item = canvas.create(0, 0, 10, 10, fill='#FF0000')
+    tween = CanvasTween(FillColor(end_color='#0000FF'), duration=0.5)
+    tween.then(FillColor(end_color='#FF0000'), duration=0.5).run(canvas, item)
+    root.run(until=0.76)
+    assert canvas.options[item]['fill'] == '#800080'
+
+
+def test_tween_on_group_moves_all_children(director, root, canvas):
+    a = canvas.create(0, 0, 10, 10)
+    b = canvas.create(30, 0, 40, 10)
+    group = director.get_scene(canvas).create_group(a, b)
+    CanvasTween(Rotate(180), duration=0.5).run(canvas, group)
+    root.run()
+    # Point reflection about the pivot (20, 5)
+    np.testing.assert_allclose(canvas.items[a], [40, 10, 30, 0], atol=1e-9)
+    np.testing.assert_allclose(canvas.items[b], [10, 10, 0, 0], atol=1e-9)
+
+
+def test_tag_tween_picks_up_newly_tagged_items(director, root, canvas):
+    a = canvas.create(0, 0, 10, 10, tags=('cells',), fill='#000000')
+    CanvasTween(FillColor(end_color='#FF0000'), duration=0.1).run(canvas, 'cells')
+    root.run()
+
+    b = canvas.create(20, 0, 30, 10, fill='#000000')
+    director.get_scene(canvas).get_object(b)
+    canvas.addtag_withtag('cells', b)
+    CanvasTween(FillColor(end_color='#FF0000'), duration=0.1).run(canvas, 'cells')
+    CanvasTween(Translate(dx=10), duration=0.1).run(canvas, 'cells')
+    root.run()
+    assert canvas.options[b]['fill'] == '#FF0000'
+    assert canvas.items[a] == [10, 0, 20, 10]
+
+    # The tracked item was moved along with the tag
+    CanvasTween(Translate(dx=10), duration=0.1).run(canvas, b)
+    root.run()
+    assert canvas.items[b] == [40, 0, 50, 10]
+
+
+def test_rotating_a_tag_is_rejected_by_every_entry_point(director, canvas):
+    canvas.create(0, 0, 10, 10, tags=('cells',))
+    tween = Tween(Rotate(90), duration=0.5)
+    with pytest.raises(ValueError):
+        CanvasTween(Rotate(90), duration=0.5).run(canvas, 'cells')
+    with pytest.raises(ValueError):
+        tween.run((canvas, 'cells'))
+    with pytest.raises(ValueError):
+        director.start_animation((canvas, 'cells'), tween, loop=False)
+    assert not director.handles_for((canvas, 'cells'))
+
+
+def test_subdivide_keeps_vertices():
+    square = np.array([[0, 0], [10, 0], [10, 10], [0, 10]], dtype=np.float64)
+    result = subdivide(square, 8, closed=True)
+    assert result.shape == (8, 2)
+    np.testing.assert_allclose(result[::2], square)
+    np.testing.assert_allclose(result[1::2], [[5, 0], [10, 5], [5, 10], [0, 5]])
+
+    line = subdivide(square[:2], 3, closed=False)
+    np.testing.assert_allclose(line, [[0, 0], [5, 0], [10, 0]])
+
+
+@pytest.mark.parametrize('kind', ['polygon', 'line'])
+def test_morph_reaches_target_shape(director, root, canvas, kind):
+    director.fps = 20
+    item = canvas.create(0, 0, 10, 0, 10, 10, type=kind)
+    square = [20, 20, 40, 20, 40, 40, 20, 40]
+    CanvasTween(Morph(square), duration=1.0).run(canvas, item)
+    root.run(until=0.51)
+    halfway = np.array(canvas.items[item])
+    root.run()
+
+    np.testing.assert_allclose(canvas.items[item], square, atol=1e-9)
+    start = np.reshape(subdivide(np.array([[0, 0], [10, 0], [10, 10]], dtype=np.float64), 4, kind == 'polygon'), -1)
+    np.testing.assert_allclose(halfway, 0.5 * (start + square), atol=1e-9)
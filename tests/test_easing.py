@@ -0,0 +1,61 @@
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+from tktween.easing import CubicBezier, Easing, get_easing, get_easing_table, get_inverse_easing
+
+
+def reference_bezier(curve: CubicBezier, x: float) -> float:
+    """Solve the curve with exact rational bisection."""
+    x1, y1, x2, y2 = (Fraction(v) for v in (curve.x1, curve.y1, curve.x2, curve.y2))
+    x = Fraction(x)
+    def bezier(t, p1, p2):
+        return ((3 * p1 * (1 - t) + 3 * p2 * t) * (1 - t) + t * t) * t
+    lo, hi = Fraction(0), Fraction(1)
+    for _ in range(64):
+        mid = (lo + hi) / 2
+        if bezier(mid, x1, x2) < x:
+            lo = mid
+        else:
+            hi = mid
+    return float(bezier((lo + hi) / 2, y1, y2))
+
+
+@pytest.mark.parametrize('curve', [
+    'ease', 'ease-in', 'ease-out', 'ease-in-out',
+    'cubic-bezier(0, 1, 1, 0)',
+    'cubic-bezier(1, 0, 0, 1)',
+    'cubic-bezier(0.68, -0.55, 0.27, 1.55)',
+    'cubic-bezier(0, 0, 1, 1)',
+])
+def test_cubic_bezier_accuracy(curve):
+    curve = get_easing(curve)
+    xs = np.linspace(0, 1, 129)
+    expected = np.array([reference_bezier(curve, x) for x in xs])
+    np.testing.assert_allclose([curve(x) for x in xs], expected, rtol=0, atol=1e-12)
+    np.testing.assert_allclose(curve.vectorized(xs), expected, rtol=0, atol=1e-12)
+
+
+def test_cubic_bezier_inverse():
+    curve = get_easing('ease-in')
+    inverse = get_inverse_easing(curve)
+    xs = np.linspace(0, 1, 65)
+    np.testing.assert_allclose(inverse.vectorized(xs), 1 - curve.vectorized(1 - xs), atol=1e-12)
+    assert get_inverse_easing('ease-in-out') is get_easing('ease-in-out')
+
+
+@pytest.mark.parametrize('easing', [*Easing, None, 'steps(4, jump-both)', lambda x: x ** 0.5])
+def test_vectorized_easing_matches_scalar(easing):
+    xs = np.linspace(0, 1, 257)
+    scalar = get_easing(easing)
+    np.testing.assert_allclose(get_easing(easing, vectorized=True)(xs), [scalar(x) for x in xs], rtol=0, atol=1e-12)
+
+
+def test_easing_table_samples_every_frame():
+    table = get_easing_table('ease-out', 30)
+    assert get_easing_table('ease-out', 30) is table
+    assert not table.flags.writeable
+    curve = get_easing('ease-out')
+    np.testing.assert_allclose(table, [curve(i / 30) for i in range(31)], rtol=0, atol=1e-12)
+    np.testing.assert_array_equal(get_easing_table('cubic_in', 0), [1.0])
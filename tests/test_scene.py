@@ -0,0 +1,223 @@
+import numpy as np
+import pytest
+
+from tktween.scene import Scene
+
+
+def transformed(coords, rotation=0.0, scale=1.0, shift=(0, 0), pivot=None):
+    """Reference transform of an item's coordinates about `pivot`, by default their bounding box center."""
+    pts = np.reshape(coords, (-1, 2)).astype(np.float64)
+    if pivot is None:
+        pivot = 0.5 * (pts.min(axis=0) + pts.max(axis=0))
+    a = np.radians(rotation)
+    R = np.array([[np.cos(a), -np.sin(a)], [np.sin(a), np.cos(a)]])
+    return ((scale * (pts - pivot)) @ R.T + pivot + shift).ravel()
+
+
+def test_update_transforms_every_dirty_object(canvas):
+    triangle = (0, 0, 10, 0, 10, 10)
+    square = (20, 20, 40, 20, 40, 40, 20, 40)
+    line = (50, 50, 60, 60)
+    items = [canvas.create(*coords) for coords in (triangle, square, line)]
+    scene = Scene(canvas)
+    a, b, c = (scene.get_object(item) for item in items)
+    a.rotation = 30.0
+    a.scale = 2.0
+    a.translation += (5, -5)
+    b.rotation = 90.0
+
+    scene.update()
+    assert not scene.dirty
+    np.testing.assert_allclose(canvas.items[items[0]], transformed(triangle, 30.0, 2.0, (5, -5)))
+    np.testing.assert_allclose(canvas.items[items[1]], transformed(square, 90.0))
+    assert canvas.items[items[2]] == list(map(float, line))
+
+
+def test_transform_dirty_only_visits_dirty_objects(canvas):
+    items = [canvas.create(10 * i, 0, 10 * i + 5, 5) for i in range(4)]
+    scene = Scene(canvas)
+    for item in items:
+        scene.get_object(item)
+    scene.get_object(items[2]).translation += (1, 2)
+
+    (element, coords), = scene.transform_dirty()
+    assert element == items[2]
+    np.testing.assert_allclose(coords, [21, 2, 26, 7])
+
+
+def test_commits_use_the_cheapest_command(canvas):
+    triangle = (0, 0, 10, 0, 10, 10)
+    item = canvas.create(*triangle)
+    scene = Scene(canvas)
+    obj = scene.get_object(item)
+
+    obj.translation += (3, 4)
+    scene.update()
+    obj.scale = 2.0
+    scene.update()
+    obj.rotation = 45.0
+    scene.update()
+    obj.translation += (1, 0)
+    obj.scale = 1.5
+    scene.update()
+    obj.translation += (0, 0)
+    scene.update()
+
+    assert [command[1] for command in canvas.tk.log] == ['move', 'scale', 'coords', 'coords']
+    np.testing.assert_allclose(canvas.items[item], transformed(triangle, 45.0, 1.5, (4, 4)))
+
+
+def test_cached_geometry_follows_transform_changes(canvas):
+    square = (0, 0, 20, 0, 20, 20, 0, 20)
+    item = canvas.create(*square)
+    scene = Scene(canvas)
+    obj = scene.get_object(item)
+    obj.rotation = 30.0
+    obj.scale = 0.5
+    scene.update()
+
+    # Translation-only frames reuse the cached rotated and scaled points
+    for i in range(1, 4):
+        obj.translation += (2, 1)
+        scene.update()
+        expected = transformed(square, 30.0, 0.5, (2 * i, i))
+        np.testing.assert_allclose(canvas.items[item], expected)
+        np.testing.assert_allclose(obj.get_transformed().ravel(), expected)
+
+    obj.rotation = 60.0
+    obj.translation += (1, 1)
+    scene.update()
+    np.testing.assert_allclose(canvas.items[item], transformed(square, 60.0, 0.5, (7, 4)))
+
+    # Points edited in place are picked up with `invalidate_points`
+    obj.pts[:] *= 2
+    obj.invalidate_points()
+    scene.update()
+    np.testing.assert_allclose(canvas.items[item], transformed(square, 60.0, 1.0, (7, 4)))
+
+
+def test_group_transforms_children_about_its_pivot(canvas):
+    a_coords, b_coords = (0, 0, 10, 0, 10, 10), (30, 0, 40, 0, 40, 10)
+    a, b = canvas.create(*a_coords), canvas.create(*b_coords)
+    scene = Scene(canvas)
+    group = scene.create_group(a, b)
+    np.testing.assert_allclose(group.translation, (20, 5))
+
+    group.rotation = 90.0
+    group.scale = 2.0
+    scene.update()
+    np.testing.assert_allclose(canvas.items[a], transformed(a_coords, 90.0, 2.0, pivot=(20, 5)), atol=1e-9)
+    np.testing.assert_allclose(canvas.items[b], transformed(b_coords, 90.0, 2.0, pivot=(20, 5)), atol=1e-9)
+
+    # Moving the group only moves its children
+    canvas.tk.log.clear()
+    group.translation += (5, 0)
+    scene.update()
+    assert sorted(command[1:3] for command in canvas.tk.log) == [('move', a), ('move', b)]
+
+
+def test_nested_groups_compose_transforms(canvas):
+    coords = (10, 0, 20, 0, 20, 10)
+    item = canvas.create(*coords)
+    scene = Scene(canvas)
+    inner = scene.create_group(item, pivot=(0, 0))
+    outer = scene.create_group(inner, pivot=(100, 100))
+    inner.rotation = 90.0
+    outer.translation += (0, 50)
+    scene.update()
+
+    expected = transformed(coords, 90.0, pivot=(0, 0)) + np.tile((0, 50), 3)
+    np.testing.assert_allclose(canvas.items[item], expected, atol=1e-9)
+    rotation, scale, _ = scene.get_object(item).world_transform
+    assert (rotation, scale) == (90.0, 1.0)
+
+    with pytest.raises(ValueError):
+        inner.add(outer)
+
+
+def test_sweep_keeps_scaled_and_rotated_objects(canvas):
+    scaled = canvas.create(0, 0, 10, 10)
+    rotated = canvas.create(20, 0, 30, 10)
+    idle = canvas.create(40, 0, 50, 10)
+    scene = Scene(canvas)
+    scene.get_object(scaled).scale = 2.0
+    scene.get_object(rotated).rotation = 45.0
+    scene.get_object(idle).translation += (5, 0)
+    scene.update()
+
+    scene.max_objects = 0
+    assert scene.sweep() == 1
+    assert idle not in scene.objects
+    assert scene.get_object(scaled).scale == 2.0
+    assert scene.get_object(rotated).rotation == 45.0
+    np.testing.assert_allclose(canvas.items[idle], [45, 0, 55, 10])
+
+
+def test_culled_objects_are_written_once_visible(canvas):
+    visible = canvas.create(0, 0, 10, 10)
+    hidden = canvas.create(300, 0, 310, 10)
+    scene = Scene(canvas, culling=True)
+    for item in (visible, hidden):
+        scene.get_object(item).translation += (5, 0)
+    scene.update()
+    assert canvas.items[visible] == [5, 0, 15, 10]
+    assert canvas.items[hidden] == [300, 0, 310, 10]
+
+    canvas.scroll = (250, 0)
+    scene.update()
+    assert canvas.items[hidden] == [305, 0, 315, 10]
+
+
+def test_sweep_keeps_culled_objects(canvas):
+    item = canvas.create(500, 0, 510, 10)
+    scene = Scene(canvas, culling=True)
+    scene.get_object(item).translation += (100, 0)
+    scene.update()
+    assert canvas.items[item] == [500, 0, 510, 10]
+
+    scene.max_objects = 0
+    assert scene.sweep() == 0
+    scene.flush_culled()
+    np.testing.assert_allclose(canvas.items[item], [600, 0, 610, 10])
+
+
+def test_tag_configure_after_member_configure(canvas):
+    a = canvas.create(0, 0, 10, 10, tags=('cells', 'row'))
+    b = canvas.create(20, 0, 30, 10, tags=('cells', 'row'))
+    scene = Scene(canvas)
+    cells = scene.get_object('cells')
+    row = scene.get_object('row')
+
+    cells.configure(fill='#FF0000')
+    scene.get_object(a).configure(fill='#0000FF')
+    cells.configure(fill='#FF0000')
+    assert canvas.options[a]['fill'] == '#FF0000'
+
+    row.configure(fill='#00FF00')
+    cells.configure(fill='#FF0000')
+    assert canvas.options[b]['fill'] == '#FF0000'
+
+
+def test_sweep_refreshes_tag_members(canvas):
+    a = canvas.create(0, 0, 10, 10, tags=('cells',))
+    scene = Scene(canvas)
+    cells = scene.get_object('cells')
+    b = canvas.create(20, 0, 30, 10)
+    canvas.addtag_withtag('cells', b)
+    assert cells.members == (a,)
+
+    scene.sweep()
+    assert cells.members == (a, b)
+
+
+def test_get_config_sees_buffered_writes(canvas):
+    item = canvas.create(0, 0, 10, 10, fill='#000000')
+    scene = Scene(canvas)
+    obj = scene.get_object(item)
+
+    scene.commands.begin()
+    obj.configure(fill='#FF0000')
+    assert obj.get_config('fill') == '#FF0000'
+    obj.configure(fill='#000000')
+    scene.commands.flush()
+    assert canvas.options[item]['fill'] == '#000000'
@@ -0,0 +1,214 @@
+import collections
+
+import pytest
+
+from conftest import FakeWidget
+from tktween import widgets
+from tktween.canvas import Translate
+from tktween.tween import CanvasTween, Priority, Tween
+
+
+def test_compiled_timeline_samples_active_and_skipped_blocks(director):
+    tween = Tween(Translate(dx=1), duration=1.0).then(Translate(dx=2), duration=0.5)
+    tween.parallel(Translate(dx=3), duration=2.0)
+    timeline = tween.compile(30)
+    assert tween.compile(30) is timeline
+    assert (timeline.offsets, timeline.durations, timeline.num_frames) == ((0, 30, 0), (30, 15, 60), 60)
+
+    assert timeline.active(10) == (0, 2)
+    assert timeline.active(30) == (0, 1, 2)
+    assert timeline.active(50) == (2,)
+    # Blocks that ended between two sampled frames settle on their last frame
+    assert sorted(timeline.sample(50, 20)) == [(0, 30), (1, 15), (2, 50)]
+    # Played backwards, skipped blocks settle on their first frame
+    assert sorted(timeline.sample(5, 40, reversed=True)) == [(0, 5), (1, 0), (2, 5)]
+
+    tween.then(Translate(dx=4), duration=1.0)
+    assert tween.compile(30) is not timeline
+
+
+def test_sweep_keeps_targets_of_running_tweens(director, root, canvas):
+    director.max_scene_objects = 1
+    items = [canvas.create(10 * i, 0, 10 * i + 5, 5) for i in range(3)]
+    scene = director.get_scene(canvas)
+    for item in items:
+        scene.get_object(item)
+    CanvasTween(Translate(dx=10), duration=1.0).run(canvas, items[1])
+    root.run(until=0.5)
+
+    director.sweep_scenes()
+    assert list(scene.objects) == [items[1]]
+    assert director.memory_stats()['objects'] == 1
+
+    root.run()
+    assert director.memory_stats()['active_tweens'] == 0
+    assert canvas.items[items[1]] == [20, 0, 25, 5]
+
+
+class SlowOnce(widgets.Translate):
+    """Blocks the event loop for 100 ms on the step at progress 0.5."""
+
+    def __init__(self, root, **kwargs):
+        super().__init__(**kwargs)
+        self.root = root
+
+    def step(self, widget, t, animation_data):
+        if t == 0.5:
+            self.root.now += 0.1
+        super().step(widget, t, animation_data)
+
+
+def test_frames_are_paced_on_the_clock(director, root, widget):
+    delays = []
+    after = root.after
+    def record(ms, func, *args):
+        delays.append(ms)
+        return after(ms, func, *args)
+    root.after = record
+
+    Tween(SlowOnce(root, x=90), duration=1.0).run(widget)
+    root.run()
+
+    stats = director.frame_stats()
+    assert stats['late_frames'] == 1
+    assert stats['dropped_frames'] == 2
+    assert stats['max_lateness'] == pytest.approx(0.1 - 1 / 30 + 0.001)
+    # Frames stay on their absolute due times, so the tween ends on time
+    assert root.now == pytest.approx(1.0)
+    assert widget.x == 90
+    # The frame after the slow one is overdue, but still scheduled with a delay
+    assert min(delays) == 1
+
+
+def test_governor_lowers_and_restores_the_frame_rate(director):
+    director.fps = 60
+    director.adaptive_fps = True
+    director.num_frames = 2
+    # 20 ms per frame exceeds 80% of a 60 fps frame, a level is kept for half a second
+    changes = [director._govern(0.02) for _ in range(30)]
+    assert changes == [False] * 29 + [True]
+    assert director.effective_fps == 30
+
+    for _ in range(100):
+        director._govern(0.001)
+    assert director.effective_fps == 60
+
+    director.adaptive_fps = False
+    assert not any(director._govern(0.1) for _ in range(100))
+    assert director.effective_fps == 60
+
+
+def test_frame_budget_skips_lower_priorities(director, root, widget):
+    director.fps = 20
+    director.frame_budget = -1.0
+    other = FakeWidget('.other')
+    Tween(widgets.Translate(x=100), duration=1.0).run(widget, priority=Priority.HIGH)
+    Tween(widgets.Translate(x=100), duration=1.0).run(other)
+    root.run(until=0.51)
+    assert widget.x == pytest.approx(50)
+    assert other.x == 0
+    assert director.skipped_steps == 11
+
+    # Skipped tweens catch up to the correct time once they are stepped again
+    director.frame_budget = None
+    root.run(until=0.76)
+    assert (widget.x, other.x) == (pytest.approx(75), pytest.approx(75))
+
+
+def test_tweens_are_stepped_at_their_own_rate(director, root, widget):
+    other = FakeWidget('.other')
+    other.tk = widget.tk
+    widget.tk.register(other)
+    Tween(widgets.Translate(x=100), duration=1.0).run(widget, fps=10)
+    Tween(widgets.Translate(x=100), duration=0.5).run(other)
+    root.run(until=0.6)
+    # The heartbeat slows down once the fast tween finished
+    assert director._heartbeat_fps == 10
+
+    root.run()
+    steps = collections.Counter(command[2] for command in widget.tk.log)
+    assert steps == {'.widget': 11, '.other': 16}
+    assert (widget.x, other.x) == (100, 100)
+
+
+def test_handles_are_indexed_by_target_and_tween(director, root):
+    first, second = FakeWidget('.first'), FakeWidget('.second')
+    move = Tween(widgets.Translate(x=100), duration=1.0)
+    grow = Tween(widgets.Resize(width=50), duration=1.0)
+    a = move.run(first)
+    b = move.run(second)
+    c = grow.run(first)
+    assert set(director.handles_for(first)) == {a, c}
+    assert set(director.handles_of(move)) == {a, b}
+    assert director.is_active(move, second) and not director.is_active(grow, second)
+
+    assert director.cancel_all(first) == 2
+    assert director.handles_for(first) == []
+    assert director.handles_of(move) == [b]
+    assert director.handles_of(grow) == []
+    root.run()
+    assert director.handles_for(second) == [] and not director.is_active(move, second)
+
+
+def test_override_mutes_only_the_conflicting_animators(director, root, widget):
+    old = Tween(widgets.Translate(x=100), duration=1.0).parallel(widgets.Resize(width=50), duration=1.0).run(widget)
+    root.run(until=0.5)
+    halfway = widget.x
+    new = Tween(widgets.Translate(x=-100), duration=1.0).run(widget)
+    assert director.handles_for(widget) == [old, new]
+    root.run()
+    # The old tween no longer moves the widget but still resizes it
+    assert widget.x == pytest.approx(halfway - 100, abs=1)
+    assert widget.width == 50
+
+
+def test_override_cancels_fully_replaced_tweens(director, root, widget):
+    old = Tween(widgets.Translate(x=100), duration=1.0).run(widget)
+    root.run(until=0.5)
+    new = Tween(widgets.Translate(y=100), duration=1.0).run(widget)
+    assert director.handles_for(widget) == [new]
+    assert not director.is_active(old.tween, widget)
+
+
+def test_queued_tween_waits_for_the_owner(director, root, widget):
+    Tween(widgets.Translate(x=100), duration=0.5).run(widget)
+    Tween(widgets.Translate(x=100), duration=0.5).run(widget, conflict='queue')
+    root.run(until=0.55)
+    assert widget.x == 100
+    root.run()
+    assert widget.x == 200
+
+
+def test_parallel_tweens_share_properties(director, root, widget):
+    Tween(widgets.Translate(x=100), duration=0.5).run(widget)
+    Tween(widgets.Resize(width=50), duration=0.5).run(widget, conflict='parallel')
+    Tween(widgets.Translate(y=100), duration=0.5).run(widget, conflict='parallel')
+    assert len(director.handles_for(widget)) == 3
+    with pytest.raises(ValueError):
+        Tween(widgets.Translate(x=1), duration=0.5).run(widget, conflict='blend')
+
+
+def test_callbacks_run_after_the_frame_within_the_budget(director, root, widget, monkeypatch):
+    slices = []
+    drain = director._drain_callbacks
+    monkeypatch.setattr(director, '_drain_callbacks', lambda: (slices.append(root.now), drain()))
+    director.callback_budget = 0.005
+    director.profile_callbacks = True
+    calls = []
+
+    def callback(handle):
+        assert widget.x == 100 and not director.is_active(handle.tween, widget)
+        calls.append(handle)
+        root.now += 0.004
+
+    tween = Tween(widgets.Translate(x=100), duration=0.5)
+    for _ in range(5):
+        tween.add_callback(callback)
+    handle = tween.run(widget)
+    root.run()
+    assert calls == [handle] * 5
+    assert len(slices) == 3
+    stats = director.callback_stats()[callback.__qualname__]
+    assert stats['calls'] == 5 and stats['max'] == pytest.approx(0.004)
+    director.reset_callback_stats()
+    assert director.callback_stats() == {}
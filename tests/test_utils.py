@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from tktween.utils import ColorInterpolator, lerp_colors, oklab_to_oklch, rgb_array_to_hex, srgb_to_oklab
+
+
+@pytest.mark.parametrize('mode', ['oklab', 'oklch'])
+@pytest.mark.parametrize('clockwise', [None, True, False])
+def test_color_interpolator_scalar_matches_vectorized(mode, clockwise):
+    interpolator = ColorInterpolator('#FF8000', '#2040C0', mode=mode, clockwise=clockwise)
+    t = np.linspace(-0.2, 1.2, 57)
+
+    np.testing.assert_allclose([interpolator(x) for x in t], interpolator.evaluate(t), atol=1e-12)
+    assert [interpolator.hex(x) for x in t] == interpolator.hex_many(t)
+
+
+def test_color_interpolator_oklch_from_gray():
+    # The gray endpoint takes the hue of red instead of sweeping from hue 0
+    interpolator = ColorInterpolator('#808080', '#FF0000', mode='oklch')
+    hues = oklab_to_oklch(srgb_to_oklab(np.array([interpolator(0.5), (1.0, 0.0, 0.0)])))[:, 2]
+    assert hues[0] == pytest.approx(hues[1], abs=1e-6)
+
+
+@pytest.mark.parametrize('mode', ['rgb', 'hsv', 'oklab', 'oklch'])
+def test_color_interpolator_retarget_continues_from_current_color(mode):
+    interpolator = ColorInterpolator('#FF0000', '#0000FF', mode=mode, clockwise=True)
+    retargeted = interpolator.retarget(0.25, '#00FF00')
+    assert (retargeted.mode, retargeted.clockwise) == (mode, True)
+    np.testing.assert_allclose(retargeted(0.0), interpolator(0.25), atol=1e-9)
+    np.testing.assert_allclose(retargeted(1.0), (0.0, 1.0, 0.0), atol=1e-9)
+
+    # Colors overshot by an easing are clamped to the valid range
+    overshot = ColorInterpolator('#000000', '#FFFFFF', mode=mode).retarget(1.5, '#000000')
+    np.testing.assert_allclose(overshot(0.0), (1.0, 1.0, 1.0), atol=1e-9)
+
+
+@pytest.mark.parametrize('mode', ['rgb', 'hsv', 'oklab', 'oklch'])
+@pytest.mark.parametrize('clockwise', [None, True, False])
+def test_lerp_colors_matches_pairwise_interpolation(mode, clockwise):
+    rng = np.random.default_rng(0)
+    c1, c2 = rng.random((2, 64, 3))
+    c1[0] = c2[1] = 0.5  # Grays have no hue
+    t = rng.random(64)
+    expected = [
+        ColorInterpolator(tuple(a), tuple(b), mode=mode, clockwise=clockwise)(x)
+        for a, b, x in zip(c1.tolist(), c2.tolist(), t.tolist())
+    ]
+    colors = lerp_colors(c1, c2, t, mode=mode, clockwise=clockwise)
+    np.testing.assert_allclose(colors, expected, atol=1e-9)
+    assert rgb_array_to_hex(colors) == [ColorInterpolator(c, c).hex(0.0) for c in map(tuple, colors.tolist())]
@@ -0,0 +1,74 @@
+import tkinter as tk
+import types
+
+import pytest
+
+from conftest import FakeWidget
+from tktween.tween import Tween
+from tktween.widgets import Translate
+
+
+@pytest.mark.parametrize('first, second, expected', [
+    (Translate(x=100), Translate(y=50), (100, 50)),
+    (Translate(x=100), Translate(x=100), (200, 0)),
+])
+def test_chained_translate_starts_from_previous_end(director, root, widget, first, second, expected):
+    Tween(first, duration=0.5).then(second, duration=0.5).run(widget)
+    root.run()
+    assert (widget.x, widget.y) == expected
+
+
+def test_destroyed_widget_does_not_stall_other_tweens(director, root, widget):
+    # Widgets of one application share an interpreter and thus a batched call
+    other = FakeWidget('.other')
+    other.tk = widget.tk
+    widget.tk.register(other)
+    dead = Tween(Translate(x=100), duration=1.0).run(widget)
+    Tween(Translate(x=100), duration=1.0).run(other)
+    root.run(until=0.5)
+
+    widget.destroy()
+    root.run()
+    assert other.x == 100
+    assert not dead.cancel()
+    assert director._after_id is None
+
+
+class FailingOnce(Translate):
+    def step(self, widget, t, animation_data):
+        if not getattr(self, 'failed', False):
+            self.failed = True
+            raise RuntimeError('step failed')
+        super().step(widget, t, animation_data)
+
+
+def test_heartbeat_continues_after_error(director, root, widget):
+    Tween(FailingOnce(x=100), duration=0.5).run(widget)
+    with pytest.raises(RuntimeError):
+        root.run()
+    root.run()
+    assert widget.x == 100
+
+
+def test_tween_may_map_its_own_target(director, root):
+    director.suspend_hidden = True
+    widget = FakeWidget(placed=False)
+    Tween(Translate(x=100), duration=0.5).run(widget)
+    root.run()
+    assert widget.x == 100
+
+
+def test_tween_on_hidden_target_is_suspended(director, root, widget):
+    director.suspend_hidden = True
+    widget.parent_viewable = False
+    handle = Tween(Translate(x=100), duration=0.5).run(widget)
+    root.run()
+    assert handle.suspended
+    assert director._after_id is None
+    assert widget.x < 100
+
+    # Becoming visible resumes the tween where it was suspended
+    widget.parent_viewable = True
+    director._on_visibility_event(types.SimpleNamespace(type=tk.EventType.Map, widget=widget))
+    root.run()
+    assert widget.x == 100
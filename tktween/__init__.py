@@ -1,6 +1,7 @@
 from . import canvas
 from .base import TweenAnimator
-from .easing import Easing
-from .tween import CanvasTween, Tween, TweenDirector, TweenHandle
+from .batch import CommandBatch
+from .easing import CubicBezier, Easing, Steps
+from .tween import CanvasTween, Priority, Tween, TweenDirector, TweenHandle
 from .widgets import *
 from .functional import *
\ No newline at end of file
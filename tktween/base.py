@@ -3,12 +3,17 @@ from __future__ import annotations
 import abc
 import tkinter as tk
 import uuid
-from typing import Any, Optional, TypeAlias
+from typing import Any, Literal, Optional, TypeAlias
 
 ObjectId: TypeAlias = int
-TweenAble: TypeAlias = tk.Widget | tuple[tk.Canvas, ObjectId] 
+TweenAble: TypeAlias = tk.Widget | tuple[tk.Canvas, ObjectId | str]
+ConflictPolicy: TypeAlias = Literal['override', 'parallel', 'queue']
 
 class TweenAnimator(abc.ABC):
+    # Names of the target properties written by the animator, used to detect
+    # tweens fighting over the same property of a target
+    properties: tuple[str, ...] = ()
+
     def __init__(self):
         self.started = False
         self.animation_data: dict[uuid.UUID, Any] = dict()
@@ -38,6 +43,45 @@ class TweenAnimator(abc.ABC):
         raise NotImplementedError(msg)
 
 
+    def retarget(self, animation_data:Any, t:float, **kwargs) -> Any:
+        """Change the end values of a running animation.
+
+        The returned animation data must continue from the animation's state at
+        progress `t` and reach the new end values at progress 1. Animators that do
+        not support retargeting ignore the request.
+
+        Args:
+            animation_data (Any): Data of the running animation, see `start`.
+            t (float): The (eased) progress of the last step.
+            **kwargs: New end values, named like the animator's constructor arguments.
+                Unknown arguments are ignored.
+
+        Returns:
+            Any: The new animation data.
+        """
+        return animation_data
+
+
+    def restore(self, widget:TweenAble, animation_data:Any) -> None:
+        """Return the target to its state before the animation started.
+
+        Animators that support `retarget` must restore the origin kept in their
+        animation data, as progress 0 of a retargeted animation is no longer the
+        origin. Defaults to stepping at progress 0.
+
+        Args:
+            widget (TweenAble): The animated widget.
+            animation_data (Any): Data of the animation, see `start`.
+        """
+        self.step(widget, 0.0, animation_data)
+
+
+    def revert(self, widget:TweenAble, animation_id:uuid.UUID) -> None:
+        """Restore the target of a started animation, see `restore`."""
+        if animation_id in self.animation_data:
+            self.restore(widget, self.animation_data[animation_id])
+
+
     def finalize(self, widget:TweenAble, animation_id:uuid.UUID) -> None:
         self.animation_data.pop(animation_id, None)
 
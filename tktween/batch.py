@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import tkinter as tk
+from typing import Any
+
+__all__ = [
+    'CommandBatch'
+]
+
+
+class CommandBatch:
+    """
+    Collects Tcl commands issued during an animation frame.
+
+    While a frame is open (see `begin`), commands are buffered per interpreter
+    and evaluated with a single interpreter call in `flush`. Outside of a frame
+    commands are executed immediately, so writes issued from user code are
+    never delayed. Code reading Tk state during a frame must call `sync`
+    first, buffered writes are not visible to Tk before.
+
+    A failing buffered command does not keep the other commands of the frame
+    from being evaluated. The errors of all failed commands are raised together
+    once the whole batch was evaluated.
+
+    Attributes:
+        num_commands (int): Number of commands issued through the batch.
+        num_calls (int): Number of Python to Tcl calls actually made.
+    """
+
+    def __init__(self) -> None:
+        self._pending: dict[Any, list[tuple]] = {}
+        self._deferred = False
+        self.num_commands = 0
+        self.num_calls = 0
+
+
+    @property
+    def deferred(self) -> bool:
+        """True while a frame is open and commands are being buffered."""
+        return self._deferred
+
+
+    @property
+    def calls_saved(self) -> int:
+        """Number of interpreter calls avoided by batching."""
+        return self.num_commands - self.num_calls
+
+
+    def call(self, widget: Any, *args) -> None:
+        """
+        Issue a Tcl command.
+
+        Args:
+            widget (Any): Any object with a `tk` attribute (widgets, styles), used to select the interpreter.
+            *args: The command words, e.g. `(str(canvas), 'coords', item, *coords)`.
+        """
+        self.num_commands += 1
+        if self._deferred:
+            self._pending.setdefault(widget.tk, []).append(args)
+        else:
+            self.num_calls += 1
+            widget.tk.call(*args)
+
+
+    def begin(self) -> None:
+        """Start buffering commands until the next `flush`."""
+        self._deferred = True
+
+
+    def sync(self) -> None:
+        """
+        Evaluate the commands buffered so far and keep buffering, e.g. before reading Tk state mid-frame.
+
+        Raises:
+            tk.TclError: If any of the commands failed.
+        """
+        if self._pending:
+            self._evaluate()
+
+
+    def flush(self) -> None:
+        """
+        Evaluate all buffered commands, one interpreter call per interpreter, and stop buffering.
+
+        Raises:
+            tk.TclError: If any of the commands failed.
+        """
+        self._deferred = False
+        self._evaluate()
+
+
+    def _evaluate(self) -> None:
+        pending, self._pending = self._pending, {}
+        errors = []
+        for interp, commands in pending.items():
+            self.num_calls += 1
+            if len(commands) == 1:
+                try:
+                    interp.call(*commands[0])
+                except tk.TclError as error:
+                    errors.append(str(error))
+            else:
+                # Tuples are converted to proper Tcl lists, so no quoting is needed.
+                # Each command is caught on its own and the loop collects the error messages
+                result = interp.call(
+                    'lmap', '::tktween_cmd', tuple(commands),
+                    'if {[catch {{*}$::tktween_cmd} ::tktween_error]} {set ::tktween_error} else continue'
+                )
+                errors.extend(interp.splitlist(result))
+        if errors:
+            raise tk.TclError('; '.join(errors))
+
+
+    def reset_stats(self) -> None:
+        """Reset the command and call counters."""
+        self.num_commands = 0
+        self.num_calls = 0
@@ -2,20 +2,21 @@ from __future__ import annotations
 
 import tkinter as tk
 import uuid
-from typing import Any, Literal, Optional
+from typing import Any, Optional
 
 import numpy as np
 
 from .base import ObjectId, TweenAnimator
 from .scene import SceneObject
 from .tween import TweenDirector
-from .utils import Color, lerp, lerp_color, rgb_to_hex
+from .utils import Color, ColorInterpolator, ColorMode, lerp, remap_progress
 
 __all__ = [
     'Scale',
     'Rotate',
     'Translate',
-    'FillColor'
+    'FillColor',
+    'Morph'
 ]
 
 class CanvasTweenAnimator(TweenAnimator):    
@@ -25,11 +26,18 @@ class CanvasTweenAnimator(TweenAnimator):
     def step(self, obj: SceneObject, t: float, animation_data: Any) -> None:
         pass        
 
-    def __call__(self, widget:tuple[tk.Canvas, ObjectId], t:float, animation_id:uuid.UUID) -> None:
+    def get_target(self, widget:tuple[tk.Canvas, ObjectId]) -> SceneObject:
         canvas, element = widget
-        # Get the animated object
         scene = TweenDirector.get().get_scene(canvas)
-        target = scene.get_object(element)
+        return scene.get_object(element)
+
+    def revert(self, widget:tuple[tk.Canvas, ObjectId], animation_id:uuid.UUID) -> None:
+        if animation_id in self.animation_data:
+            self.restore(self.get_target(widget), self.animation_data[animation_id])
+
+    def __call__(self, widget:tuple[tk.Canvas, ObjectId], t:float, animation_id:uuid.UUID) -> None:
+        # Get the animated object
+        target = self.get_target(widget)
 
         if animation_id not in self.animation_data:
             self.animation_data[animation_id] = self.start(target)
@@ -40,6 +48,8 @@ class CanvasTweenAnimator(TweenAnimator):
 
 
 class Translate(CanvasTweenAnimator):
+    properties = ('translation',)
+
     def __init__(
         self,
         dx:int = 0,
@@ -49,54 +59,92 @@ class Translate(CanvasTweenAnimator):
         self.dx = dx
         self.dy = dy
 
-    def start(self, obj:SceneObject) -> tuple[float, float]:
-        return obj.translation.copy()
+    def start(self, obj:SceneObject) -> tuple[np.ndarray, np.ndarray, np.ndarray, float]:
+        p0 = obj.translation.copy()
+        # Origin, segment start, segment end and the progress the segment started at
+        return p0, p0, p0 + (self.dx, self.dy), 0.0
+
+    def step(self, obj: SceneObject, t: float, animation_data: tuple) -> None:
+        _, p1, p2, t0 = animation_data
+        obj.translation = lerp(p1, p2, remap_progress(t, t0))
+
+    def restore(self, obj: SceneObject, animation_data: tuple) -> None:
+        obj.translation = animation_data[0]
 
-    def step(self, obj: SceneObject, t: float, animation_data: tuple[float, float]) -> None:
-        x0, y0 = animation_data
-        x = lerp(x0, x0 + self.dx, t)
-        y = lerp(y0, y0 + self.dy, t)
-        obj.translation = np.array([x, y])
+    def retarget(self, animation_data: tuple, t: float, dx: Optional[float] = None, dy: Optional[float] = None, **kwargs) -> tuple:
+        if dx is None and dy is None:
+            return animation_data
+        p0, p1, p2, t0 = animation_data
+        end = p0 + (dx if dx is not None else p2[0] - p0[0], dy if dy is not None else p2[1] - p0[1])
+        return p0, lerp(p1, p2, remap_progress(t, t0)), end, t
 
     def inverse(self) -> TweenAnimator:
         return Translate(-self.dx, -self.dy)
 
 
 class Rotate(CanvasTweenAnimator):
+    properties = ('rotation',)
+
     def __init__(self, angle:float) -> None:
         super().__init__()
         self.angle=angle
 
-    def start(self, obj:SceneObject) -> float:
-        return obj.rotation
+    def start(self, obj:SceneObject) -> tuple[float, float, float, float]:
+        a0 = obj.rotation
+        return a0, a0, a0 + self.angle, 0.0
     
-    def step(self, obj: SceneObject, t: float, a0: float) -> None:
-        obj.rotation = lerp(a0, a0+self.angle, t)
+    def step(self, obj: SceneObject, t: float, animation_data: tuple[float, float, float, float]) -> None:
+        _, a1, a2, t0 = animation_data
+        obj.rotation = lerp(a1, a2, remap_progress(t, t0))
+
+    def restore(self, obj: SceneObject, animation_data: tuple) -> None:
+        obj.rotation = animation_data[0]
+
+    def retarget(self, animation_data: tuple, t: float, angle: Optional[float] = None, **kwargs) -> tuple:
+        if angle is None:
+            return animation_data
+        a0, a1, a2, t0 = animation_data
+        return a0, lerp(a1, a2, remap_progress(t, t0)), a0 + angle, t
 
     def inverse(self) -> TweenAnimator:
         return Rotate(-self.angle)
 
 class Scale(CanvasTweenAnimator):
+    properties = ('scale',)
+
     def __init__(self, scale:float) -> None:
         super().__init__()
         self.scale = scale
 
-    def start(self, obj:SceneObject) -> float:
-        return obj.scale
+    def start(self, obj:SceneObject) -> tuple[float, float, float, float]:
+        s0 = obj.scale
+        return s0, s0, self.scale, 0.0
     
-    def step(self, obj: SceneObject, t:float, s0: float) -> None:
-        obj.scale = lerp(s0, self.scale, t)
+    def step(self, obj: SceneObject, t:float, animation_data: tuple[float, float, float, float]) -> None:
+        _, s1, s2, t0 = animation_data
+        obj.scale = lerp(s1, s2, remap_progress(t, t0))
+
+    def restore(self, obj: SceneObject, animation_data: tuple) -> None:
+        obj.scale = animation_data[0]
+
+    def retarget(self, animation_data: tuple, t: float, scale: Optional[float] = None, **kwargs) -> tuple:
+        if scale is None:
+            return animation_data
+        s0, s1, s2, t0 = animation_data
+        return s0, lerp(s1, s2, remap_progress(t, t0)), scale, t
 
     def inverse(self) -> TweenAnimator:
         return Scale(1.0 / self.scale)
 
 
 class FillColor(CanvasTweenAnimator):
+    properties = ('fill',)
+
     def __init__(
         self, 
         start_color:Optional[Color]=None,
         end_color:Optional[Color]=None,
-        mode:Literal['rgb', 'hsv']='rgb',
+        mode:ColorMode='rgb',
         clockwise:Optional[bool]=None
     ) -> None:
         super().__init__()
@@ -105,18 +153,27 @@ class FillColor(CanvasTweenAnimator):
         self.mode = mode
         self.clockwise = clockwise
 
-    def start(self, obj: SceneObject) -> tuple[Color, Color]:
+    def start(self, obj: SceneObject) -> tuple[str, ColorInterpolator, float]:
         current_color = obj.get_config("fill")
 
         c1 = self.start_color or current_color
         c2 = self.end_color or current_color
 
-        return c1, c2
+        interpolator = ColorInterpolator(c1, c2, mode=self.mode, clockwise=self.clockwise)
+        return interpolator.hex(0.0), interpolator, 0.0
     
-    def step(self, obj: SceneObject, t: float, animation_data: tuple[Color, Color]) -> None:
-        c1, c2 = animation_data
-        c = lerp_color(c1, c2, t, mode=self.mode, clockwise=self.clockwise)
-        obj.configure(fill=rgb_to_hex(c))
+    def step(self, obj: SceneObject, t: float, animation_data: tuple[str, ColorInterpolator, float]) -> None:
+        _, interpolator, t0 = animation_data
+        obj.configure(fill=interpolator.hex(remap_progress(t, t0)))
+
+    def restore(self, obj: SceneObject, animation_data: tuple) -> None:
+        obj.configure(fill=animation_data[0])
+
+    def retarget(self, animation_data: tuple, t: float, end_color: Optional[Color] = None, **kwargs) -> tuple:
+        if end_color is None:
+            return animation_data
+        origin, interpolator, t0 = animation_data
+        return origin, interpolator.retarget(remap_progress(t, t0), end_color), t
 
     def inverse(self) -> TweenAnimator:
         return FillColor(
@@ -125,4 +182,93 @@ class FillColor(CanvasTweenAnimator):
             mode=self.mode,
             clockwise=not self.clockwise
         )
-        
\ No newline at end of file
+        
+
+def subdivide(pts: np.ndarray, count: int, closed: bool) -> np.ndarray:
+    """
+    Insert points along the edges of a polyline until it has `count` vertices.
+
+    Extra points are distributed over the edges proportionally to their length,
+    so all original vertices (and thus the shape) are preserved.
+
+    Args:
+        pts (np.ndarray): The (n, 2) vertices.
+        count (int): The number of vertices of the result.
+        closed (bool): Whether the last vertex connects back to the first one.
+
+    Returns:
+        np.ndarray: The (count, 2) vertices, or `pts` if it already has `count` or more.
+    """
+    n = len(pts)
+    if count <= n:
+        return pts
+    starts = pts if closed else pts[:-1]
+    ends = np.roll(pts, -1, axis=0) if closed else pts[1:]
+    if len(starts) == 0:
+        return np.repeat(pts, count, axis=0)
+
+    extra = count - n
+    lengths = np.linalg.norm(ends - starts, axis=1)
+    total = lengths.sum()
+    share = lengths / total * extra if total > 0 else np.full(len(lengths), extra / len(lengths))
+    per_edge = np.floor(share).astype(np.intp)
+    remainder = extra - per_edge.sum()
+    per_edge[np.argsort(per_edge - share)[:remainder]] += 1
+
+    # Each edge contributes its start vertex and its inserted points
+    edge = np.repeat(np.arange(len(starts)), per_edge + 1)
+    first = np.cumsum(per_edge + 1) - (per_edge + 1)
+    f = (np.arange(len(edge)) - first[edge]) / (per_edge[edge] + 1)
+    result = starts[edge] + f[:, None] * (ends[edge] - starts[edge])
+    if not closed:
+        result = np.concatenate([result, pts[-1:]])
+    return result
+
+
+class Morph(CanvasTweenAnimator):
+    """
+    Interpolates the points of a polygon or line towards a target point set.
+
+    If the vertex counts differ, the shape with fewer vertices is subdivided
+    once in `start`. Every frame is a single in-place lerp over the object's
+    points in the scene's point buffer.
+    """
+    properties = ('points',)
+
+    def __init__(self, points: np.ndarray | list[float]) -> None:
+        """
+        Args:
+            points (np.ndarray | list[float]): Target points in canvas coordinates,
+                either flat (x0, y0, x1, y1, ...) or of shape (n, 2).
+        """
+        super().__init__()
+        self.points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+
+    def start(self, obj: SceneObject) -> tuple[np.ndarray, np.ndarray]:
+        if not isinstance(obj, SceneObject):
+            raise ValueError("Morph can only animate single canvas items")
+        closed = obj.scene.canvas.type(obj.idx) == 'polygon'
+
+        current = obj.get_transformed()
+        target = self.points
+        count = max(len(current), len(target))
+        current = subdivide(current, count, closed)
+        target = subdivide(target, count, closed)
+
+        # Express both shapes relative to the object's transform
+        rotation, scale, translation = obj.world_transform
+        a = np.radians(-rotation)
+        c, s = np.cos(a), np.sin(a)
+        R_inv = np.array([[c, -s], [s, c]]) / scale
+        p0 = (current - translation) @ R_inv.T
+        p1 = (target - translation) @ R_inv.T
+
+        obj.pts = p0
+        return p0, p1 - p0
+
+    def step(self, obj: SceneObject, t: float, animation_data: tuple[np.ndarray, np.ndarray]) -> None:
+        p0, delta = animation_data
+        pts = obj.pts
+        np.multiply(delta, t, out=pts)
+        pts += p0
+        obj.invalidate_points()
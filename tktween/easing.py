@@ -1,6 +1,14 @@
+from __future__ import annotations
+
+import bisect
+import functools
 import math
 import enum
-from typing import Callable, Dict
+import re
+import weakref
+from typing import Callable, Dict, Literal, Union
+
+import numpy as np
 
 class Easing(enum.Enum):
     SINUSOIDAL_IN = enum.auto()
@@ -134,22 +142,377 @@ EASING_FUNCTIONS: Dict[Easing, Callable[[float], float]] = {
     Easing.CIRCULAR_IN_OUT: circular_in_out,
 }
 
-def get_easing(type: Easing | str | None) -> Callable[[float], float]:
-    if type is None or callable(type):
-        return lambda x: x
-    elif isinstance(type, str):
-        easing_name = type.lower()
-        for easing_type, easing_func in EASING_FUNCTIONS.items():
-            if easing_type.name.lower() == easing_name.lower():
-                return easing_func
-        raise ValueError(f"Invalid easing type: {type}")
-    return EASING_FUNCTIONS[type]
+# Vectorized easing
+# Array versions of the functions above, evaluating a whole array of progress
+# values with one call. Branches are evaluated on clamped inputs so no invalid
+# values are computed, and results match the scalar versions.
+def sinusoidal_in_np(x):
+    return 1 - np.cos((x * np.pi) * 0.5)
+
+def sinusoidal_out_np(x):
+    return np.sin((x * np.pi) * 0.5)
+
+def sinusoidal_in_out_np(x):
+    return -0.5 * (np.cos(np.pi * x) - 1)
+
+def _polynomial_np(n, scale):
+    def ease_in(x):
+        return x ** n
+
+    def ease_out(x):
+        return 1 - (1 - x) ** n
+
+    def ease_in_out(x):
+        return np.where(x < 0.5, scale * x ** n, 1 - ((-2 * x + 2) ** n) * 0.5)
+
+    return ease_in, ease_out, ease_in_out
+
+quadratic_in_np, quadratic_out_np, quadratic_in_out_np = _polynomial_np(2, 2)
+cubic_in_np, cubic_out_np, cubic_in_out_np = _polynomial_np(3, 4)
+quartic_in_np, quartic_out_np, quartic_in_out_np = _polynomial_np(4, 8)
+quintic_in_np, quintic_out_np, quintic_in_out_np = _polynomial_np(5, 16)
+
+def exponential_in_np(x):
+    return np.where(x != 0, 2.0 ** (10 * (x - 1)), 0.0)
+
+def exponential_out_np(x):
+    return np.where(x < 1, 1 - 2.0 ** (-10 * x), 1.0)
+
+def exponential_in_out_np(x):
+    lower = np.minimum(x, 0.5)
+    upper = np.maximum(x, 0.5)
+    result = np.where(x < 0.5, 0.5 * 2.0 ** (20 * lower - 10), 1 - 0.5 * 2.0 ** (-20 * upper + 10))
+    result = np.where(x == 0, 0.0, result)
+    return np.where(x == 1, 1.0, result)
+
+def circular_in_np(x):
+    return 1 - np.sqrt(1 - x ** 2)
+
+def circular_out_np(x):
+    return np.sqrt(1 - (1 - x) ** 2)
+
+def circular_in_out_np(x):
+    lower = np.minimum(x, 0.5)
+    upper = np.maximum(x, 0.5)
+    return np.where(
+        x < 0.5,
+        (1 - np.sqrt(1 - (2 * lower) ** 2)) * 0.5,
+        (np.sqrt(1 - (-2 * upper + 2) ** 2) + 1) * 0.5
+    )
+
+
+VECTORIZED_EASING_FUNCTIONS: Dict[Easing, Callable[[np.ndarray], np.ndarray]] = {
+    Easing.SINUSOIDAL_IN: sinusoidal_in_np,
+    Easing.SINUSOIDAL_OUT: sinusoidal_out_np,
+    Easing.SINUSOIDAL_IN_OUT: sinusoidal_in_out_np,
+    Easing.QUADRATIC_IN: quadratic_in_np,
+    Easing.QUADRATIC_OUT: quadratic_out_np,
+    Easing.QUADRATIC_IN_OUT: quadratic_in_out_np,
+    Easing.CUBIC_IN: cubic_in_np,
+    Easing.CUBIC_OUT: cubic_out_np,
+    Easing.CUBIC_IN_OUT: cubic_in_out_np,
+    Easing.QUARTIC_IN: quartic_in_np,
+    Easing.QUARTIC_OUT: quartic_out_np,
+    Easing.QUARTIC_IN_OUT: quartic_in_out_np,
+    Easing.QUINTIC_IN: quintic_in_np,
+    Easing.QUINTIC_OUT: quintic_out_np,
+    Easing.QUINTIC_IN_OUT: quintic_in_out_np,
+    Easing.EXPONENTIAL_IN: exponential_in_np,
+    Easing.EXPONENTIAL_OUT: exponential_out_np,
+    Easing.EXPONENTIAL_IN_OUT: exponential_in_out_np,
+    Easing.CIRCULAR_IN: circular_in_np,
+    Easing.CIRCULAR_OUT: circular_out_np,
+    Easing.CIRCULAR_IN_OUT: circular_in_out_np,
+}
 
 
-def get_inverse_easing(type: Easing | str | None) -> Easing | None:
-    
-    if isinstance(type, str):
-        type = get_easing(type)
+def _identity_np(x):
+    return np.asarray(x, dtype=np.float64)
+
+
+# Custom easing
+# Parametrized easings as defined by CSS. Instances are immutable and cached by
+# their parameters, so equal curves share one object (and one easing table).
+class CubicBezier:
+    """
+    CSS `cubic-bezier(x1, y1, x2, y2)` easing.
+
+    The curve runs from (0, 0) to (1, 1) with control points (x1, y1) and
+    (x2, y2). Progress is mapped to the curve parameter by looking up the
+    bracketing interval in a table of x values sampled on construction,
+    refined with Newton iterations that fall back to bisection whenever a step
+    would leave the bracket (e.g. where the curve is flat in x). The parameter
+    is solved to `tolerance`, so evaluations match the exact curve to ~1e-12.
+
+    This is a precise solve of up to `max_iterations` steps, not a cheap
+    single refinement of the table lookup. That is only acceptable because
+    tweens evaluate curves when their easing tables are built (see
+    `get_easing_table`), never per frame; calling the curve directly in a hot
+    loop pays for every iteration.
+    """
+    __slots__ = ('x1', 'y1', 'x2', 'y2', '_ts', '_xs', '_xs_np', '__weakref__')
+    _instances: weakref.WeakValueDictionary[tuple, CubicBezier] = weakref.WeakValueDictionary()
+    num_samples = 101
+    tolerance = 1e-14
+    max_iterations = 64
+
+    def __new__(cls, x1: float, y1: float, x2: float, y2: float) -> CubicBezier:
+        # Rounded, so mirrored curves (see `inverse`) hit the cache despite float error
+        key = tuple(round(float(v), 12) for v in (x1, y1, x2, y2))
+        self = cls._instances.get(key)
+        if self is not None:
+            return self
+        if not (0.0 <= x1 <= 1.0 and 0.0 <= x2 <= 1.0):
+            raise ValueError(f"x coordinates of cubic-bezier control points must be in [0, 1], got {x1}, {x2}")
+
+        self = super().__new__(cls)
+        self.x1, self.y1, self.x2, self.y2 = key
+        # x(t) is monotonic for x1, x2 in [0, 1]
+        ts = np.linspace(0.0, 1.0, cls.num_samples)
+        self._xs_np = self._bezier(ts, self.x1, self.x2)
+        self._ts = ts.tolist()
+        self._xs = self._xs_np.tolist()
+        cls._instances[key] = self
+        return self
+
+    def __reduce__(self):
+        return CubicBezier, (self.x1, self.y1, self.x2, self.y2)
+
+    def __repr__(self) -> str:
+        return f"CubicBezier({self.x1}, {self.y1}, {self.x2}, {self.y2})"
+
+    @staticmethod
+    def _bezier(t, p1, p2):
+        return ((3 * p1 * (1 - t) + 3 * p2 * t) * (1 - t) + t * t) * t
+
+    @staticmethod
+    def _bezier_derivative(t, p1, p2):
+        return 3 * p1 * (1 - t) ** 2 + 6 * (p2 - p1) * (1 - t) * t + 3 * (1 - p2) * t * t
+
+    def _solve(self, x: float) -> float:
+        i = min(max(bisect.bisect_right(self._xs, x), 1), len(self._xs) - 1)
+        x0, x1 = self._xs[i - 1], self._xs[i]
+        lo, hi = self._ts[i - 1], self._ts[i]
+        t = lo + (hi - lo) * (x - x0) / (x1 - x0) if x1 > x0 else lo
+        for _ in range(self.max_iterations):
+            error = self._bezier(t, self.x1, self.x2) - x
+            if error == 0.0:
+                return t
+            if error > 0.0:
+                hi = t
+            else:
+                lo = t
+            slope = self._bezier_derivative(t, self.x1, self.x2)
+            t_next = t - error / slope if slope > 0.0 else hi + 1.0
+            if not lo < t_next < hi:
+                t_next = 0.5 * (lo + hi)
+            if abs(t_next - t) < self.tolerance:
+                return t_next
+            t = t_next
+        return t
+
+    def __call__(self, x: float) -> float:
+        if x <= 0.0:
+            return 0.0
+        elif x >= 1.0:
+            return 1.0
+        return self._bezier(self._solve(x), self.y1, self.y2)
+
+    def vectorized(self, x: np.ndarray) -> np.ndarray:
+        """Array version of the easing."""
+        x = np.clip(np.asarray(x, dtype=np.float64), 0.0, 1.0)
+        xs = self._xs_np
+        i = np.clip(np.searchsorted(xs, x, side='right'), 1, len(xs) - 1)
+        x0, x1 = xs[i - 1], xs[i]
+        dt = 1.0 / (len(xs) - 1)
+        lo = (i - 1) * dt
+        hi = lo + dt
+        width = x1 - x0
+        t = lo + dt * np.divide(x - x0, width, out=np.zeros_like(x), where=width > 0)
+        for _ in range(self.max_iterations):
+            error = self._bezier(t, self.x1, self.x2) - x
+            hi = np.where(error > 0.0, t, hi)
+            lo = np.where(error < 0.0, t, lo)
+            slope = self._bezier_derivative(t, self.x1, self.x2)
+            t_next = t - np.divide(error, slope, out=np.full_like(x, np.inf), where=slope > 0.0)
+            t_next = np.where((lo < t_next) & (t_next < hi), t_next, 0.5 * (lo + hi))
+            t_next = np.where(error == 0.0, t, t_next)
+            converged = np.abs(t_next - t) < self.tolerance
+            t = t_next
+            if converged.all():
+                break
+        return np.where(x >= 1.0, 1.0, np.where(x <= 0.0, 0.0, self._bezier(t, self.y1, self.y2)))
+
+    def inverse(self) -> CubicBezier:
+        """The curve mirrored through (0.5, 0.5), i.e. `1 - f(1 - x)`."""
+        return CubicBezier(1 - self.x2, 1 - self.y2, 1 - self.x1, 1 - self.y1)
+
+
+StepPosition = Literal['jump-start', 'jump-end', 'jump-none', 'jump-both', 'start', 'end']
+
+
+class Steps:
+    """
+    CSS `steps(n, position)` easing, holding the progress constant in `n` intervals.
+    """
+    __slots__ = ('n', 'position', '_jumps', '_offset', '__weakref__')
+    _instances: weakref.WeakValueDictionary[tuple, Steps] = weakref.WeakValueDictionary()
+
+    def __new__(cls, n: int, position: StepPosition = 'jump-end') -> Steps:
+        position = {'start': 'jump-start', 'end': 'jump-end'}.get(position, position)
+        key = (int(n), position)
+        self = cls._instances.get(key)
+        if self is not None:
+            return self
+        if position not in ('jump-start', 'jump-end', 'jump-none', 'jump-both'):
+            raise ValueError(f"Invalid step position: {position}")
+        if n < (2 if position == 'jump-none' else 1):
+            raise ValueError(f"Invalid number of steps for {position}: {n}")
+
+        self = super().__new__(cls)
+        self.n, self.position = key
+        self._jumps = self.n + {'jump-none': -1, 'jump-both': 1}.get(position, 0)
+        self._offset = 1 if position in ('jump-start', 'jump-both') else 0
+        cls._instances[key] = self
+        return self
+
+    def __reduce__(self):
+        return Steps, (self.n, self.position)
+
+    def __repr__(self) -> str:
+        return f"Steps({self.n}, {self.position!r})"
+
+    def __call__(self, x: float) -> float:
+        step = min(max(math.floor(x * self.n) + self._offset, 0), self._jumps)
+        return step / self._jumps
+
+    def vectorized(self, x: np.ndarray) -> np.ndarray:
+        """Array version of the easing."""
+        step = np.clip(np.floor(np.asarray(x, dtype=np.float64) * self.n) + self._offset, 0, self._jumps)
+        return step / self._jumps
+
+    def inverse(self) -> Steps:
+        """The steps mirrored through (0.5, 0.5), i.e. `1 - f(1 - x)`."""
+        position = {'jump-start': 'jump-end', 'jump-end': 'jump-start'}.get(self.position, self.position)
+        return Steps(self.n, position)
+
+
+EasingType = Union[Easing, CubicBezier, Steps, str, Callable[[float], float], None]
+
+CSS_EASINGS: Dict[str, Easing | CubicBezier | Steps | None] = {
+    'linear': None,
+    'ease': CubicBezier(0.25, 0.1, 0.25, 1.0),
+    'ease-in': CubicBezier(0.42, 0.0, 1.0, 1.0),
+    'ease-out': CubicBezier(0.0, 0.0, 0.58, 1.0),
+    'ease-in-out': CubicBezier(0.42, 0.0, 0.58, 1.0),
+    'step-start': Steps(1, 'jump-start'),
+    'step-end': Steps(1, 'jump-end'),
+}
+
+_CSS_FUNCTION = re.compile(r'^\s*(cubic-bezier|steps)\s*\((.*)\)\s*$')
+
+
+def resolve_easing(type: EasingType) -> Easing | CubicBezier | Steps | Callable[[float], float] | None:
+    """
+    Resolve easing names and CSS easing strings to easing objects.
+
+    Args:
+        type (EasingType): An easing, its name (e.g. `'cubic_in'`), a CSS easing
+            (e.g. `'ease-out'`, `'cubic-bezier(0.3, 0, 0.2, 1)'`, `'steps(4, jump-start)'`),
+            a custom easing function or None.
+
+    Returns:
+        Easing | CubicBezier | Steps | Callable[[float], float] | None: The easing.
+    """
+    if not isinstance(type, str):
+        return type
+
+    name = type.strip().lower()
+    for easing_type in Easing:
+        if easing_type.name.lower() == name:
+            return easing_type
+    if name in CSS_EASINGS:
+        return CSS_EASINGS[name]
+
+    match = _CSS_FUNCTION.match(name)
+    if match:
+        function, args = match.group(1), [arg.strip() for arg in match.group(2).split(',')]
+        try:
+            if function == 'cubic-bezier' and len(args) == 4:
+                return CubicBezier(*map(float, args))
+            elif function == 'steps' and len(args) in (1, 2):
+                return Steps(int(args[0]), *args[1:])
+        except ValueError as e:
+            raise ValueError(f"Invalid easing type: {type}") from e
+    raise ValueError(f"Invalid easing type: {type}")
+
+
+def get_easing(type: EasingType, vectorized: bool = False) -> Callable[[float], float]:
+    """
+    Get the function of an easing type.
+
+    Args:
+        type (EasingType): The easing, its name, a CSS easing, a custom easing function
+            or None for linear progress. See `resolve_easing`.
+        vectorized (bool, optional): Return the NumPy version, which maps an array of
+            progress values at once. Defaults to False.
+
+    Returns:
+        Callable[[float], float]: The easing function.
+    """
+    type = resolve_easing(type)
+    if type is None:
+        return _identity_np if vectorized else lambda x: x
+    elif isinstance(type, (CubicBezier, Steps)):
+        return type.vectorized if vectorized else type
+    elif isinstance(type, Easing):
+        return (VECTORIZED_EASING_FUNCTIONS if vectorized else EASING_FUNCTIONS)[type]
+    elif vectorized:
+        return lambda x: np.array([type(v) for v in np.asarray(x, dtype=np.float64).flat]).reshape(np.shape(x))
+    return type
+
+
+@functools.lru_cache(maxsize=256)
+def get_easing_table(type: EasingType, num_frames: int) -> np.ndarray:
+    """
+    Get the eased progress of an easing sampled at every frame of a block.
+
+    Blocks are always evaluated at the progress values `i / num_frames`, so
+    easing a frame is a lookup in this table. Tables are cached, the least
+    recently used ones are evicted once 256 tables are cached.
+
+    Args:
+        type (EasingType): The easing.
+        num_frames (int): Duration of the block in frames.
+
+    Returns:
+        np.ndarray: Read-only array of `num_frames + 1` eased progress values. For
+            blocks without duration it holds the single value at progress 1.
+    """
+    if num_frames <= 0:
+        t = np.ones(1)
+    else:
+        t = np.arange(num_frames + 1) / num_frames
+    table = np.asarray(get_easing(type, vectorized=True)(t), dtype=np.float64)
+    table.flags.writeable = False
+    return table
+
+
+def get_inverse_easing(type: EasingType) -> Easing | CubicBezier | Steps | Callable[[float], float] | None:
+    """
+    Get the easing mirrored through (0.5, 0.5), used when a tween is played backwards.
+
+    Args:
+        type (EasingType): The easing.
+
+    Returns:
+        Easing | CubicBezier | Steps | Callable[[float], float] | None: The inverse easing.
+    """
+    type = resolve_easing(type)
+    if isinstance(type, (CubicBezier, Steps)):
+        return type.inverse()
+    elif callable(type):
+        return lambda x: 1 - type(1 - x)
 
     inverse_mapping = {
         Easing.SINUSOIDAL_IN: Easing.SINUSOIDAL_OUT,
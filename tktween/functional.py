@@ -2,13 +2,20 @@ import tkinter as tk
 import uuid
 
 from typing import Callable
+from .base import TweenAble
 from .scene import Scene
 from .tween import Tween, TweenDirector, TweenHandle
 
 __all__ = [
     'get_fps',
     'set_fps',
+    'get_effective_fps',
+    'set_adaptive_fps',
+    'get_clock',
+    'set_clock',
     'is_running',
+    'get_handles',
+    'cancel_all',
     'get_root',
     'set_root',
     'get_scene',
@@ -22,9 +29,27 @@ def get_fps() -> int:
 def set_fps(fps:int) -> None:
     TweenDirector.get().fps = fps
 
-def is_running(tween:Tween, widget:tk.Widget) -> bool:
+def get_effective_fps() -> int:
+    return TweenDirector.get().effective_fps
+
+def set_adaptive_fps(enabled:bool) -> None:
+    TweenDirector.get().adaptive_fps = enabled
+
+def get_clock() -> Callable[[], float]:
+    return TweenDirector.get().clock
+
+def set_clock(clock:Callable[[], float]) -> None:
+    TweenDirector.get().clock = clock
+
+def is_running(tween:Tween, widget:TweenAble) -> bool:
     return TweenDirector.get().is_active(tween, widget)
 
+def get_handles(target:TweenAble) -> list[TweenHandle]:
+    return TweenDirector.get().handles_for(target)
+
+def cancel_all(target:TweenAble, revert:bool=False) -> int:
+    return TweenDirector.get().cancel_all(target, revert)
+
 def get_root() -> tk.Tk:
     return TweenDirector.get().root
 
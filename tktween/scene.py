@@ -1,51 +1,172 @@
 from __future__ import annotations
 
-from typing import Any
+import enum
+import itertools
+import weakref
+from typing import Any, Iterable, Iterator
 import tkinter as tk
 import numpy as np
 
-class SceneObject:
+from .batch import CommandBatch
+
+class Change(enum.IntFlag):
+    """Transform components of a SceneObject changed since its last commit."""
+    NONE        = 0
+    TRANSLATION = enum.auto()
+    SCALE       = enum.auto()
+    ROTATION    = enum.auto()
+    GEOMETRY    = enum.auto()
+
+
+class SceneNode:
     """
-    Represents an object within a scene on a Tkinter canvas.
+    Base class of all nodes in a scene graph.
+
+    A node does not own its transform. Transform components live in the
+    structure-of-arrays store of the owning scene and are accessed through the
+    node's slot. `rotation`, `scale` and `translation` are relative to the
+    parent group; for nodes without a parent they are canvas coordinates.
 
     Attributes:
-        pts (np.ndarray): The points defining the object.
-        idx (int): The object's identifier in the scene.
-        scene (Scene): The scene to which the object belongs.
+        idx (int): The node's identifier in the scene.
+        slot (int): The node's row in the scene's object tables.
+        scene (Scene): The scene to which the node belongs.
+        parent (SceneGroup | None): The group the node is attached to.
     """
 
-    def __init__(self, pts: np.ndarray, idx: int, scene: Scene) -> None:
-        self.pts = pts
+    def __init__(self, idx: int, slot: int, scene: Scene) -> None:
         self.idx = idx
+        self.slot = slot
+        self.scene = scene
+        self.parent: SceneGroup | None = None
+        self._options: dict[str, Any] = {}
 
-        xmin, ymin = pts.min(axis=0)
-        xmax, ymax = pts.max(axis=0)
 
-        self._rotation    = 0.0
-        self._scale       = 1.0
-        self._translation = 0.5 * np.array([xmin + xmax, ymin + ymax])  
-        self.pts -= self._translation[None, :]
-        self.scene = scene
+    def _changed_options(self, args: tuple, kwargs: dict[str, Any]) -> dict[str, Any]:
+        """Merge `configure` arguments, keeping only values that differ from the last written ones."""
+        options = dict(args[0]) if args else {}
+        options.update(kwargs)
+        committed = self._options
+        changed = {
+            key: value for key, value in options.items()
+            if key not in committed or committed[key] != value
+        }
+        committed.update(changed)
+        return changed
+
+
+    def _mark(self, change: Change) -> None:
+        scene = self.scene
+        scene._changes[self.slot] |= change
+        scene._world_stale[self.slot] = True
+        if change & (Change.ROTATION | Change.SCALE | Change.GEOMETRY):
+            scene._linear_stale[self.slot] = True
+        scene.dirty.add(self.idx)
+
+    @property
+    def scale(self) -> float:
+        """
+        Scale factor of the object.
+
+        Returns:
+            float: The scale factor.
+        """
+        return float(self.scene._scale[self.slot])
+
+    @scale.setter
+    def scale(self, s:float):
+        self.scene._scale[self.slot] = s
+        self._mark(Change.SCALE)
+
+    @property
+    def rotation(self) -> float:
+        """
+        Rotation angle of the object.
+
+        Returns:
+            float: The rotation angle in degrees.
+        """
+        return float(self.scene._rotation[self.slot])
+
+    @rotation.setter
+    def rotation(self, angle: float):
+        self.scene._rotation[self.slot] = angle
+        self._mark(Change.ROTATION)
+
+    @property
+    def translation(self) -> np.ndarray:
+        """
+        Translation vector of the object.
+
+        Returns:
+            np.ndarray: The translation vector (a view into the scene's table).
+        """
+        return self.scene._translation[self.slot]
+
+    @translation.setter
+    def translation(self, vector: np.ndarray):
+        self.scene._translation[self.slot] = vector
+        self._mark(Change.TRANSLATION)
+
+    @property
+    def world_transform(self) -> tuple[float, float, np.ndarray]:
+        """
+        Rotation, scale and translation of the node in canvas coordinates.
 
+        Returns:
+            tuple[float, float, np.ndarray]: The composed world transform.
+        """
+        self.scene._resolve_world()
+        slot = self.slot
+        return (
+            float(self.scene._world_rotation[slot]),
+            float(self.scene._world_scale[slot]),
+            self.scene._world_translation[slot].copy()
+        )
+
+
+class SceneObject(SceneNode):
+    """
+    Represents an object within a scene on a Tkinter canvas.
+
+    The points of the object live in the scene's point buffer.
+
+    Attributes:
+        idx (int): The object's identifier in the scene.
+        slot (int): The object's row in the scene's object tables.
+        scene (Scene): The scene to which the object belongs.
+    """
 
     def configure(self, *args, **kwargs):
         """
         Configures the appearance of the object on the canvas.
 
         This method is a wrapper for `self.scene.canvas.itemconfigure(self.idx)`.
+        Option writes are issued through the scene's command batch. The object
+        remembers the last written (or read) value of every option and only
+        sends options whose value changed. Options changed directly on the
+        canvas are picked up again by `get_config`.
 
         Args:
             *args: Variable-length argument list passed to `canvas.itemconfigure()`.
             **kwargs: Arbitrary keyword arguments passed to `canvas.itemconfigure()`.
         """
-        self.scene.canvas.itemconfigure(self.idx, *args, **kwargs)
+        if args and not isinstance(args[0], dict):
+            # Option queries need the result, so they cannot be batched
+            return self.scene.canvas.itemconfigure(self.idx, *args, **kwargs)
+        options = self._changed_options(args, kwargs)
+        if options:
+            self.scene.configure_item(self.idx, options)
+            self.scene._forget_tag_options((self.idx,), options)
+
 
-    
     def get_config(self, cfg:str) -> Any:
         """
         Gets the configuration value of the object on the canvas.
 
         This method is a wrapper for `self.canvas.itemconfigure(self.index, cfg)`.
+        Commands buffered in the scene's batch are evaluated first, so the value
+        reflects all writes issued so far and is safe to remember as written value.
 
         Args:
             cfg (str): The configuration option to retrieve.
@@ -53,96 +174,379 @@ class SceneObject:
         Returns:
             Any: The value of the specified configuration option.
         """
-        return self.scene.canvas.itemconfigure(self.idx, cfg)[-1]
+        self.scene.commands.sync()
+        value = self.scene.canvas.itemconfigure(self.idx, cfg)[-1]
+        self._options[cfg] = value
+        return value
 
 
     @classmethod
     def from_element(cls, canvas: tk.Canvas, element: int, scene: Scene) -> SceneObject:
-        pts = np.array(canvas.coords(element)).reshape(-1, 2).astype(np.float32)
-        return SceneObject(pts, element, scene)
-    
+        pts = np.array(canvas.coords(element), dtype=np.float64).reshape(-1, 2)
+        return scene.add_points(element, pts)
+
 
     def get_transformed(self) -> np.ndarray:
-        a = np.radians(self._rotation)
+        rotation, scale, translation = self.world_transform
+        scene = self.scene
+        if not scene._linear_stale[self.slot]:
+            offset = scene._offsets[self.slot]
+            return scene._linear[offset:offset + scene._lengths[self.slot]] + translation[None, :]
+        a = np.radians(rotation)
         c, s = np.cos(a), np.sin(a)
         R = np.array([[c, -s], [s, c]])
-        transformed_pts = np.einsum('ij,nj->ni', R, self._scale * self.pts) + self._translation[None, :]    
+        transformed_pts = np.einsum('ij,nj->ni', R, scale * self.pts) + translation[None, :]
         return transformed_pts
-    
+
     @property
-    def scale(self) -> float:
+    def pts(self) -> np.ndarray:
         """
-        Scale factor of the object.
+        Points of the object relative to its translation.
 
         Returns:
-            float: The scale factor.
+            np.ndarray: A (n, 2) view into the scene's point buffer.
         """
-        return self._scale
-    
-    @scale.setter
-    def scale(self, s:float):
-        self._scale = s
-        self.scene.dirty.add(self.idx)
+        offset = self.scene._offsets[self.slot]
+        return self.scene._points[offset:offset + self.scene._lengths[self.slot]]
 
-    @property
-    def rotation(self) -> float:
+    @pts.setter
+    def pts(self, pts: np.ndarray):
+        self.scene.set_points(self, pts)
+
+
+    def invalidate_points(self) -> None:
+        """Mark the object for a full redraw after its points were modified in place."""
+        self._mark(Change.GEOMETRY)
+
+
+class SceneGroup(SceneNode):
+    """
+    A scene graph node that composes its transform onto its children.
+
+    Groups have no canvas item of their own and are identified by negative
+    ids. Rotating, scaling or translating a group moves all of its children
+    about the group's pivot (its translation), so a single tween targeting the
+    group drives an arbitrary number of canvas items.
+
+    Attributes:
+        idx (int): The group's (negative) identifier in the scene.
+        slot (int): The group's row in the scene's object tables.
+        scene (Scene): The scene to which the group belongs.
+        children (list[SceneNode]): The nodes attached to this group.
+    """
+
+    def __init__(self, idx: int, slot: int, scene: Scene) -> None:
+        super().__init__(idx, slot, scene)
+        self.children: list[SceneNode] = []
+        self._child_slots = np.empty(0, dtype=np.intp)
+
+
+    def add(self, *nodes: SceneNode | int) -> SceneGroup:
         """
-        Rotation angle of the object.
+        Attach nodes to the group, keeping their current position on the canvas.
+
+        Args:
+            *nodes (SceneNode | int): Nodes or canvas element ids to attach.
 
         Returns:
-            float: The rotation angle in degrees.
+            SceneGroup: The group for chaining.
         """
-        return self._rotation
-    
-    @rotation.setter
-    def rotation(self, angle: float):
-        self._rotation = angle
-        self.scene.dirty.add(self.idx)
+        scene = self.scene
+        rotation, scale, translation = self.world_transform
+        a = np.radians(-rotation)
+        c, s = np.cos(a), np.sin(a)
+        R_inv = np.array([[c, -s], [s, c]])
 
-    @property
-    def translation(self) -> np.ndarray:
+        for node in nodes:
+            if not isinstance(node, SceneNode):
+                node = scene.get_object(node)
+            ancestor = self
+            while ancestor is not None:
+                if ancestor is node:
+                    raise ValueError("Cannot attach a group to itself or one of its descendants")
+                ancestor = ancestor.parent
+            r, s, t = node.world_transform
+            if node.parent is not None:
+                node.parent.remove(node)
+            node.parent = self
+            self.children.append(node)
+
+            slot = node.slot
+            scene._rotation[slot] = r - rotation
+            scene._scale[slot] = s / scale
+            scene._translation[slot] = R_inv @ (t - translation) / scale
+
+        self._child_slots = np.array([child.slot for child in self.children], dtype=np.intp)
+        return self
+
+
+    def remove(self, node: SceneNode) -> None:
         """
-        Translation vector of the object.
+        Detach a node from the group, keeping its current position on the canvas.
+
+        Args:
+            node (SceneNode): The child to detach.
+        """
+        scene = self.scene
+        r, s, t = node.world_transform
+        self.children.remove(node)
+        self._child_slots = np.array([child.slot for child in self.children], dtype=np.intp)
+        node.parent = None
+
+        scene._rotation[node.slot] = r
+        scene._scale[node.slot] = s
+        scene._translation[node.slot] = t
+
+
+    def leaves(self) -> Iterator[SceneObject]:
+        """Iterate over all canvas objects in the group's subtree."""
+        for child in self.children:
+            if isinstance(child, SceneGroup):
+                yield from child.leaves()
+            else:
+                yield child
+
+
+    def configure(self, *args, **kwargs):
+        """
+        Configures the appearance of all objects in the group.
+
+        Args:
+            *args: Variable-length argument list passed to `SceneObject.configure()`.
+            **kwargs: Arbitrary keyword arguments passed to `SceneObject.configure()`.
+        """
+        for leaf in self.leaves():
+            leaf.configure(*args, **kwargs)
+
+
+    def get_config(self, cfg:str) -> Any:
+        """
+        Gets the configuration value of the first object in the group.
+
+        Args:
+            cfg (str): The configuration option to retrieve.
 
         Returns:
-            np.ndarray: The translation vector.
+            Any: The value of the specified configuration option.
         """
-        return self._translation
-    
-    @translation.setter
-    def translation(self, vector: np.ndarray):
-        self._translation = vector
-        self.scene.dirty.add(self.idx)
+        for leaf in self.leaves():
+            return leaf.get_config(cfg)
+        raise KeyError(f"Group {self.idx} has no objects")
+
+
+class SceneTag(SceneNode):
+    """
+    All canvas items carrying a Tk tag, animated as one unit.
+
+    Translation and scale are committed with a single tag-wide `move` and
+    `scale` command and options with a single tag-wide `itemconfigure`,
+    independent of the number of tagged items. The translation of a tag is
+    the center of the tagged items' bounding box at creation time. Tk cannot
+    rotate items, so the rotation of a tag is never committed and
+    `CanvasTween.run` rejects rotating tags (use `Scene.create_group`).
+
+    Tagged items that are also tracked as ungrouped SceneObjects have their
+    transforms updated along with the tag, so later per-item animations
+    continue from the moved position.
+
+    Attributes:
+        idx (str): The tag.
+        slot (int): The tag's row in the scene's object tables.
+        scene (Scene): The scene to which the tag belongs.
+        members (tuple[int, ...]): Items carrying the tag, see `refresh`.
+    """
+
+    def __init__(self, idx: str, slot: int, scene: Scene) -> None:
+        super().__init__(idx, slot, scene)
+        self.members: tuple[int, ...] = ()
+        self.refresh()
+
+
+    def refresh(self) -> None:
+        """
+        Re-query the items carrying the tag.
+
+        Called when a tween starts on the tag and on every `Scene.sweep`. If the
+        members changed, the last written option values are forgotten, as they
+        do not apply to the new members.
+        """
+        members = tuple(self.scene.canvas.find_withtag(self.idx))
+        if members != self.members:
+            self._options.clear()
+        self.members = members
+        self._member_set = frozenset(members)
+
+
+    def configure(self, *args, **kwargs):
+        """
+        Configures the appearance of all tagged items with one `itemconfigure`.
+
+        Unchanged options are skipped like in `SceneObject.configure`. Writing
+        an option to a member directly or through another tag forgets the
+        tag's last written value of that option.
+
+        Args:
+            *args: Variable-length argument list passed to `canvas.itemconfigure()`.
+            **kwargs: Arbitrary keyword arguments passed to `canvas.itemconfigure()`.
+        """
+        if args and not isinstance(args[0], dict):
+            return self.scene.canvas.itemconfigure(self.idx, *args, **kwargs)
+        options = self._changed_options(args, kwargs)
+        if options:
+            self.scene.configure_item(self.idx, options)
+            for element in self.members:
+                member = self.scene.objects.get(element)
+                if member is not None:
+                    member._options.update(options)
+            self.scene._forget_tag_options(self.members, options, writer=self)
+
+
+    def get_config(self, cfg:str) -> Any:
+        """
+        Gets the configuration value of the first tagged item.
+
+        The value is not remembered as written value of the tag, since the
+        other members may differ.
+
+        Args:
+            cfg (str): The configuration option to retrieve.
+
+        Returns:
+            Any: The value of the specified configuration option.
+        """
+        self.scene.commands.sync()
+        return self.scene.canvas.itemconfigure(self.idx, cfg)[-1]
+
 
 class Scene:
     """
     Represents a scene containing objects on a Tkinter canvas.
 
+    The points of all objects are kept in one contiguous buffer. Each node
+    owns a slot in a set of per-node tables (offset and length into the point
+    buffer, local and world rotation, scale and translation), so that all dirty
+    objects can be transformed in a single vectorized pass per frame.
+
+    Nodes can be attached to groups (see `create_group`). World transforms are
+    cached per node and only recomputed down the subtrees of changed nodes.
+
+    Every slot also remembers the transform last committed to the canvas and
+    which components changed since. Objects that were only translated are
+    committed with Tk's native `move`, objects that were only scaled with
+    `scale`; the full coordinate list is only sent when rotation is involved.
+
+    With `culling` enabled, objects whose old and new bounding boxes are both
+    outside the visible part of the canvas are not written. Their state keeps
+    being updated and they are committed once they scroll into view (or when
+    `flush_culled` is called).
+
+    The scene only holds a weak reference to its canvas. Objects of deleted
+    canvas items are dropped by `sweep`, which also evicts the least recently
+    used idle objects once more than `max_objects` are tracked.
+
     Attributes:
         canvas (tk.Canvas): The canvas associated with the scene.
-        objects (dict[int, SceneObject]): A dictionary of objects in the scene, indexed by their identifiers.
-        dirty (set[int]): A set of object identifiers that need updating.
+        commands (CommandBatch): The batch all canvas writes are issued through.
+        objects (dict[int, SceneNode]): A dictionary of nodes in the scene, indexed by their identifiers.
+        dirty (set[int]): A set of node identifiers that need updating.
+        max_objects (int | None): Number of tracked objects above which idle objects are evicted.
+        culling (bool): Whether to skip writes of objects outside the visible region.
+        cull_margin (float): Margin in pixels added around the visible region, e.g. for text items.
     """
 
-    def __init__(self, canvas: tk.Canvas) -> None:
-        self.canvas = canvas
-        self.objects: dict[int, SceneObject] = {}
+    def __init__(
+        self,
+        canvas: tk.Canvas,
+        commands: CommandBatch | None = None,
+        capacity: int = 64,
+        max_objects: int | None = None,
+        culling: bool = False,
+        cull_margin: float = 0.0
+    ) -> None:
+        self._canvas = weakref.ref(canvas)
+        self.commands = commands if commands is not None else CommandBatch()
+        self.objects: dict[int, SceneNode] = {}
         self.dirty: set[int] = set()
+        self._tags: dict[str, SceneTag] = {}
+        self.max_objects = max_objects
+        self.culling = culling
+        self.cull_margin = cull_margin
+        self._culled: set[int] = set()
+        self._group_ids = itertools.count(-1, -1)
+        self._tick = 0
+        self._free_slots: list[int] = []
+        self._garbage_points = 0
+
+        # Point store
+        self._num_points = 0
+        self._points      = np.empty((4 * capacity, 2))
+        self._transformed = np.empty((4 * capacity, 2))
+        self._owner       = np.empty(4 * capacity, dtype=np.intp)
+        self._linear      = np.empty((4 * capacity, 2))
+        self._point_mask  = np.empty((2, 4 * capacity), dtype=bool)
+        self._scratch     = np.empty((4, 4 * capacity))
+
+        # Object tables
+        self._num_slots = 0
+        self._elements: list[int] = []
+        self._offsets     = np.empty(capacity, dtype=np.intp)
+        self._lengths     = np.empty(capacity, dtype=np.intp)
+        self._rotation    = np.empty(capacity)
+        self._scale       = np.empty(capacity)
+        self._translation = np.empty((capacity, 2))
+        self._slot_dirty  = np.zeros(capacity, dtype=bool)
+        self._slot_linear = np.empty((2, capacity))
+        self._last_used   = np.zeros(capacity, dtype=np.int64)
 
+        # Cached world transforms, recomputed for stale subtrees only
+        self._world_stale       = np.zeros(capacity, dtype=bool)
+        self._world_rotation    = np.empty(capacity)
+        self._world_scale       = np.empty(capacity)
+        self._world_translation = np.empty((capacity, 2))
 
-    def get_object(self, element:int) -> SceneObject:
+        # Cached rotated and scaled points, invalidated by the rotation and scale setters
+        self._linear_stale = np.ones(capacity, dtype=bool)
+        self._slot_refresh = np.empty(capacity, dtype=bool)
+
+        # Last committed transform and changes since
+        self._changes               = np.zeros(capacity, dtype=np.uint8)
+        self._committed_rotation    = np.empty(capacity)
+        self._committed_scale       = np.empty(capacity)
+        self._committed_translation = np.empty((capacity, 2))
+
+        # Bounding boxes (xmin, ymin, xmax, ymax) of the transformed and the committed points
+        self._bounds           = np.zeros((capacity, 4))
+        self._committed_bounds = np.zeros((capacity, 4))
+
+
+    def get_object(self, element:int | str) -> SceneNode:
         """
         Gets a SceneObject associated with a canvas element.
 
         Args:
-            element (int): The identifier of the canvas element.
+            element (int | str): The identifier of the canvas element, the (negative) id of a group or a canvas tag.
 
         Returns:
-            SceneObject: The associated SceneObject.
+            SceneNode: The associated SceneObject, SceneGroup or SceneTag.
         """
         if element not in self.objects:
-            self.add_object(element)
-        return self.objects[element]
+            if isinstance(element, str):
+                self.add_tag(element)
+            elif element < 0:
+                raise KeyError(f"No group with ID {element} in scene")
+            else:
+                self.add_object(element)
+        obj = self.objects[element]
+        self._last_used[obj.slot] = self._tick
+        return obj
+
+    @property
+    def canvas(self) -> tk.Canvas:
+        """The canvas associated with the scene."""
+        canvas = self._canvas()
+        if canvas is None:
+            raise RuntimeError("The canvas of this scene no longer exists")
+        return canvas
 
 
     def add_object(self, element: int) -> SceneObject:
@@ -158,16 +562,629 @@ class Scene:
         if element in self.objects:
             msg = f"Object with ID {element} already in scene"
             raise KeyError(msg)
-        obj = SceneObject.from_element(self.canvas, element, self)
+        return SceneObject.from_element(self.canvas, element, self)
+
+
+    def add_tag(self, tag: str) -> SceneTag:
+        """
+        Adds a node animating all canvas items carrying a tag.
+
+        Args:
+            tag (str): The canvas tag.
+
+        Returns:
+            SceneTag: The newly added SceneTag.
+        """
+        if tag in self.objects:
+            raise KeyError(f"Tag {tag!r} already in scene")
+        bbox = self.canvas.bbox(tag)
+        center = 0.5 * np.array([bbox[0] + bbox[2], bbox[1] + bbox[3]], dtype=np.float64) if bbox else np.zeros(2)
+        node = SceneTag(tag, self._allocate_slot(tag, 0, center), self)
+        self.objects[tag] = node
+        self._tags[tag] = node
+        return node
+
+
+    def _forget_tag_options(self, elements: tuple[int, ...], options: dict[str, Any], writer: SceneTag | None = None) -> None:
+        """Drop options written to some items from the caches of all other tags carried by these items."""
+        for tag in self._tags.values():
+            if tag is not writer and not tag._member_set.isdisjoint(elements):
+                for key in options:
+                    tag._options.pop(key, None)
+
+
+    def create_group(self, *nodes: SceneNode | int, pivot: np.ndarray | None = None) -> SceneGroup:
+        """
+        Creates a group and attaches the given nodes to it.
+
+        Args:
+            *nodes (SceneNode | int): Nodes or canvas element ids to attach.
+            pivot (np.ndarray | None, optional): Canvas position the group rotates and scales about.
+                Defaults to the center of the children's bounding box.
+
+        Returns:
+            SceneGroup: The new group. Its `idx` can be passed to `CanvasTween.run`.
+        """
+        nodes = [node if isinstance(node, SceneNode) else self.get_object(node) for node in nodes]
+        if pivot is None:
+            pts = [
+                leaf.get_transformed()
+                for node in nodes
+                for leaf in (node.leaves() if isinstance(node, SceneGroup) else (node,))
+            ]
+            pts = np.concatenate(pts) if pts else np.zeros((1, 2))
+            pivot = 0.5 * (pts.min(axis=0) + pts.max(axis=0))
+
+        idx = next(self._group_ids)
+        slot = self._allocate_slot(idx, 0, np.asarray(pivot, dtype=np.float64))
+        group = SceneGroup(idx, slot, self)
+        self.objects[idx] = group
+        group.add(*nodes)
+        return group
+
+
+    def add_points(self, element: int, pts: np.ndarray) -> SceneObject:
+        """
+        Appends the points of a new object to the point store.
+
+        The points are centered around their bounding box center, which
+        becomes the initial translation of the object.
+
+        Args:
+            element (int): The identifier of the canvas element.
+            pts (np.ndarray): The (n, 2) points of the element in canvas coordinates.
+
+        Returns:
+            SceneObject: The newly added SceneObject.
+        """
+        n = len(pts)
+        center = 0.5 * (pts.min(axis=0) + pts.max(axis=0)) if n else np.zeros(2)
+        slot = self._allocate_slot(element, n, center)
+
+        offset = self._offsets[slot]
+        self._points[offset:offset + n] = pts - center[None, :]
+        self._transformed[offset:offset + n] = pts
+        self._owner[offset:offset + n] = slot
+        if n:
+            self._bounds[slot, :2] = pts.min(axis=0)
+            self._bounds[slot, 2:] = pts.max(axis=0)
+            self._committed_bounds[slot] = self._bounds[slot]
+
+        obj = SceneObject(element, slot, self)
         self.objects[element] = obj
         return obj
-    
+
+
+    def _allocate_slot(self, element: int, num_points: int, translation: np.ndarray) -> int:
+        """Reserve a slot with an identity transform at the given translation."""
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            self._reserve(self._num_slots, self._num_points + num_points)
+            self._elements[slot] = element
+        else:
+            slot = self._num_slots
+            self._reserve(self._num_slots + 1, self._num_points + num_points)
+            self._elements.append(element)
+            self._num_slots += 1
+
+        self._offsets[slot] = self._num_points
+        self._lengths[slot] = num_points
+        self._rotation[slot] = 0.0
+        self._scale[slot] = 1.0
+        self._translation[slot] = translation
+        self._world_stale[slot] = False
+        self._world_rotation[slot] = 0.0
+        self._world_scale[slot] = 1.0
+        self._world_translation[slot] = translation
+        self._linear_stale[slot] = True
+        self._changes[slot] = Change.NONE
+        self._committed_rotation[slot] = 0.0
+        self._committed_scale[slot] = 1.0
+        self._committed_translation[slot] = translation
+        self._bounds[slot] = np.tile(translation, 2)
+        self._committed_bounds[slot] = self._bounds[slot]
+        self._last_used[slot] = self._tick
+
+        self._num_points += num_points
+        return slot
+
+
+    def remove_object(self, element: int | str) -> None:
+        """
+        Stops tracking a node and releases its slot and points.
+
+        The canvas item itself is not touched. Children of a removed group are
+        detached and keep their position.
+
+        Args:
+            element (int | str): The identifier of the node.
+        """
+        node = self.objects.pop(element)
+        self._tags.pop(element, None)
+        if node.parent is not None:
+            node.parent.remove(node)
+        if isinstance(node, SceneGroup):
+            for child in list(node.children):
+                node.remove(child)
+        self.dirty.discard(element)
+        self._culled.discard(element)
+
+        slot = node.slot
+        self._garbage_points += int(self._lengths[slot])
+        self._lengths[slot] = 0
+        self._changes[slot] = Change.NONE
+        self._world_stale[slot] = False
+        self._free_slots.append(slot)
+
+        self._collect_garbage()
+
+
+    def set_points(self, obj: SceneObject, pts: np.ndarray) -> None:
+        """
+        Replaces the points of an object, relative to its translation.
+
+        If the number of points changes, the object's points are moved to the
+        end of the point store and its old points become garbage.
+
+        Args:
+            obj (SceneObject): The object to modify.
+            pts (np.ndarray): The new (n, 2) points.
+        """
+        n = len(pts)
+        slot = obj.slot
+        if n != self._lengths[slot]:
+            self._reserve(self._num_slots, self._num_points + n)
+            self._garbage_points += int(self._lengths[slot])
+            offset = self._num_points
+            self._offsets[slot] = offset
+            self._lengths[slot] = n
+            self._owner[offset:offset + n] = slot
+            self._num_points += n
+        obj.pts[:] = pts
+        obj.invalidate_points()
+        self._collect_garbage()
+
+
+    def _collect_garbage(self) -> None:
+        if self._garbage_points > max(256, self._num_points // 2):
+            self._compact()
+
+
+    def _compact(self) -> None:
+        """Pack the points of all live slots to the front of the point store."""
+        slots = sorted(
+            (obj.slot for obj in self.objects.values() if isinstance(obj, SceneObject)),
+            key=lambda slot: self._offsets[slot]
+        )
+        lengths = self._lengths[slots]
+        index = np.concatenate(
+            [np.arange(self._offsets[slot], self._offsets[slot] + n) for slot, n in zip(slots, lengths)]
+            or [np.empty(0, dtype=np.intp)]
+        )
+        n = len(index)
+        for buffer in (self._points, self._transformed, self._linear):
+            buffer[:n] = buffer[index]
+        self._owner[:n] = np.repeat(np.asarray(slots, dtype=np.intp), lengths)
+        self._offsets[slots] = np.cumsum(lengths) - lengths
+        self._num_points = n
+        self._garbage_points = 0
+
+
+    def sweep(self, pinned: Iterable[int | str] = ()) -> int:
+        """
+        Drops objects of deleted canvas items and evicts least recently used idle objects.
+
+        The members of all tags are re-queried, see `SceneTag.refresh`.
+
+        Objects are idle if they are neither dirty, culled, pinned, attached to
+        a group, nor groups or tags themselves, and have an identity rotation
+        and scale.
+        Idle objects are only evicted while more than `max_objects` objects are
+        tracked. An evicted object is recreated from the item's current
+        coordinates the next time it is animated, which restores its translation
+        but not its rotation and scale, so rotated or scaled objects are kept.
+
+        Args:
+            pinned (Iterable[int | str], optional): Elements that must not be evicted,
+                e.g. targets of running tweens.
+
+        Returns:
+            int: The number of removed objects.
+        """
+        alive = set(self.canvas.find_all())
+        for tag in self._tags.values():
+            tag.refresh()
+        removed = [
+            element for element, obj in self.objects.items()
+            if isinstance(obj, SceneObject) and element not in alive
+        ]
+        for element in removed:
+            self.remove_object(element)
+
+        num_removed = len(removed)
+        if self.max_objects is not None and len(self.objects) > self.max_objects:
+            pinned = set(pinned)
+            idle = [
+                obj for element, obj in self.objects.items()
+                if isinstance(obj, SceneObject) and obj.parent is None
+                and element not in pinned and element not in self.dirty and element not in self._culled
+                and self._rotation[obj.slot] == 0.0 and self._scale[obj.slot] == 1.0
+            ]
+            idle.sort(key=lambda obj: self._last_used[obj.slot])
+            for obj in idle[:len(self.objects) - self.max_objects]:
+                self.remove_object(obj.idx)
+                num_removed += 1
+        return num_removed
+
+
+    def memory_stats(self) -> dict[str, int]:
+        """
+        Sizes of the scene's registries and buffers.
+
+        Returns:
+            dict[str, int]: Number of tracked objects, groups and tags, allocated and
+                free slots, live and garbage points and the total size of all buffers in bytes.
+        """
+        buffers = [value for value in vars(self).values() if isinstance(value, np.ndarray)]
+        return {
+            'objects': sum(isinstance(obj, SceneObject) for obj in self.objects.values()),
+            'groups': sum(isinstance(obj, SceneGroup) for obj in self.objects.values()),
+            'tags': sum(isinstance(obj, SceneTag) for obj in self.objects.values()),
+            'slots': self._num_slots,
+            'free_slots': len(self._free_slots),
+            'points': self._num_points - self._garbage_points,
+            'garbage_points': self._garbage_points,
+            'bytes': sum(buffer.nbytes for buffer in buffers),
+        }
+
+
+    def _reserve(self, num_slots: int, num_points: int) -> None:
+        """Grow the object tables and the point store to the requested sizes."""
+        if num_slots > len(self._offsets):
+            capacity = max(num_slots, 2 * len(self._offsets))
+            k = self._num_slots
+            def grow(a: np.ndarray, fill=None) -> np.ndarray:
+                b = np.empty((capacity,) + a.shape[1:], dtype=a.dtype) if fill is None \
+                    else np.full((capacity,) + a.shape[1:], fill, dtype=a.dtype)
+                b[:k] = a[:k]
+                return b
+            self._offsets     = grow(self._offsets)
+            self._lengths     = grow(self._lengths)
+            self._rotation    = grow(self._rotation)
+            self._scale       = grow(self._scale)
+            self._translation = grow(self._translation)
+            self._slot_dirty  = grow(self._slot_dirty, False)
+            self._slot_linear = np.empty((2, capacity))
+            self._last_used   = grow(self._last_used, 0)
+            self._world_stale       = grow(self._world_stale, False)
+            self._world_rotation    = grow(self._world_rotation)
+            self._world_scale       = grow(self._world_scale)
+            self._world_translation = grow(self._world_translation)
+            self._linear_stale = grow(self._linear_stale, True)
+            self._slot_refresh = np.empty(capacity, dtype=bool)
+            self._changes               = grow(self._changes, 0)
+            self._committed_rotation    = grow(self._committed_rotation)
+            self._committed_scale       = grow(self._committed_scale)
+            self._committed_translation = grow(self._committed_translation)
+            self._bounds           = grow(self._bounds)
+            self._committed_bounds = grow(self._committed_bounds)
+
+        # Keep one spare point so segment ends are valid `reduceat` indices
+        if num_points >= len(self._points):
+            capacity = max(num_points, 2 * len(self._points))
+            n = self._num_points
+            for name in ('_points', '_transformed', '_linear', '_owner'):
+                a = getattr(self, name)
+                b = np.empty((capacity,) + a.shape[1:], dtype=a.dtype)
+                b[:n] = a[:n]
+                setattr(self, name, b)
+            self._point_mask = np.empty((2, capacity), dtype=bool)
+            self._scratch = np.empty((4, capacity))
+
+
+    def _resolve_world(self) -> None:
+        """
+        Recompute cached world transforms of dirty nodes and their subtrees.
+
+        Changes of a group are propagated to its descendants, which are added
+        to the dirty set so they are committed in the same frame.
+        """
+        stale = [
+            self.objects[element]
+            for element in self.dirty
+            if self._world_stale[self.objects[element].slot]
+        ]
+        if not stale:
+            return
+
+        groups: list[SceneGroup] = []
+        for node in stale:
+            # Only start at the topmost stale node of each subtree
+            parent = node.parent
+            while parent is not None and not self._world_stale[parent.slot]:
+                parent = parent.parent
+            if parent is not None:
+                continue
+
+            slot = node.slot
+            if node.parent is None:
+                self._world_rotation[slot] = self._rotation[slot]
+                self._world_scale[slot] = self._scale[slot]
+                self._world_translation[slot] = self._translation[slot]
+            else:
+                self._compose(node.parent.slot, np.array([slot]))
+            self._world_stale[slot] = False
+            if isinstance(node, SceneGroup):
+                groups.append(node)
+
+        while groups:
+            group = groups.pop()
+            slot, children = group.slot, group._child_slots
+            if len(children):
+                self._compose(slot, children)
+                inherited = Change(int(self._changes[slot]))
+                if inherited & (Change.ROTATION | Change.SCALE):
+                    inherited |= Change.TRANSLATION
+                    self._linear_stale[children] = True
+                self._changes[children] |= np.uint8(inherited)
+                self._world_stale[children] = False
+                self.dirty.update(child.idx for child in group.children)
+            self._changes[slot] = Change.NONE
+            groups.extend(child for child in group.children if isinstance(child, SceneGroup))
+
+
+    def _compose(self, parent: int, slots: np.ndarray) -> None:
+        """Compose the world transform of `parent` with the local transforms of `slots`."""
+        rotation = self._world_rotation[parent]
+        scale = self._world_scale[parent]
+        a = np.radians(rotation)
+        c, s = np.cos(a), np.sin(a)
+        R = np.array([[c, -s], [s, c]])
+
+        self._world_rotation[slots] = rotation + self._rotation[slots]
+        self._world_scale[slots] = scale * self._scale[slots]
+        self._world_translation[slots] = self._world_translation[parent] + scale * (self._translation[slots] @ R.T)
+
+
+    def transform_dirty(self) -> list[tuple[int, np.ndarray]]:
+        """
+        Transforms all dirty objects in one vectorized pass over the point store.
+
+        Only the contiguous point range spanned by dirty objects is visited and
+        only points of dirty objects are written. All temporaries live in
+        preallocated scratch buffers.
+
+        Returns:
+            list[tuple[int, np.ndarray]]: Element identifiers and flat views
+                (x0, y0, x1, y1, ...) into the transformed point buffer.
+        """
+        self._resolve_world()
+        elements = self._dirty_items()
+        slots = self._transform(elements)
+        result = []
+        for element, slot in zip(elements, slots):
+            offset = self._offsets[slot]
+            result.append((element, self._transformed[offset:offset + self._lengths[slot]].ravel()))
+        return result
+
+
+    def _transform(self, elements: list[int]) -> list[int]:
+        """Recompute the transformed points of the given elements and return their slots."""
+        if not elements:
+            return []
+
+        slots = [self.objects[element].slot for element in elements]
+        self._slot_dirty[slots] = True
+
+        k = self._num_slots
+        start = min(self._offsets[s] for s in slots)
+        stop = max(self._offsets[s] + self._lengths[s] for s in slots)
+
+        # Refresh the linear part a = s * cos(r), b = s * sin(r) of dirty objects
+        # whose rotation or scale changed
+        refresh = self._slot_refresh[:k]
+        np.logical_and(self._linear_stale[:k], self._slot_dirty[:k], out=refresh)
+        a, b = self._slot_linear[0, :k], self._slot_linear[1, :k]
+        np.radians(self._world_rotation[:k], out=b, where=refresh)
+        np.cos(b, out=a, where=refresh)
+        np.sin(b, out=b, where=refresh)
+        np.multiply(a, self._world_scale[:k], out=a, where=refresh)
+        np.multiply(b, self._world_scale[:k], out=b, where=refresh)
+
+        owner = self._owner[start:stop]
+        mask = self._point_mask[0, start:stop]
+        lmask = self._point_mask[1, start:stop]
+        np.take(self._slot_dirty[:k], owner, out=mask)
+        np.take(refresh, owner, out=lmask)
+
+        x, y = self._points[start:stop, 0], self._points[start:stop, 1]
+        lx, ly = self._linear[start:stop, 0], self._linear[start:stop, 1]
+        ox, oy = self._transformed[start:stop, 0], self._transformed[start:stop, 1]
+        pa, pb, tx, ty = self._scratch[:, start:stop]
+
+        # Translation-only frames skip this and reuse the cached linear part
+        if refresh.any():
+            np.take(a, owner, out=pa)
+            np.take(b, owner, out=pb)
+            # x' = a * x - b * y
+            np.multiply(pb, y, out=tx, where=lmask)
+            np.multiply(pa, x, out=lx, where=lmask)
+            np.subtract(lx, tx, out=lx, where=lmask)
+            # y' = b * x + a * y
+            np.multiply(pa, y, out=ty, where=lmask)
+            np.multiply(pb, x, out=ly, where=lmask)
+            np.add(ly, ty, out=ly, where=lmask)
+            self._linear_stale[slots] = False
+
+        np.take(self._world_translation[:k, 0], owner, out=tx)
+        np.take(self._world_translation[:k, 1], owner, out=ty)
+        np.add(lx, tx, out=ox, where=mask)
+        np.add(ly, ty, out=oy, where=mask)
+
+        self._slot_dirty[slots] = False
+        return slots
+
+
+    def configure_item(self, element: int, options: dict[str, Any]) -> None:
+        """
+        Issues an `itemconfigure` for a canvas element through the command batch.
+
+        Args:
+            element (int): The identifier of the canvas element.
+            options (dict[str, Any]): The options to set.
+        """
+        args = []
+        for key, value in options.items():
+            args += ('-' + key.rstrip('_'), value)
+        self.commands.call(self.canvas, str(self.canvas), 'itemconfigure', element, *args)
+
 
     def update(self):
         """
         Updates the scene by applying transformations to dirty objects on the canvas.
         """
-        for element in self.dirty:
-            new_pts = self.objects[element].get_transformed()
-            self.canvas.coords(element, *new_pts.flatten())
+        path = str(self.canvas)
+        for element in [element for element in self.dirty if isinstance(element, str)]:
+            self._commit_tag(path, self.objects[element])
+            self.dirty.discard(element)
+        self._resolve_world()
+        elements = self._dirty_items()
+        slots = self._transform(elements)
+        self._update_bounds(slots)
+
+        if self.culling and (slots or self._culled):
+            view = self.get_view()
+            # Objects are written if they are visible before or after the change
+            visible = self._intersects(self._bounds[slots], view) | self._intersects(self._committed_bounds[slots], view)
+            for element, slot, is_visible in zip(elements, slots, visible.tolist()):
+                if is_visible:
+                    self._commit(path, element, slot)
+                    self._culled.discard(element)
+                else:
+                    self._culled.add(element)
+
+            # Culled objects that scrolled into view
+            culled = [element for element in self._culled if element not in self.dirty]
+            if culled:
+                culled_slots = [self.objects[element].slot for element in culled]
+                visible = self._intersects(self._bounds[culled_slots], view)
+                for element, slot, is_visible in zip(culled, culled_slots, visible.tolist()):
+                    if is_visible:
+                        self._commit(path, element, slot)
+                        self._culled.discard(element)
+        else:
+            for element, slot in zip(elements, slots):
+                self._commit(path, element, slot)
+
         self.dirty = set()
+        self._tick += 1
+
+
+    def flush_culled(self) -> None:
+        """Write all objects whose transform was not committed because they were culled."""
+        path = str(self.canvas)
+        for element in self._culled:
+            self._commit(path, element, self.objects[element].slot)
+        self._culled.clear()
+
+
+    def get_view(self) -> tuple[float, float, float, float]:
+        """
+        The visible region of the canvas, grown by `cull_margin`.
+
+        Returns:
+            tuple[float, float, float, float]: (xmin, ymin, xmax, ymax) in canvas coordinates.
+        """
+        canvas = self.canvas
+        m = self.cull_margin
+        x0, y0 = canvas.canvasx(0), canvas.canvasy(0)
+        return x0 - m, y0 - m, x0 + canvas.winfo_width() + m, y0 + canvas.winfo_height() + m
+
+    @staticmethod
+    def _intersects(bounds: np.ndarray, view: tuple[float, float, float, float]) -> np.ndarray:
+        x0, y0, x1, y1 = view
+        return (bounds[:, 2] >= x0) & (bounds[:, 0] <= x1) & (bounds[:, 3] >= y0) & (bounds[:, 1] <= y1)
+
+
+    def _update_bounds(self, slots: list[int]) -> None:
+        """Recompute the bounding boxes of the given slots from the transformed points."""
+        slots = [slot for slot in slots if self._lengths[slot]]
+        if not slots:
+            return
+        slots.sort(key=lambda slot: self._offsets[slot])
+        # reduceat over interleaved (start, end) indices reduces each object's segment
+        index = np.empty(2 * len(slots), dtype=np.intp)
+        index[0::2] = self._offsets[slots]
+        index[1::2] = index[0::2] + self._lengths[slots]
+        n = self._num_points + 1
+        for axis in (0, 1):
+            values = self._transformed[:n, axis]
+            self._bounds[slots, axis] = np.minimum.reduceat(values, index)[0::2]
+            self._bounds[slots, axis + 2] = np.maximum.reduceat(values, index)[0::2]
+
+
+    def _dirty_items(self) -> list[int]:
+        """Dirty nodes that correspond to canvas items, i.e. neither groups nor tags."""
+        return [element for element in self.dirty if not isinstance(element, str) and element >= 0]
+
+
+    def _commit_tag(self, path: str, tag: SceneTag) -> None:
+        """Write the transform of a tag with tag-wide `scale` and `move` commands."""
+        slot = tag.slot
+        self._changes[slot] = Change.NONE
+        self._world_stale[slot] = False
+        self._world_scale[slot] = self._scale[slot]
+        self._world_translation[slot] = self._translation[slot]
+
+        # Tagged items are mapped by p -> c + k * (p - c) + d
+        c = self._committed_translation[slot].copy()
+        d = self._translation[slot] - c
+        committed_scale = self._committed_scale[slot]
+        k = float(self._scale[slot] / committed_scale) if committed_scale != 0 else 1.0
+        if k != 1.0:
+            self.commands.call(self.canvas, path, 'scale', tag.idx, *c.tolist(), k, k)
+        if d.any():
+            self.commands.call(self.canvas, path, 'move', tag.idx, *d.tolist())
+        self._committed_scale[slot] = self._scale[slot]
+        self._committed_translation[slot] = self._translation[slot]
+
+        if k == 1.0 and not d.any():
+            return
+        for element in tag.members:
+            node = self.objects.get(element)
+            if node is None or node.parent is not None:
+                continue
+            m = node.slot
+            for translation in (self._translation, self._world_translation, self._committed_translation):
+                translation[m] = c + k * (translation[m] - c) + d
+            for scale in (self._scale, self._world_scale, self._committed_scale):
+                scale[m] *= k
+            self._linear_stale[m] = True
+
+
+    def _commit(self, path: str, element: int, slot: int) -> None:
+        """Write the transform of one element to the canvas using the cheapest Tk command."""
+        changes = self._changes[slot]
+        self._changes[slot] = Change.NONE
+        translation = self._world_translation[slot]
+        committed = self._committed_translation[slot]
+
+        if changes == Change.TRANSLATION:
+            dx, dy = (translation - committed).tolist()
+            if dx or dy:
+                self.commands.call(self.canvas, path, 'move', element, dx, dy)
+            committed[:] = translation
+        elif changes == Change.SCALE and self._committed_scale[slot] != 0:
+            factor = float(self._world_scale[slot] / self._committed_scale[slot])
+            if factor != 1.0:
+                x, y = translation.tolist()
+                self.commands.call(self.canvas, path, 'scale', element, x, y, factor, factor)
+            self._committed_scale[slot] = self._world_scale[slot]
+        else:
+            offset = self._offsets[slot]
+            coords = self._transformed[offset:offset + self._lengths[slot]].ravel()
+            self.commands.call(self.canvas, path, 'coords', element, *coords.tolist())
+            self._committed_rotation[slot] = self._world_rotation[slot]
+            self._committed_scale[slot] = self._world_scale[slot]
+            committed[:] = translation
+        self._committed_bounds[slot] = self._bounds[slot]
@@ -1,16 +1,25 @@
 from __future__ import annotations
 
+import bisect
+import collections
+import enum
 import time
 import tkinter as tk
 import uuid
+import weakref
 from typing import Callable, Optional
 
-from .base import ObjectId, TweenAble, TweenAnimator
-from .easing import Easing, get_easing, get_inverse_easing
-from .scene import Scene
+import numpy as np
+
+from .base import ConflictPolicy, ObjectId, TweenAble, TweenAnimator
+from .batch import CommandBatch
+from .easing import EasingType, get_easing, get_easing_table, get_inverse_easing, resolve_easing
+from .scene import Scene, SceneGroup
 
 __all__ = [
     'AnimationBlock',
+    'CompiledTimeline',
+    'Priority',
     'TweenHandle',
     'Tween',
     'CanvasTween'
@@ -25,6 +34,20 @@ def get_looped_frame_id(frame_id:int, num_frames:int) -> tuple[int, bool]:
     return frame_id, reversed
 
 
+class Priority(enum.IntEnum):
+    """
+    Scheduling priority of a running tween.
+
+    HIGH tweens are stepped every frame. NORMAL tweens are skipped once the
+    director's frame budget is used up. LOW tweens are additionally stepped at
+    a reduced rate while frames run over budget. Skipped tweens catch up to the
+    correct time when they are next stepped.
+    """
+    LOW = 0
+    NORMAL = 1
+    HIGH = 2
+
+
 class AnimationBlock:
     """
     A block of animations to be processed grouped together.
@@ -33,7 +56,7 @@ class AnimationBlock:
         animators (list[TweenAnimator]): List of animators to be used in block.
         duration (float): Number of frames specifying block's duration.
         offset (float): Number of frames specifying block's offset.
-        easing (Easing | None): An easing function applied to block. If None, no easing applied.
+        easing (EasingType): An easing applied to block. If None, no easing applied.
         uid (uuid.UUID): A unique identifier for animation block.
     """
 
@@ -42,22 +65,23 @@ class AnimationBlock:
         animators:  list[TweenAnimator],
         duration:   float,
         offset:     float,
-        easing:     Easing | None
+        easing:     EasingType
     ) -> None:
         self.animators = animators
         self.time_duration = duration 
         self.time_offset = offset
-        self.easing_type = easing
-        self.easing = get_easing(easing)
+        # Resolved once, so equal curves given by name or CSS string share easing tables
+        self.easing_type = resolve_easing(easing)
+        self.easing = get_easing(self.easing_type)
 
     @property
     def duration(self) -> int:
-        return int(round(self.time_duration * TweenDirector.get().fps))
+        return int(round(self.time_duration * TweenDirector.get().effective_fps))
 
     
     @property
     def offset(self) -> int:
-        return int(round(self.time_offset * TweenDirector.get().fps))
+        return int(round(self.time_offset * TweenDirector.get().effective_fps))
 
     def finalize(self, handle:TweenHandle):
         """
@@ -70,20 +94,167 @@ class AnimationBlock:
             animator.finalize(handle.widget, handle.id)
 
 
+class CompiledTimeline:
+    """
+    An immutable, frame-based view of a tween's animation sequence for one frame rate.
+
+    Block offsets and durations are rounded to frames once. A sweep over the
+    block boundaries precomputes the set of active blocks for every segment
+    between consecutive boundaries, and blocks are indexed by start and end
+    frame. Processing a frame therefore only visits blocks that are active or
+    were entered/exited since the previous frame. Easing a frame is a lookup
+    in the block's easing table, see `get_easing_table`.
+
+    Attributes:
+        fps (int): The frame rate the timeline was compiled for.
+        blocks (tuple[AnimationBlock, ...]): The animation blocks.
+        offsets (tuple[int, ...]): Offset of each block in frames.
+        durations (tuple[int, ...]): Duration of each block in frames.
+        num_frames (int): Total number of frames.
+        tables (tuple[np.ndarray, ...]): Eased progress of each block at each of its frames.
+    """
+    __slots__ = ('fps', 'blocks', 'offsets', 'durations', 'num_frames', 'tables', '_boundaries', '_active', '_starts', '_ends')
+
+    def __init__(self, blocks: list[AnimationBlock], fps: int) -> None:
+        self.fps = fps
+        self.blocks = tuple(blocks)
+        self.offsets = tuple(int(round(block.time_offset * fps)) for block in blocks)
+        self.durations = tuple(int(round(block.time_duration * fps)) for block in blocks)
+        self.num_frames = max((o + d for o, d in zip(self.offsets, self.durations)), default=0)
+        self.tables = tuple(get_easing_table(block.easing_type, d) for block, d in zip(blocks, self.durations))
+
+        # Blocks are active on the closed frame interval [offset, offset + duration]
+        boundaries = sorted({o for o in self.offsets} | {o + d + 1 for o, d in zip(self.offsets, self.durations)})
+        self._boundaries = tuple(boundaries)
+        self._active = tuple(
+            tuple(i for i, (o, d) in enumerate(zip(self.offsets, self.durations)) if o <= b <= o + d)
+            for b in boundaries
+        )
+        self._starts = tuple(sorted((o, i) for i, o in enumerate(self.offsets)))
+        self._ends = tuple(sorted((o + d, i) for i, (o, d) in enumerate(zip(self.offsets, self.durations))))
+
+
+    def active(self, frame_id: int) -> tuple[int, ...]:
+        """Indices of the blocks active at the given frame."""
+        segment = bisect.bisect_right(self._boundaries, frame_id) - 1
+        return self._active[segment] if segment >= 0 else ()
+
+
+    def sample(self, frame_id: int, last_frame_id: int, reversed: bool = False) -> list[tuple[int, int]]:
+        """
+        Collect the blocks to process in a frame and the frame within each block.
+
+        Blocks active at `frame_id` report their relative frame. Blocks whose
+        end (or, when playing in reverse, start) was skipped since `last_frame_id`
+        report their last (first) frame so they settle on their final state.
+
+        Args:
+            frame_id (int): The frame relative to the start of the tween.
+            last_frame_id (int): The previously processed frame.
+            reversed (bool, optional): Whether the timeline is played backwards. Defaults to False.
+
+        Returns:
+            list[tuple[int, int]]: Block indices and frames within the blocks, i.e.
+                indices into `tables`.
+        """
+        samples = [(i, frame_id - self.offsets[i]) for i in self.active(frame_id)]
+
+        if not reversed:
+            lo = bisect.bisect_right(self._ends, (last_frame_id, len(self.blocks)))
+            hi = bisect.bisect_left(self._ends, (frame_id, -1))
+            samples.extend((i, self.durations[i]) for _, i in self._ends[lo:hi])
+        else:
+            lo = bisect.bisect_right(self._starts, (frame_id, len(self.blocks)))
+            hi = bisect.bisect_left(self._starts, (last_frame_id, -1))
+            samples.extend((i, 0) for _, i in self._starts[lo:hi])
+        return samples
+
+
 class TweenHandle(object):
     def __init__(
         self,
         widget:tk.Widget,
         tween:Tween,
-        loop:bool
+        loop:bool,
+        priority:Priority=Priority.NORMAL,
+        fps:Optional[int]=None
     ) -> None:
         self.widget = widget
         self.tween = tween
         self.loop = loop
-        self.frame_0 = None
+        self.priority = Priority(priority)
+        self.fps = fps
+        self.start_time: float | None = None
+        self.last_time: float | None = None
+        self.suspended_at: float | None = None
+        self.muted: set[TweenAnimator] = set()
+        self.progress: dict[TweenAnimator, float] = {}
+        self.blocked_by: set[uuid.UUID] = set()
         self.id = uuid.uuid4()
 
 
+    @property
+    def suspended(self) -> bool:
+        """True while the tween is paused because its target is not visible."""
+        return self.suspended_at is not None
+
+
+    def get_target_widget(self) -> tk.Widget:
+        """The widget whose visibility decides whether the tween is stepped."""
+        return self.widget[0] if isinstance(self.widget, tuple) else self.widget
+
+
+    def suspend(self, now: float) -> None:
+        """Stop advancing the tween's timeline at clock time `now`."""
+        if self.suspended_at is None:
+            self.suspended_at = now
+
+
+    def resume(self, now: float) -> None:
+        """Continue the tween's timeline where it was suspended."""
+        if self.suspended_at is None:
+            return
+        shift = now - self.suspended_at
+        if self.start_time is not None:
+            self.start_time += shift
+        if self.last_time is not None:
+            self.last_time += shift
+        self.suspended_at = None
+
+
+    def retarget(self, **kwargs) -> int:
+        """
+        Change the end values of the running animators without restarting the tween.
+
+        Every running animator continues from its current state and reaches the
+        new end values when it would have reached the old ones, keeping its
+        easing. Animators of blocks that have not started yet are not affected.
+
+        Only the position is continuous: the remaining eased progress is stretched
+        over the new distance, so the velocity jumps by the ratio of the new to the
+        old remaining distance and changes sign if the new end lies behind the
+        current state. Retarget to nearby end values, or start a new tween with an
+        ease-in, where a visible kink matters.
+
+        Args:
+            **kwargs: New end values, named like the arguments of the animators,
+                e.g. `x`/`y` for `widgets.Translate` or `end_color` for color animators.
+
+        Returns:
+            int: Number of retargeted animators.
+        """
+        count = 0
+        for animator in self.tween.get_animators():
+            if animator in self.muted or self.id not in animator.animation_data:
+                continue
+            data = animator.animation_data[self.id]
+            new_data = animator.retarget(data, self.progress.get(animator, 0.0), **kwargs)
+            if new_data is not data:
+                animator.animation_data[self.id] = new_data
+                count += 1
+        return count
+
+
     def cancel(self, revert:bool=False) -> bool:
         """Cancel the tween represented by this handle
 
@@ -97,16 +268,82 @@ class TweenHandle(object):
 class TweenDirector(object):
     """
     Singleton class that manages Tweens and handles animations.
+
+    Attributes:
+        commands (CommandBatch): Per-frame command buffer. All animator and scene
+            writes issued during a frame are evaluated as one Tcl call at its end.
+        fps (int): Frames per second. With `adaptive_fps` this is the highest rate used.
+        adaptive_fps (bool): Whether the frame rate is lowered while frames exceed their time budget.
+        fps_steps (tuple[int, ...]): Frame rates the governor steps through below `fps`.
+        frame_cost (float): Smoothed time spent processing a frame in seconds.
+        clock (Callable[[], float]): Monotonic clock in seconds used to pace frames.
+            Defaults to `time.perf_counter`.
+        num_frames (int): Number of processed frames.
+        late_frames (int): Number of frames that started more than half a frame interval after their due time.
+        dropped_frames (int): Number of frames that were skipped because the previous frames ran late.
+        max_lateness (float): Largest delay of a frame behind its due time in seconds.
+        frame_budget (float | None): Time in seconds tweens may be stepped for in one frame before
+            tweens below `Priority.HIGH` are skipped. Defaults to 75% of the frame interval if None.
+        low_priority_interval (int): While frames run over budget, `Priority.LOW` tweens are only
+            stepped every n-th frame.
+        skipped_steps (int): Number of tween steps skipped because of the frame budget.
+        conflict_policy (ConflictPolicy): What happens when a tween starts animating a property of a
+            target that is already animated by another running tween: 'override' stops the older
+            tween's animators of that property, 'queue' delays the new tween until the older one
+            finished and 'parallel' keeps both running. Parallel tweens do not blend, each writes the
+            property on its own and the one stepped last in a frame wins.
+        callback_budget (float): Time in seconds finished-tween callbacks may run for in one idle
+            slice. Callbacks run after the frame, remaining callbacks are deferred to the next slice.
+        profile_callbacks (bool): Whether to record the run time of each callback, see `callback_stats`.
+        suspend_hidden (bool): Whether tweens on unmapped or fully obscured targets are suspended.
+            Suspended tweens keep their timeline position and the heartbeat pauses while
+            no visible tween remains. Tweens are always stepped once before their target's
+            visibility is checked, so tweens that map their own target still run.
+        sweep_interval (int): Number of frames between sweeps of the scenes, see `Scene.sweep`.
+        max_scene_objects (int | None): `Scene.max_objects` of newly created scenes.
     """
     _instance:TweenDirector = None
     
     def __init__(self):
         self._active_tweens: dict[uuid.UUID, TweenHandle] = {}
+        self._by_target: dict[str | tuple[str, ObjectId | str], dict[uuid.UUID, TweenHandle]] = {}
+        self._by_tween: dict[Tween, dict[uuid.UUID, TweenHandle]] = {}
+        self._owners: dict[tuple[str | tuple[str, ObjectId | str], str], TweenHandle] = {}
+        self._waiters: dict[uuid.UUID, set[TweenHandle]] = {}
+        self.conflict_policy: ConflictPolicy = 'override'
         self._after_id: int | None = None
         self._root: tk.Tk | None = None
-        self._scenes: dict[tk.Canvas, Scene] = {}
+        self._scenes: weakref.WeakKeyDictionary[tk.Canvas, Scene] = weakref.WeakKeyDictionary()
         self._callbacks: dict[uuid.UUID, Callable[[TweenHandle], None]] = {}
+        self._callback_queue: collections.deque[tuple[Callable[[TweenHandle], None], TweenHandle]] = collections.deque()
+        self._drain_id: str | None = None
+        self._callback_stats: dict[str, list[float]] = {}
+        self.callback_budget: float = 0.005
+        self.profile_callbacks: bool = False
+        self._frames_since_sweep: int = 0
+        self.commands = CommandBatch()
+        self.clock: Callable[[], float] = time.perf_counter
         self.fps: int = 30
+        self.adaptive_fps: bool = False
+        self.fps_steps: tuple[int, ...] = (60, 30, 20, 15)
+        self.frame_cost: float = 0.0
+        self._fps_level: int = 0
+        self._frames_at_level: int = 0
+        self.num_frames: int = 0
+        self.late_frames: int = 0
+        self.dropped_frames: int = 0
+        self.max_lateness: float = 0.0
+        self.frame_budget: float | None = None
+        self.low_priority_interval: int = 3
+        self.skipped_steps: int = 0
+        self._over_budget: bool = False
+        self._heartbeat_fps: int | None = None
+        self.suspend_hidden: bool = True
+        self._visibility_bound: bool = False
+        self._visibility_dirty: bool = True
+        self._obscured: set[str] = set()
+        self.sweep_interval: int = 150
+        self.max_scene_objects: int | None = 10000
 
     @property
     def root(self) -> tk.Tk:
@@ -130,46 +367,415 @@ class TweenDirector(object):
         """
         self._root = root
 
+    @property
+    def effective_fps(self) -> int:
+        """
+        The frame rate frames are currently produced at.
+
+        Returns:
+            int: `fps`, or the rate selected by the governor if `adaptive_fps` is enabled.
+        """
+        if not self.adaptive_fps:
+            return self.fps
+        levels = self._fps_levels()
+        return levels[min(self._fps_level, len(levels) - 1)]
+
+    def _fps_levels(self) -> list[int]:
+        return [self.fps] + sorted((f for f in self.fps_steps if f < self.fps), reverse=True)
+
+    def _govern(self, cost: float) -> bool:
+        """
+        Update the smoothed frame cost and step the frame rate if needed.
+
+        The rate is lowered when frames use more than 80% of their budget and
+        raised when the cost would fit into half of the budget at the next
+        higher rate. A level is kept for at least half a second.
+
+        Args:
+            cost (float): Processing time of the last frame in seconds.
+
+        Returns:
+            bool: True if the effective frame rate changed.
+        """
+        self.frame_cost = cost if self.num_frames <= 1 else 0.9 * self.frame_cost + 0.1 * cost
+        if not self.adaptive_fps:
+            return False
+
+        levels = self._fps_levels()
+        level = min(self._fps_level, len(levels) - 1)
+        self._frames_at_level += 1
+        if self._frames_at_level < levels[level] / 2:
+            return False
+
+        if self.frame_cost > 0.8 / levels[level] and level + 1 < len(levels):
+            level += 1
+        elif level > 0 and self.frame_cost < 0.5 / levels[level - 1]:
+            level -= 1
+        else:
+            return False
+        self._fps_level = level
+        self._frames_at_level = 0
+        return True
+
     @classmethod
     def get(cls):
         if cls._instance is None:
             cls._instance = TweenDirector()
         return cls._instance
 
-    def start_animation(self, widget: tk.Widget, tween: Tween, loop:bool):
+    def start_animation(
+        self,
+        widget: tk.Widget,
+        tween: Tween,
+        loop:bool,
+        priority:Priority=Priority.NORMAL,
+        fps:Optional[int]=None,
+        conflict:Optional[ConflictPolicy]=None
+    ):
         """
         Start the animation by creating a TweenHandle, storing it, and scheduling the first animation frame.
 
         Args:
             widget (tk.Widget): Target widget of the tween.
             tween (Tween): Tween object.
+            loop (bool): Whether to loop the animation.
+            priority (Priority, optional): Scheduling priority. Defaults to Priority.NORMAL.
+            fps (int | None, optional): Frame rate of the tween. Defaults to the director's rate.
+            conflict (ConflictPolicy | None, optional): Policy for properties already animated
+                by other tweens. Defaults to `conflict_policy`.
+
+        Raises:
+            ValueError: If the tween rotates a canvas tag, which Tk cannot do.
         """
-        tween_handle = TweenHandle(widget, tween, loop)
-        self._active_tweens[tween_handle.id] = tween_handle
+        if isinstance(widget, tuple) and isinstance(widget[1], str):
+            if 'rotation' in tween.get_properties():
+                raise ValueError(f"Canvas tag {widget[1]!r} cannot be rotated, use Scene.create_group instead")
+            tag = self.get_scene(widget[0]).objects.get(widget[1])
+            if tag is not None:
+                # Items may have been tagged since the tag was last animated
+                tag.refresh()
+        tween_handle = TweenHandle(widget, tween, loop, priority, fps)
+        self._register(tween_handle)
+        self._claim_properties(tween_handle, conflict or self.conflict_policy)
+        self._visibility_dirty = True
+        self._bind_visibility()
+        if self._after_id is not None and self.get_handle_fps(tween_handle) > self._heartbeat_fps:
+            # The heartbeat runs too slow for the new tween, restart it at the higher rate
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
         if self._after_id is None:
-            self._after_id = self.root.after_idle(self._animation_heartbeat, time.time(), -1)
+            self._heartbeat_fps = self._get_heartbeat_fps()
+            self._after_id = self.root.after_idle(self._animation_heartbeat, self.clock(), -1, self._heartbeat_fps)
         return tween_handle
 
+    def get_handle_fps(self, handle:TweenHandle) -> int:
+        """
+        Get the frame rate a tween is stepped at.
+
+        Args:
+            handle (TweenHandle): Handle of the tween.
+
+        Returns:
+            int: The handle's own rate, limited to `effective_fps`, or `effective_fps` if it has none.
+        """
+        fps = self.effective_fps
+        return min(handle.fps, fps) if handle.fps else fps
+
+    def _get_heartbeat_fps(self) -> int:
+        """The rate of the fastest active tween, i.e. the rate the heartbeat has to run at."""
+        return max(
+            (self.get_handle_fps(h) for h in self._active_tweens.values() if not h.suspended),
+            default=self.effective_fps
+        )
+
+    def _bind_visibility(self) -> None:
+        """Track map and visibility changes of all widgets of the application."""
+        if self._visibility_bound or not self.suspend_hidden:
+            return
+        self._visibility_bound = True
+        # Unmapping a parent does not send <Unmap> to its children, so listen on all widgets
+        for sequence in ('<Map>', '<Unmap>', '<Visibility>'):
+            self.root.bind_all(sequence, self._on_visibility_event, add='+')
+
+    def _on_visibility_event(self, event: tk.Event) -> None:
+        if event.type == tk.EventType.Visibility:
+            if event.state == 'VisibilityFullyObscured':
+                self._obscured.add(str(event.widget))
+            else:
+                self._obscured.discard(str(event.widget))
+        self._visibility_dirty = True
+        if self._after_id is None and self._active_tweens:
+            # The heartbeat was paused because all tweens were suspended
+            self._heartbeat_fps = self._get_heartbeat_fps()
+            self._after_id = self.root.after_idle(self._animation_heartbeat, self.clock(), -1, self._heartbeat_fps)
+
+    def _is_visible(self, widget: tk.Widget) -> bool:
+        if str(widget) in self._obscured:
+            return False
+        try:
+            return bool(widget.winfo_viewable())
+        except tk.TclError:
+            return True
+
+    def _update_visibility(self, now: float) -> None:
+        """Suspend tweens on hidden targets and resume tweens whose target became visible."""
+        self._visibility_dirty = False
+        visible: dict[str, bool] = {}
+        for handle in self._active_tweens.values():
+            if handle.last_time is None:
+                # The tween's own first step may be what maps its target, e.g. by
+                # placing a widget. Check it once it was stepped
+                if not handle.blocked_by:
+                    self._visibility_dirty = True
+                continue
+            widget = handle.get_target_widget()
+            key = str(widget)
+            if key not in visible:
+                visible[key] = not self.suspend_hidden or self._is_visible(widget)
+            if visible[key]:
+                handle.resume(now)
+            else:
+                handle.suspend(now)
+
+    @staticmethod
+    def _target_key(target: TweenAble) -> str | tuple[str, ObjectId | str]:
+        """Hashable key of a target, widget path names identify widgets without Tcl calls."""
+        if isinstance(target, tuple):
+            canvas, element = target
+            if isinstance(element, SceneGroup):
+                element = element.idx
+            return str(canvas), element
+        return str(target)
+
+    def _register(self, handle:TweenHandle) -> None:
+        self._active_tweens[handle.id] = handle
+        self._by_target.setdefault(self._target_key(handle.widget), {})[handle.id] = handle
+        self._by_tween.setdefault(handle.tween, {})[handle.id] = handle
+
+    def _unregister(self, handle_id:uuid.UUID) -> TweenHandle:
+        handle = self._active_tweens.pop(handle_id)
+        target = self._target_key(handle.widget)
+        for index, key in ((self._by_target, target), (self._by_tween, handle.tween)):
+            handles = index[key]
+            del handles[handle_id]
+            if not handles:
+                del index[key]
+
+        for prop in handle.tween.get_properties():
+            if self._owners.get((target, prop)) is handle:
+                del self._owners[target, prop]
+        for blocker in handle.blocked_by:
+            self._waiters.get(blocker, set()).discard(handle)
+        for waiter in self._waiters.pop(handle_id, ()):
+            waiter.blocked_by.discard(handle_id)
+            self._visibility_dirty = True
+        return handle
+
+    def _claim_properties(self, handle:TweenHandle, policy:ConflictPolicy) -> None:
+        """
+        Make a new handle the owner of the properties its tween animates and resolve conflicts.
+
+        Args:
+            handle (TweenHandle): The new handle.
+            policy (ConflictPolicy): How to treat the previous owners of the properties.
+        """
+        if policy not in ('override', 'parallel', 'queue'):
+            raise ValueError(f"Unknown conflict policy '{policy}'")
+        target = self._target_key(handle.widget)
+        conflicts: dict[TweenHandle, set[str]] = {}
+        for prop in handle.tween.get_properties():
+            owner = self._owners.get((target, prop))
+            if owner is not None and owner is not handle:
+                conflicts.setdefault(owner, set()).add(prop)
+            self._owners[target, prop] = handle
+
+        for owner, props in conflicts.items():
+            if policy == 'queue':
+                handle.blocked_by.add(owner.id)
+                self._waiters.setdefault(owner.id, set()).add(handle)
+            elif policy == 'override':
+                animators = owner.tween.get_properties()
+                overridden = set().union(*(animators[prop] for prop in props))
+                if overridden | owner.muted >= owner.tween.get_animators():
+                    self.cancel_tween(owner, revert=False)
+                    continue
+                for animator in overridden - owner.muted:
+                    animator.finalize(owner.widget, owner.id)
+                owner.muted |= overridden
+
     def cancel_tween(self, handle:TweenHandle, revert:bool) -> bool:
         if handle.id not in self._active_tweens:
             return False
         
-        if self._active_tweens.pop(handle.id) != handle:
+        if self._unregister(handle.id) != handle:
             raise RuntimeError("Tween UIDs are mixed up")
         handle.tween.cancel(handle, revert)
         return True
 
-    def is_active(self, tween:Tween, widget: tk.Widget) -> bool:
-        return any(
-            h.tween == tween and h.widget.winfo_id() == widget.winfo_id()  
-            for h in self._active_tweens.values()
-        )
+    def cancel_all(self, target: TweenAble, revert:bool=False) -> int:
+        """
+        Cancel all tweens running on a target.
+
+        Args:
+            target (TweenAble): A widget or a (canvas, item or tag) tuple.
+            revert (bool, optional): Whether to revert the targets to their initial state. Defaults to False.
+
+        Returns:
+            int: Number of canceled tweens.
+        """
+        handles = self.handles_for(target)
+        for handle in handles:
+            self.cancel_tween(handle, revert)
+        return len(handles)
+
+    def handles_for(self, target: TweenAble) -> list[TweenHandle]:
+        """
+        Get the handles of all tweens running on a target.
+
+        Args:
+            target (TweenAble): A widget or a (canvas, item or tag) tuple.
+
+        Returns:
+            list[TweenHandle]: The running handles.
+        """
+        return list(self._by_target.get(self._target_key(target), {}).values())
+
+    def handles_of(self, tween:Tween) -> list[TweenHandle]:
+        """
+        Get the handles of all running instances of a tween.
+
+        Args:
+            tween (Tween): The tween.
+
+        Returns:
+            list[TweenHandle]: The running handles.
+        """
+        return list(self._by_tween.get(tween, {}).values())
+
+    def is_active(self, tween:Tween, widget: TweenAble) -> bool:
+        handles = self._by_target.get(self._target_key(widget))
+        return handles is not None and any(h.tween is tween for h in handles.values())
 
     def get_scene(self, canvas:tk.Canvas) -> Scene:
         if canvas not in self._scenes:
-            self._scenes[canvas] = Scene(canvas)
+            self._scenes[canvas] = Scene(canvas, self.commands, max_objects=self.max_scene_objects)
+            canvas_ref = weakref.ref(canvas)
+            canvas.bind('<Destroy>', lambda event: self._drop_scene(canvas_ref), add='+')
         return self._scenes[canvas]
 
+    def _drop_scene(self, canvas_ref: weakref.ref[tk.Canvas]) -> None:
+        """Forget the scene of a destroyed canvas and cancel all tweens running on it."""
+        canvas = canvas_ref()
+        if canvas is None or self._scenes.pop(canvas, None) is None:
+            return
+        for handle in list(self._active_tweens.values()):
+            if isinstance(handle.widget, tuple) and handle.widget[0] is canvas:
+                self.cancel_tween(handle, revert=False)
+
+    def sweep_scenes(self) -> None:
+        """Sweep all scenes, keeping the objects targeted by running tweens."""
+        pinned: dict[tk.Canvas, set[ObjectId | str]] = {}
+        for handle in self._active_tweens.values():
+            if isinstance(handle.widget, tuple):
+                canvas, element = handle.widget
+                pinned.setdefault(canvas, set()).add(element)
+        for canvas, scene in list(self._scenes.items()):
+            scene.sweep(pinned.get(canvas, ()))
+
+    def memory_stats(self) -> dict[str, int]:
+        """
+        Sizes of the director's registries, summed over all scenes.
+
+        Returns:
+            dict[str, int]: Number of active tweens, callbacks and scenes and the
+                summed `Scene.memory_stats` of all scenes.
+        """
+        stats = {
+            'active_tweens': len(self._active_tweens),
+            'callbacks': len(self._callbacks),
+            'queued_callbacks': len(self._callback_queue),
+            'scenes': len(self._scenes),
+        }
+        for scene in list(self._scenes.values()):
+            for key, value in scene.memory_stats().items():
+                stats[key] = stats.get(key, 0) + value
+        return stats
+
+    def frame_stats(self) -> dict[str, int | float]:
+        """
+        Frame pacing statistics since the last `reset_frame_stats`.
+
+        Returns:
+            dict[str, int | float]: Number of processed, late and dropped frames,
+                the maximum lateness in seconds and the number of skipped tween steps.
+        """
+        return {
+            'frames': self.num_frames,
+            'late_frames': self.late_frames,
+            'dropped_frames': self.dropped_frames,
+            'max_lateness': self.max_lateness,
+            'skipped_steps': self.skipped_steps,
+        }
+
+    def reset_frame_stats(self) -> None:
+        """Reset the frame pacing statistics."""
+        self.num_frames = 0
+        self.late_frames = 0
+        self.dropped_frames = 0
+        self.max_lateness = 0.0
+        self.skipped_steps = 0
+
+    def callback_stats(self) -> dict[str, dict[str, int | float]]:
+        """
+        Run times of finished-tween callbacks, recorded while `profile_callbacks` is enabled.
+
+        Returns:
+            dict[str, dict[str, int | float]]: Number of calls, total and maximum run time
+                in seconds per callback, keyed by the callback's qualified name.
+        """
+        return {
+            name: {'calls': int(calls), 'total': total, 'max': longest}
+            for name, (calls, total, longest) in self._callback_stats.items()
+        }
+
+    def reset_callback_stats(self) -> None:
+        """Forget the recorded callback run times."""
+        self._callback_stats.clear()
+
+    def _queue_callbacks(self, handle:TweenHandle) -> None:
+        """Queue the callbacks of a finished tween and make sure the queue gets drained."""
+        self._callback_queue.extend((callback, handle) for callback in handle.tween._callbacks.values())
+        self._callback_queue.extend((callback, handle) for callback in self._callbacks.values())
+        if self._callback_queue and self._drain_id is None:
+            self._drain_id = self.root.after_idle(self._drain_callbacks)
+
+    def _drain_callbacks(self) -> None:
+        """Run queued callbacks until the queue is empty or `callback_budget` is used up."""
+        self._drain_id = None
+        start = self.clock()
+        try:
+            while self._callback_queue:
+                callback, handle = self._callback_queue.popleft()
+                if self.profile_callbacks:
+                    t = self.clock()
+                    callback(handle)
+                    self._record_callback(callback, self.clock() - t)
+                else:
+                    callback(handle)
+                if self.clock() - start > self.callback_budget:
+                    break
+        finally:
+            if self._callback_queue and self._drain_id is None:
+                # Let Tk handle events and frames before running the rest
+                self._drain_id = self.root.after_idle(self._drain_callbacks)
+
+    def _record_callback(self, callback: Callable[[TweenHandle], None], duration: float) -> None:
+        name = getattr(callback, '__qualname__', None) or repr(callback)
+        stats = self._callback_stats.setdefault(name, [0, 0.0, 0.0])
+        stats[0] += 1
+        stats[1] += duration
+        stats[2] = max(stats[2], duration)
+
     def add_callback(self, callback: Callable[[TweenHandle], None]) -> uuid.UUID:
         uid = uuid.uuid4()
         self._callbacks[uid] = callback
@@ -178,43 +784,163 @@ class TweenDirector(object):
     def remove_callback(self, uid:uuid.uuid4) -> None:
         self._callbacks.pop(uid)
 
-    def _animation_heartbeat(self, t0: float, last_frame_id:int):
+    def _animation_heartbeat(self, t0: float, last_frame_id:int, fps:int):
         """
         Handle one animation frame, updating all active tweens.
 
+        Frames are due at `t0 + frame_id / fps` on `clock`. Every frame is
+        scheduled against its absolute due time, so jitter of `after` does not
+        accumulate. Frames that are already over when the heartbeat runs are
+        skipped and counted as dropped. Tweens are advanced by time, so changes
+        of the frame rate do not affect their timing.
+
+        The heartbeat runs at the rate of the fastest active tween. Tweens with
+        a lower rate are only stepped when their own frame changes.
+
+        Tcl errors raised while stepping tweens or flushing the frame's commands
+        cancel the tweens whose target widget was destroyed. Other errors are
+        raised, but the next frame is scheduled nonetheless.
+
         Args:
-            t0 (float): The first time this method was called.
+            t0 (float): The clock time of the first frame.
+            last_frame_id (int): The previously processed frame.
+            fps (int): The rate of the heartbeat.
 
         Returns:
             None
         """
+        frame_start = self.clock()
+        t = frame_start - t0
+        frame_id = int(round(t * fps))
+        if frame_id <= last_frame_id:
+            # Woke up early, wait for the frame to be due
+            self._schedule_frame(t0, last_frame_id, fps)
+            return
+
+        if last_frame_id >= 0:
+            lateness = t - (last_frame_id + 1) / fps
+            self.max_lateness = max(self.max_lateness, lateness)
+            if lateness > 0.5 / fps:
+                self.late_frames += 1
+            self.dropped_frames += frame_id - last_frame_id - 1
+        self.num_frames += 1
+
+        frame_time = t0 + frame_id / fps
+        try:
+            self._process_frame(frame_start, frame_time, fps)
+        finally:
+            # Errors must not end the frame loop, or all other tweens would stall
+            self._continue_heartbeat(t0, frame_id, frame_time, fps)
+
+    def _process_frame(self, frame_start: float, frame_time: float, fps: int) -> None:
+        """Step the active tweens, commit the scenes and queue the callbacks of finished tweens."""
         finished_tweens = []
+        if self._visibility_dirty:
+            self._update_visibility(frame_time)
+        budget = self.frame_budget if self.frame_budget is not None else 0.75 / fps
+        decimate = self._over_budget and self.num_frames % self.low_priority_interval != 0
+        # Higher priorities first, least recently stepped first within a priority
+        handles = sorted(
+            self._active_tweens.values(),
+            key=lambda h: (h.priority, -h.last_time if h.last_time is not None else float('inf')),
+            reverse=True
+        )
 
-        t = time.time() - t0
-        frame_id = int(round(t * self.fps))
-
-        for tween_id, tween_handle in self._active_tweens.items():
-            running = tween_handle.tween.animation_frame(frame_id, last_frame_id, tween_handle)
-            if not running:
-                finished_tweens.append(tween_id)
-
-        for scene in self._scenes.values():
-            scene.update()
-
+        self.commands.begin()
+        try:
+            for tween_handle in handles:
+                if tween_handle.suspended or tween_handle.blocked_by or tween_handle.id not in self._active_tweens:
+                    continue
+                frame = tween_handle.tween.sample_frame(frame_time, tween_handle)
+                if frame is None:
+                    continue
+                samples, running = frame
+                if tween_handle.priority < Priority.HIGH and (
+                    (decimate and tween_handle.priority == Priority.LOW)
+                    or self.clock() - frame_start > budget
+                ):
+                    self.skipped_steps += 1
+                    continue
+                eased = [table[step] for _, table, step in samples]
+                try:
+                    tween_handle.tween.apply_frame(frame_time, tween_handle, samples, eased)
+                except tk.TclError:
+                    if not self._drop_dead_tweens():
+                        raise
+                    continue
+                if not running:
+                    finished_tweens.append(tween_handle.id)
+
+            for scene in list(self._scenes.values()):
+                scene.update()
+        finally:
+            try:
+                self.commands.flush()
+            except tk.TclError:
+                if not self._drop_dead_tweens():
+                    raise
+
+        cost = self.clock() - frame_start
+        self._over_budget = cost > budget
+        self._govern(cost)
+
+        self._frames_since_sweep += 1
+        if self._frames_since_sweep >= self.sweep_interval:
+            self._frames_since_sweep = 0
+            self.sweep_scenes()
+
+        # Callbacks run after the frame, so slow callbacks do not stall animations
         for tween_id in finished_tweens:
-            h = self._active_tweens.pop(tween_id)
-            for callback in h.tween._callbacks.values():
-                callback(h)
-
-            for callback in self._callbacks.values():
-                callback(h)
-            
-        if self._active_tweens:
-            next_frame_time = t0 + (frame_id + 1) / self.fps 
-            delay = max(10, int(1000 * (next_frame_time - time.time())))
-            self._after_id = self.root.after(delay, self._animation_heartbeat, t0, frame_id)
+            if tween_id in self._active_tweens:
+                self._queue_callbacks(self._unregister(tween_id))
+
+    def _continue_heartbeat(self, t0: float, frame_id: int, frame_time: float, fps: int) -> None:
+        """Schedule the next frame, or stop the heartbeat if no tween needs one."""
+        if any(not h.suspended for h in self._active_tweens.values()):
+            next_fps = self._get_heartbeat_fps()
+            if next_fps != fps:
+                # Restart the frame count at the current frame for the new rate
+                t0, frame_id = frame_time, 0
+            self._schedule_frame(t0, frame_id, next_fps)
+        elif self._active_tweens:
+            # Only suspended tweens are left, wait for a visibility change
+            self._after_id = None
+            self._heartbeat_fps = None
         else:
             self._after_id = None
+            self._heartbeat_fps = None
+            # Without a running frame loop, culled objects would never scroll into view
+            for scene in list(self._scenes.values()):
+                scene.flush_culled()
+
+    def _drop_dead_tweens(self) -> int:
+        """
+        Cancel all tweens whose target widget was destroyed.
+
+        Returns:
+            int: Number of canceled tweens.
+        """
+        dead = [h for h in self._active_tweens.values() if not self._exists(h.get_target_widget())]
+        for handle in dead:
+            self.cancel_tween(handle, revert=False)
+        return len(dead)
+
+    @staticmethod
+    def _exists(widget: tk.Widget) -> bool:
+        try:
+            return bool(widget.winfo_exists())
+        except tk.TclError:
+            return False
+
+    def _schedule_frame(self, t0: float, frame_id: int, fps: int) -> None:
+        """Schedule the heartbeat for the frame following `frame_id`."""
+        next_frame_time = t0 + (frame_id + 1) / fps
+        # Never schedule a due timer: an overrunning heartbeat chaining `after(0)` calls
+        # would keep Tcl from ever reaching idle processing, starving redraws and
+        # the finished-callback queue
+        delay = max(1, int(round(1000 * (next_frame_time - self.clock()))))
+        self._heartbeat_fps = fps
+        self._after_id = self.root.after(delay, self._animation_heartbeat, t0, frame_id, fps)
 
 
 class Tween(object):
@@ -222,13 +948,13 @@ class Tween(object):
         self,
         *animations,
         duration:Optional[float]=None,
-        easing:Easing|None=None
+        easing:EasingType=None
     ) -> None:
         """Create a Tween where the given animations are run in parallel
 
         Args:
             duration (float): duration of the animation in seconds
-            easing (Easing | None, optional): Easing to use. Defaults to None.
+            easing (EasingType, optional): Easing to use, see `resolve_easing`. Defaults to None.
         """
         self.animation_sequence: list[AnimationBlock] = []
         if animations:
@@ -241,80 +967,155 @@ class Tween(object):
         self._then_offset: float = duration if duration else 0.0
         self._parallel_offset: float = 0
         self._callbacks: dict[uuid.UUID, Callable[[TweenHandle], None]] = {}
+        self._compiled: dict[int, CompiledTimeline] = {}
+        self._properties: dict[str, set[TweenAnimator]] | None = None
 
 
-    def animation_frame(
-        self, 
-        global_frame_id: int,
-        last_global_frame_id: int,
-        handle: TweenHandle
-    ) -> bool:
+    def compile(self, fps: Optional[int] = None) -> CompiledTimeline:
+        """
+        Get the compiled timeline of this tween.
+
+        Timelines are cached per frame rate and shared by all running handles.
+        The cache is invalidated whenever blocks are added.
+
+        Args:
+            fps (int | None, optional): Frame rate. Defaults to the director's fps.
+
+        Returns:
+            CompiledTimeline: The compiled timeline.
+        """
+        fps = fps or TweenDirector.get().effective_fps
+        timeline = self._compiled.get(fps)
+        if timeline is None:
+            timeline = self._compiled[fps] = CompiledTimeline(self.animation_sequence, fps)
+        return timeline
+
+
+    def animation_frame(self, frame_time: float, handle: TweenHandle) -> bool:
         """
         Process one frame of all blocks in the animation sequence.
 
+        Progress is measured in seconds since the handle's first frame and only
+        quantized to frames of the handle's rate here, so the frame rate may
+        change while the tween is running. Nothing is done if the handle's frame
+        did not change since its last step.
+
         Args:
-            global_frame_id (int): The frame id relative to the start of the application.
+            frame_time (float): Clock time of the frame.
             handle (TweenHandle): Handle of the tween.
 
         Returns:
             bool: False if all animations are finished, True otherwise.
         """
-        
-        if handle.frame_0 is None:
-            handle.frame_0 = global_frame_id
+        frame = self.sample_frame(frame_time, handle)
+        if frame is None:
+            return True
+        samples, running = frame
+        eased = [table[step] for _, table, step in samples]
+        self.apply_frame(frame_time, handle, samples, eased)
+        return running
+
+
+    def sample_frame(
+        self,
+        frame_time: float,
+        handle: TweenHandle
+    ) -> tuple[list[tuple[AnimationBlock, np.ndarray, int]], bool] | None:
+        """
+        Collect the blocks to process in a frame without applying them.
+
+        Splitting sampling and applying lets the director skip handles over
+        the frame budget after their start time was set.
 
-        frame_id = global_frame_id - handle.frame_0
-        last_frame_id = last_global_frame_id - handle.frame_0 
+        Args:
+            frame_time (float): Clock time of the frame.
+            handle (TweenHandle): Handle of the tween.
+
+        Returns:
+            tuple[list[tuple[AnimationBlock, np.ndarray, int]], bool] | None: The blocks with
+                their easing tables and the frame within the block, and whether the tween is
+                still running afterwards, or None if the handle's frame did not change since
+                its last step.
+        """
+        if handle.start_time is None:
+            handle.start_time = frame_time
+
+        timeline = self.compile(TweenDirector.get().get_handle_fps(handle))
+        num_frames = timeline.num_frames
+        frame_id = int(round((frame_time - handle.start_time) * timeline.fps))
+        if handle.last_time is None:
+            last_frame_id = -1
+        else:
+            last_frame_id = int(round((handle.last_time - handle.start_time) * timeline.fps))
+            if frame_id == last_frame_id:
+                return None
 
         reversed = False
 
         if handle.loop:
-            num_frames = self.get_num_frames()
+            num_frames = max(1, num_frames)
             frame_id, reversed = get_looped_frame_id(frame_id, num_frames)
             last_frame_id, _ = get_looped_frame_id(last_frame_id, num_frames)
         else:
             # Handle the edge case, that we are beyond the last frame of the animation 
             # In this case, we skipped the last frame previously, so just clamp the frame back
-            frame_id = max(0, min(self.get_num_frames(), frame_id))
-
+            frame_id = max(0, min(num_frames, frame_id))
 
+        samples = [
+            (timeline.blocks[i], timeline.tables[i], step)
+            for i, step in timeline.sample(frame_id, last_frame_id, reversed)
+        ]
         # If we loop, we are always running
-        running = handle.loop
-
-        for block in self.animation_sequence:
+        return samples, handle.loop or frame_id < num_frames
 
-            duration = block.duration
-            offset   = block.offset
-            
-            rel_frame = frame_id - offset
-            last_rel_frame = last_frame_id - offset
-            
-            t_rel = None
-
-            if 0 <= rel_frame <= duration:
-                t_rel = (frame_id - offset) / duration
-                t_rel = block.easing(t_rel)
-            elif not reversed and rel_frame > duration and last_rel_frame < duration:
-                t_rel = 1.0
-            elif reversed and rel_frame < 0 and last_rel_frame > 0:
-                t_rel = 0.0
-                
-            if t_rel is not None:
-                for animator in block.animators:
-                    animator(handle.widget, t_rel, handle.id)
 
-                if t_rel == 1 and not handle.loop:
-                    block.finalize(handle)
-                
-                running = running or rel_frame < block.duration 
+    def apply_frame(
+        self,
+        frame_time: float,
+        handle: TweenHandle,
+        samples: list[tuple[AnimationBlock, np.ndarray, int]],
+        eased: list[float]
+    ) -> None:
+        """
+        Step the animators of sampled blocks, see `sample_frame`.
 
-        
-        return running
+        Args:
+            frame_time (float): Clock time of the frame.
+            handle (TweenHandle): Handle of the tween.
+            samples (list[tuple[AnimationBlock, np.ndarray, int]]): The sampled blocks.
+            eased (list[float]): The eased progress of each sampled block.
+        """
+        handle.last_time = frame_time
+        muted = handle.muted
+        progress = handle.progress
+        commands = TweenDirector.get().commands
+        for (block, _, _), t_rel in zip(samples, eased):
+            t_rel = float(t_rel)
+            for animator in block.animators:
+                if muted and animator in muted:
+                    continue
+                if handle.id not in animator.animation_data:
+                    # `start` reads the target's state from Tk, which must see the
+                    # writes of blocks that ended earlier in this frame
+                    commands.sync()
+                animator(handle.widget, t_rel, handle.id)
+                progress[animator] = t_rel
+
+            if t_rel == 1 and not handle.loop:
+                block.finalize(handle)
 
 
     def cancel(self, handle:TweenHandle, revert:bool) -> None:
         if revert:
-            self.animation_frame(handle.frame_0, handle)
+            # Return every started block to its initial state, earliest blocks last
+            timeline = self.compile()
+            order = sorted(range(len(timeline.blocks)), key=lambda i: timeline.offsets[i], reverse=True)
+            for i in order:
+                for animator in timeline.blocks[i].animators:
+                    animator.revert(handle.widget, handle.id)
+            if isinstance(handle.widget, tuple):
+                # The heartbeat may not run again to commit the restored transforms
+                TweenDirector.get().get_scene(handle.widget[0]).update()
         for block in self.animation_sequence:
             block.finalize(handle)
 
@@ -323,7 +1124,7 @@ class Tween(object):
         self,
         *animations,
         duration:int,
-        easing:Easing|None=None
+        easing:EasingType=None
     ) -> Tween:
         """
         Add new animations which are starting after the previous ones.
@@ -331,7 +1132,7 @@ class Tween(object):
         Args:
             *animations: Animation objects.
             duration (int): Duration of the animation in seconds.
-            easing (Easing | None, optional): Easing function to apply. Defaults to None.
+            easing (EasingType, optional): Easing to apply, see `resolve_easing`. Defaults to None.
             
         Returns:
             Tween: The current Tween instance for chaining.
@@ -342,6 +1143,8 @@ class Tween(object):
             offset=self._then_offset,
             easing=easing
         ))
+        self._compiled.clear()
+        self._properties = None
         self._then_offset += duration
         return self
     
@@ -350,7 +1153,7 @@ class Tween(object):
         self,
         *animations,
         duration:float|None=None,
-        easing:Easing|None=None
+        easing:EasingType=None
     ) -> Tween:
         """
         Run the given animations or tween in parallel.
@@ -358,7 +1161,7 @@ class Tween(object):
         Args:
             *animations: Animation objects.
             duration (float | None, optional): Duration of animation in seconds. Defaults to same as previous block.
-            easing (Easing | None, optional): Easing function to apply. Defaults to None.
+            easing (EasingType, optional): Easing to apply, see `resolve_easing`. Defaults to None.
         
         Returns:
             Tween: The current Tween instance for chaining.
@@ -370,6 +1173,8 @@ class Tween(object):
             offset=self._parallel_offset,
             easing=easing
         ))
+        self._compiled.clear()
+        self._properties = None
         return self
 
 
@@ -412,17 +1217,29 @@ class Tween(object):
         self,
         target: TweenAble,
         loop:bool=False,
+        priority:Priority=Priority.NORMAL,
+        fps:Optional[int]=None,
+        conflict:Optional[ConflictPolicy]=None,
     ) -> TweenHandle:
         """
         Run the animation on a target.
 
         Args:
             target (TweenAble): The target widget to animate.
+            loop (bool, optional): Whether to loop the animation. Defaults to False.
+            priority (Priority, optional): Scheduling priority under load. Defaults to Priority.NORMAL.
+            fps (int | None, optional): Frame rate of this run, e.g. a low rate for slow
+                background animations. Defaults to the director's rate.
+            conflict (ConflictPolicy | None, optional): How to treat tweens already animating the
+                same properties of the target. Defaults to `TweenDirector.conflict_policy`.
 
         Returns:
             TweenHandle: Handle of the tween.
+
+        Raises:
+            ValueError: If the tween rotates a canvas tag, which Tk cannot do.
         """
-        return TweenDirector.get().start_animation(target, self, loop)
+        return TweenDirector.get().start_animation(target, self, loop, priority, fps, conflict)
 
 
     def add_callback(self, callback: Callable[[TweenHandle], None]) -> uuid.UUID:
@@ -435,7 +1252,7 @@ class Tween(object):
         self._callbacks.pop(uid)
 
 
-    def is_running(self, widget:tk.Widget) -> bool:
+    def is_running(self, widget:TweenAble) -> bool:
         return TweenDirector.get().is_active(self, widget)
 
 
@@ -447,14 +1264,60 @@ class Tween(object):
         return max_time
 
 
+    def get_animators(self) -> set[TweenAnimator]:
+        """All animators of the tween."""
+        return {animator for block in self.animation_sequence for animator in block.animators}
+
+
+    def get_properties(self) -> dict[str, set[TweenAnimator]]:
+        """
+        Get the target properties written by the tween.
+
+        Returns:
+            dict[str, set[TweenAnimator]]: The animators writing each property, see `TweenAnimator.properties`.
+        """
+        if self._properties is None:
+            self._properties = {}
+            for block in self.animation_sequence:
+                for animator in block.animators:
+                    for prop in animator.properties:
+                        self._properties.setdefault(prop, set()).add(animator)
+        return self._properties
+
+
     def get_num_frames(self) -> int:
-        max_frames = 0
-        for block in self.animation_sequence:
-            end_frame = block.offset + block.duration
-            max_frames = max(max_frames, end_frame)
-        return max_frames
+        return self.compile().num_frames
 
 
 class CanvasTween(Tween):
-    def run(self, canvas: tk.Canvas, target: ObjectId, loop:bool=False) -> TweenHandle:
-        return TweenDirector.get().start_animation((canvas, target), self, loop)
\ No newline at end of file
+    def run(
+        self,
+        canvas: tk.Canvas,
+        target: ObjectId | str | SceneGroup,
+        loop:bool=False,
+        priority:Priority=Priority.NORMAL,
+        fps:Optional[int]=None,
+        conflict:Optional[ConflictPolicy]=None
+    ) -> TweenHandle:
+        """
+        Run the animation on a canvas item, a scene group or all items carrying a canvas tag.
+
+        Args:
+            canvas (tk.Canvas): The canvas holding the target.
+            target (ObjectId | str | SceneGroup): Item id, tag or group to animate.
+                Tags are translated, scaled and configured with one Tcl command per frame.
+            loop (bool, optional): Whether to loop the animation. Defaults to False.
+            priority (Priority, optional): Scheduling priority under load. Defaults to Priority.NORMAL.
+            fps (int | None, optional): Frame rate of this run. Defaults to the director's rate.
+            conflict (ConflictPolicy | None, optional): How to treat tweens already animating the
+                same properties of the target. Defaults to `TweenDirector.conflict_policy`.
+
+        Returns:
+            TweenHandle: Handle of the tween.
+
+        Raises:
+            ValueError: If the tween rotates a tag, which Tk cannot do.
+        """
+        if isinstance(target, SceneGroup):
+            target = target.idx
+        return TweenDirector.get().start_animation((canvas, target), self, loop, priority, fps, conflict)
\ No newline at end of file
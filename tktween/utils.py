@@ -1,7 +1,11 @@
 import colorsys
+import math
 from typing import Any, Literal, Optional, TypeAlias
 
+import numpy as np
+
 Color: TypeAlias = str | tuple[float, float, float] | tuple[int, int, int]
+ColorMode: TypeAlias = Literal['rgb', 'hsv', 'oklab', 'oklch']
 
 CSS4_COLORS = {
 	'aliceblue': (0.9411764705882353, 0.9725490196078431, 1.0),
@@ -177,6 +181,30 @@ def lerp(x0:Any, x1:Any, t:float) -> Any:
         return x0 + t * (x1 - x0)
 
 
+def remap_progress(t:float, t0:float) -> float:
+    """Map the progress `t` of an animation onto a segment that started at progress `t0`.
+
+    Used by retargeted animations, which continue from their state at `t0` and
+    reach their new end value at the same time as the original animation.
+
+    Args:
+        t (float): The (eased) progress of the animation.
+        t0 (float): The progress at which the segment started.
+
+    Returns:
+        float: The progress within the segment, 0 at `t0` and 1 at `t == 1`.
+
+    Examples:
+        >>> remap_progress(0.75, 0.5)
+        0.5
+    """
+    if t0 == 0.0:
+        return t
+    if t0 >= 1.0:
+        return 1.0
+    return (t - t0) / (1.0 - t0)
+
+
 def convert_to_rgb(color: Color) -> tuple[float, float, float]:
     """Convert color representation to RGB triple with values in the range [0, 1].
 
@@ -333,7 +361,7 @@ def lerp_color(
     c1: Color,
     c2: Color,
     t:float,
-    mode:Literal['rgb', 'hsv']='rgb',
+    mode:ColorMode='rgb',
     clockwise:Optional[bool]=None
 ) -> tuple[float, float, float]:
     """Interpolate colors
@@ -344,10 +372,11 @@ def lerp_color(
         c1 (Union[str, tuple[float, float, float]]): The first color.
         c2 (Union[str, tuple[float, float, float]]): The second color.
         t (float): Interpolation factor, controlling the blend between the two colors. Should be in the range [0, 1].
-        mode (Literal['rgb', 'hsv'], optional): The space in which the color will be interpolated. Defaults to 'rgb'.
+        mode (ColorMode, optional): The space in which the color will be interpolated. 'oklab' and 'oklch'
+                                   are perceptually uniform and avoid the brightness jumps of 'hsv'. Defaults to 'rgb'.
         clockwise (Optional[bool], optional): If None, the colors are automatically interpolated along the shortest angular distance.
                                    If True, the hue value is interpolated clockwise; False, counterclockwise.
-                                   This argument is only used when mode is 'hsv'.
+                                   This argument is only used when mode is 'hsv' or 'oklch'.
                                    Defaults to None.
 
     Returns:
@@ -365,6 +394,8 @@ def lerp_color(
         # Interpolate between red and blue with a 0.5 blend factor in HSV space
         >>> lerp_color((1.0, 0.0, 0.0), '#0000FF', 0.5, mode='hsv')
         (0.5, 0.0, 0.5)
+
+    Colors interpolated in 'oklab' or 'oklch' are clipped to the sRGB gamut.
     """
 
     # Convert color representation to RGB triples with value range 0 to 1
@@ -381,5 +412,433 @@ def lerp_color(
         c_hsv = lerp_hsv(c1_hsv, c2_hsv, t, cw=clockwise)
 
         return colorsys.hsv_to_rgb(*c_hsv)
+    elif mode in ('oklab', 'oklch'):
+        return ColorInterpolator(color_1, color_2, mode=mode, clockwise=clockwise)(t)
     else:
-        raise ValueError("Invalid mode. Supported modes are 'rgb' and 'hsv'.")
\ No newline at end of file
+        raise ValueError("Invalid mode. Supported modes are 'rgb', 'hsv', 'oklab' and 'oklch'.")
+
+
+# OKLab, see https://bottosson.github.io/posts/oklab/
+# The inverse matrices are computed, so conversions round trip exactly
+_LINEAR_SRGB_TO_LMS = np.array([
+    [0.4122214708, 0.5363325363, 0.0514459929],
+    [0.2119034982, 0.6806995451, 0.1073969566],
+    [0.0883024619, 0.2817188376, 0.6299787005],
+])
+_LMS_TO_OKLAB = np.array([
+    [0.2104542553, 0.7936177850, -0.0040720468],
+    [1.9779984951, -2.4285922050, 0.4505937099],
+    [0.0259040371, 0.7827717662, -0.8086757660],
+])
+_OKLAB_TO_LMS = np.linalg.inv(_LMS_TO_OKLAB)
+_LMS_TO_LINEAR_SRGB = np.linalg.inv(_LINEAR_SRGB_TO_LMS)
+
+
+def srgb_to_oklab(rgb: np.ndarray) -> np.ndarray:
+    """
+    Convert sRGB colors to OKLab.
+
+    Args:
+        rgb (np.ndarray): Array of shape (..., 3) with sRGB values in the range [0, 1].
+
+    Returns:
+        np.ndarray: Array of the same shape with the L, a and b components.
+
+    Examples:
+        >>> srgb_to_oklab(np.array([1.0, 1.0, 1.0])).round(4)
+        array([1., 0., 0.])
+    """
+    rgb = np.asarray(rgb, dtype=np.float64)
+    linear = np.where(rgb <= 0.04045, rgb / 12.92, ((np.maximum(rgb, 0.04045) + 0.055) / 1.055) ** 2.4)
+    lms = np.cbrt(linear @ _LINEAR_SRGB_TO_LMS.T)
+    return lms @ _LMS_TO_OKLAB.T
+
+
+def oklab_to_srgb(lab: np.ndarray) -> np.ndarray:
+    """
+    Convert OKLab colors to sRGB.
+
+    Colors outside of the sRGB gamut are not clipped.
+
+    Args:
+        lab (np.ndarray): Array of shape (..., 3) with the L, a and b components.
+
+    Returns:
+        np.ndarray: Array of the same shape with sRGB values.
+    """
+    lms = (np.asarray(lab, dtype=np.float64) @ _OKLAB_TO_LMS.T) ** 3
+    linear = lms @ _LMS_TO_LINEAR_SRGB.T
+    magnitude = np.abs(linear)
+    encoded = np.where(
+        magnitude <= 0.0031308,
+        12.92 * magnitude,
+        1.055 * np.maximum(magnitude, 0.0031308) ** (1 / 2.4) - 0.055
+    )
+    return np.copysign(encoded, linear)
+
+
+def oklab_to_oklch(lab: np.ndarray) -> np.ndarray:
+    """
+    Convert OKLab colors to OKLCh, with the hue in the range [0, 1) like in HSV.
+
+    Args:
+        lab (np.ndarray): Array of shape (..., 3) with the L, a and b components.
+
+    Returns:
+        np.ndarray: Array of the same shape with the L, C and h components.
+    """
+    lab = np.asarray(lab, dtype=np.float64)
+    L, a, b = lab[..., 0], lab[..., 1], lab[..., 2]
+    h = (np.arctan2(b, a) / (2 * np.pi)) % 1.0
+    return np.stack([L, np.hypot(a, b), h], axis=-1)
+
+
+def oklch_to_oklab(lch: np.ndarray) -> np.ndarray:
+    """
+    Convert OKLCh colors, with the hue in the range [0, 1), to OKLab.
+
+    Args:
+        lch (np.ndarray): Array of shape (..., 3) with the L, C and h components.
+
+    Returns:
+        np.ndarray: Array of the same shape with the L, a and b components.
+    """
+    lch = np.asarray(lch, dtype=np.float64)
+    L, C, h = lch[..., 0], lch[..., 1], lch[..., 2] * (2 * np.pi)
+    return np.stack([L, C * np.cos(h), C * np.sin(h)], axis=-1)
+
+
+def _rgb_to_hsv_np(rgb: np.ndarray) -> np.ndarray:
+    """Vectorized `colorsys.rgb_to_hsv` of an (..., 3) array."""
+    r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+    maxc = rgb.max(axis=-1)
+    minc = rgb.min(axis=-1)
+    span = maxc - minc
+    safe_span = np.where(span > 0, span, 1.0)
+    rc, gc, bc = (maxc - r) / safe_span, (maxc - g) / safe_span, (maxc - b) / safe_span
+    h = np.where(r == maxc, bc - gc, np.where(g == maxc, 2.0 + rc - bc, 4.0 + gc - rc))
+    h = np.where(span > 0, (h / 6.0) % 1.0, 0.0)
+    s = np.divide(span, maxc, out=np.zeros_like(maxc), where=maxc > 0)
+    return np.stack([h, s, maxc], axis=-1)
+
+
+def _unwrap_hue(h1: np.ndarray, h2: np.ndarray, clockwise: Optional[bool]) -> np.ndarray:
+    """Shift the end hues so interpolating linearly from `h1` runs in the direction given by `clockwise`."""
+    increasing = (h2 - h1) % 1.0
+    if clockwise is None:
+        return np.where(increasing <= 0.5, h1 + increasing, h1 + increasing - 1.0)
+    elif clockwise:
+        return h1 + increasing
+    return h1 + increasing - np.where(increasing > 0, 1.0, 0.0)
+
+
+def lerp_colors(
+    c1: np.ndarray,
+    c2: np.ndarray,
+    t: float | np.ndarray,
+    mode: ColorMode = 'rgb',
+    clockwise: Optional[bool] = None
+) -> np.ndarray:
+    """Interpolate many pairs of colors at once.
+
+    Vectorized version of `lerp_color` for arrays of RGB colors, e.g. to fade
+    all cells of a heatmap to new values with one array operation per frame.
+
+    Args:
+        c1 (np.ndarray): The (n, 3) first colors as RGB values in the range [0, 1].
+        c2 (np.ndarray): The (n, 3) second colors as RGB values in the range [0, 1].
+        t (float | np.ndarray): Interpolation factor, either shared or one per pair.
+        mode (ColorMode, optional): The space in which the colors will be interpolated. Defaults to 'rgb'.
+        clockwise (Optional[bool], optional): Hue direction in 'hsv' and 'oklch' mode, see `lerp_color`. Defaults to None.
+
+    Returns:
+        np.ndarray: The (n, 3) interpolated colors in RGB format. Colors interpolated in
+            'oklab' or 'oklch' are clipped to the sRGB gamut.
+
+    Examples:
+        >>> lerp_colors(np.array([[1.0, 0.0, 0.0]]), np.array([[0.0, 0.0, 1.0]]), 0.5)
+        array([[0.5, 0. , 0.5]])
+    """
+    c1 = np.asarray(c1, dtype=np.float64)
+    c2 = np.asarray(c2, dtype=np.float64)
+    t = np.asarray(t, dtype=np.float64)
+    t = t[..., None] if t.ndim else t
+
+    if mode == 'rgb':
+        return c1 + (c2 - c1) * t
+    elif mode == 'hsv':
+        a, b = _rgb_to_hsv_np(c1), _rgb_to_hsv_np(c2)
+        b[..., 0] = _unwrap_hue(a[..., 0], b[..., 0], clockwise)
+        c = a + (b - a) * t
+        shape = c.shape
+        c = c.reshape(-1, 3)
+        return _hsv_to_rgb_np(c[:, 0], c[:, 1], c[:, 2]).reshape(shape)
+    elif mode == 'oklab':
+        a, b = srgb_to_oklab(c1), srgb_to_oklab(c2)
+        return np.clip(oklab_to_srgb(a + (b - a) * t), 0.0, 1.0)
+    elif mode == 'oklch':
+        a, b = oklab_to_oklch(srgb_to_oklab(c1)), oklab_to_oklch(srgb_to_oklab(c2))
+        _fix_powerless_hue(a, b)
+        b[..., 2] = _unwrap_hue(a[..., 2], b[..., 2], clockwise)
+        return np.clip(oklab_to_srgb(oklch_to_oklab(a + (b - a) * t)), 0.0, 1.0)
+    raise ValueError("Invalid mode. Supported modes are 'rgb', 'hsv', 'oklab' and 'oklch'.")
+
+
+def _fix_powerless_hue(a: np.ndarray, b: np.ndarray, epsilon: float = 1e-6) -> None:
+    """Give achromatic OKLCh colors the hue of the other endpoint, so fades from gray don't sweep through other hues."""
+    a_gray = a[..., 1] < epsilon
+    b_gray = b[..., 1] < epsilon
+    a[..., 2] = np.where(a_gray, b[..., 2], a[..., 2])
+    b[..., 2] = np.where(b_gray, a[..., 2], b[..., 2])
+
+
+def rgb_array_to_hex(rgb: np.ndarray) -> list[str]:
+    """
+    Convert an (n, 3) array of RGB colors to hex strings, clamped to the valid range.
+
+    Args:
+        rgb (np.ndarray): RGB colors with float values in the range 0 to 1.
+
+    Returns:
+        list[str]: Hex string representations of the colors.
+    """
+    rgb = np.clip(np.rint(np.asarray(rgb, dtype=np.float64).reshape(-1, 3) * 255), 0, 255).astype(np.intp)
+    digits = _HEX_DIGITS
+    return ['#' + digits[r] + digits[g] + digits[b] for r, g, b in rgb.tolist()]
+
+
+def _srgb_to_oklab_scalar(rgb: tuple[float, float, float]) -> tuple[float, float, float]:
+    """Convert a single sRGB color to OKLab, see `srgb_to_oklab`."""
+    r, g, b = (c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4 for c in rgb)
+    (m00, m01, m02), (m10, m11, m12), (m20, m21, m22) = _LINEAR_SRGB_TO_LMS_ROWS
+    l, m, s = (
+        math.copysign(abs(x) ** (1 / 3), x)
+        for x in (m00 * r + m01 * g + m02 * b, m10 * r + m11 * g + m12 * b, m20 * r + m21 * g + m22 * b)
+    )
+    (m00, m01, m02), (m10, m11, m12), (m20, m21, m22) = _LMS_TO_OKLAB_ROWS
+    return m00 * l + m01 * m + m02 * s, m10 * l + m11 * m + m12 * s, m20 * l + m21 * m + m22 * s
+
+
+def _oklab_to_srgb_scalar(lab: tuple[float, float, float]) -> tuple[float, float, float]:
+    """Convert a single OKLab color to sRGB, see `oklab_to_srgb`."""
+    L, a, b = lab
+    (m00, m01, m02), (m10, m11, m12), (m20, m21, m22) = _OKLAB_TO_LMS_ROWS
+    l = m00 * L + m01 * a + m02 * b
+    m = m10 * L + m11 * a + m12 * b
+    s = m20 * L + m21 * a + m22 * b
+    l, m, s = l * l * l, m * m * m, s * s * s
+    (m00, m01, m02), (m10, m11, m12), (m20, m21, m22) = _LMS_TO_LINEAR_SRGB_ROWS
+    return (
+        _encode_srgb(m00 * l + m01 * m + m02 * s),
+        _encode_srgb(m10 * l + m11 * m + m12 * s),
+        _encode_srgb(m20 * l + m21 * m + m22 * s),
+    )
+
+
+def _encode_srgb(c: float) -> float:
+    """Apply the sRGB transfer function to a linear channel value, mirrored for negative values."""
+    if abs(c) <= 0.0031308:
+        return 12.92 * c
+    return math.copysign(1.055 * abs(c) ** (1 / 2.4) - 0.055, c)
+
+
+# The conversion matrices as nested tuples, as NumPy's per call overhead
+# dominates the cost of converting a single color
+_LINEAR_SRGB_TO_LMS_ROWS = tuple(map(tuple, _LINEAR_SRGB_TO_LMS.tolist()))
+_LMS_TO_OKLAB_ROWS = tuple(map(tuple, _LMS_TO_OKLAB.tolist()))
+_OKLAB_TO_LMS_ROWS = tuple(map(tuple, _OKLAB_TO_LMS.tolist()))
+_LMS_TO_LINEAR_SRGB_ROWS = tuple(map(tuple, _LMS_TO_LINEAR_SRGB.tolist()))
+
+
+# Two digit hex codes of all 8 bit channel values
+_HEX_DIGITS = tuple(f"{i:02X}" for i in range(256))
+
+
+def _hsv_to_rgb_np(h: np.ndarray, s: np.ndarray, v: np.ndarray) -> np.ndarray:
+    """Vectorized `colorsys.hsv_to_rgb`, returning an (n, 3) array."""
+    h6 = (h % 1.0) * 6.0
+    i = np.floor(h6).astype(np.intp) % 6
+    f = h6 - np.floor(h6)
+    p = v * (1.0 - s)
+    q = v * (1.0 - s * f)
+    t = v * (1.0 - s * (1.0 - f))
+    # Rows of the (r, g, b) components for each of the six hue sectors
+    options = np.stack([v, q, p, p, t, v, t, v, v, q, p, p, p, p, t, v, v, q]).reshape(3, 6, -1)
+    return options[:, i, np.arange(len(i))].T
+
+
+class ColorInterpolator:
+    """
+    Interpolates between two colors with everything but the blend precomputed.
+
+    Endpoints are resolved and converted into the interpolation space once, and
+    in 'hsv' and 'oklch' mode the hue direction is fixed on construction.
+    Evaluating a color is then a few multiply-adds, plus the conversion back
+    to RGB in the other modes. Colors interpolated in 'oklab' or 'oklch' are
+    clipped to the sRGB gamut.
+
+    Examples:
+        >>> interpolator = ColorInterpolator('#FF0000', '#0000FF')
+        >>> interpolator(0.5)
+        (0.5, 0.0, 0.5)
+        >>> interpolator.hex(0.5)
+        '#800080'
+    """
+
+    def __init__(
+        self,
+        c1: Color,
+        c2: Color,
+        mode: ColorMode = 'rgb',
+        clockwise: Optional[bool] = None
+    ) -> None:
+        """
+        Args:
+            c1 (Color): The start color.
+            c2 (Color): The end color.
+            mode (ColorMode, optional): The space in which the color will be interpolated. Defaults to 'rgb'.
+            clockwise (Optional[bool], optional): Direction of the hue interpolation in 'hsv' and 'oklch' mode, see `lerp_hsv`.
+                If None, the shortest angular distance is used. Defaults to None.
+
+        Raises:
+            ValueError: If a color representation or the mode is not supported.
+        """
+        self.start = convert_to_rgb(c1)
+        self.end = convert_to_rgb(c2)
+        self.mode = mode
+        self.clockwise = clockwise
+
+        if mode == 'rgb':
+            a, b = self.start, self.end
+        elif mode == 'hsv':
+            (h1, s1, v1), (h2, s2, v2) = colorsys.rgb_to_hsv(*self.start), colorsys.rgb_to_hsv(*self.end)
+            cw = clockwise
+            if cw is None:
+                cw = (h2 > h1 and h2 - h1 <= 0.5) or (h2 < h1 and 1.0 + h2 - h1 <= 0.5)
+            # Unwrap the hue so interpolating it linearly runs in the chosen direction
+            h1 = (h1 + 1.0) if not cw and h1 < h2 else h1
+            h2 = (h2 + 1.0) if cw and h2 < h1 else h2
+            a, b = (h1, s1, v1), (h2, s2, v2)
+        elif mode == 'oklab':
+            a, b = _srgb_to_oklab_scalar(self.start), _srgb_to_oklab_scalar(self.end)
+        elif mode == 'oklch':
+            (L1, a1, b1), (L2, a2, b2) = _srgb_to_oklab_scalar(self.start), _srgb_to_oklab_scalar(self.end)
+            C1, C2 = math.hypot(a1, b1), math.hypot(a2, b2)
+            h1, h2 = (math.atan2(b1, a1) / math.tau) % 1.0, (math.atan2(b2, a2) / math.tau) % 1.0
+            # Achromatic colors take the hue of the other endpoint, so fades from
+            # gray don't sweep through other hues
+            if C1 < 1e-6:
+                h1 = h2
+            if C2 < 1e-6:
+                h2 = h1
+            # Unwrap the hue so interpolating it linearly runs in the chosen direction
+            increasing = (h2 - h1) % 1.0
+            if clockwise is None:
+                h2 = h1 + increasing if increasing <= 0.5 else h1 + increasing - 1.0
+            elif clockwise:
+                h2 = h1 + increasing
+            else:
+                h2 = h1 + increasing - (1.0 if increasing > 0 else 0.0)
+            a, b = (L1, C1, h1), (L2, C2, h2)
+        else:
+            raise ValueError("Invalid mode. Supported modes are 'rgb', 'hsv', 'oklab' and 'oklch'.")
+
+        self._origin = a
+        self._delta = tuple(y - x for x, y in zip(a, b))
+        self._origin_np = np.array(a)
+        self._delta_np = np.array(self._delta)
+
+
+    def __call__(self, t: float) -> tuple[float, float, float]:
+        """
+        Get the color at progress `t`.
+
+        Args:
+            t (float): Interpolation factor, 0 at the start and 1 at the end color.
+
+        Returns:
+            tuple[float, float, float]: The interpolated color in RGB format.
+        """
+        (x0, y0, z0), (dx, dy, dz) = self._origin, self._delta
+        x, y, z = x0 + dx * t, y0 + dy * t, z0 + dz * t
+        if self.mode == 'hsv':
+            return colorsys.hsv_to_rgb(x % 1.0, y, z)
+        elif self.mode == 'oklch':
+            h = z * math.tau
+            y, z = y * math.cos(h), y * math.sin(h)
+        if self.mode != 'rgb':
+            r, g, b = _oklab_to_srgb_scalar((x, y, z))
+            return min(1.0, max(0.0, r)), min(1.0, max(0.0, g)), min(1.0, max(0.0, b))
+        return x, y, z
+
+
+    def hex(self, t: float) -> str:
+        """
+        Get the color at progress `t` as hex string, clamped to the valid range.
+
+        Args:
+            t (float): Interpolation factor.
+
+        Returns:
+            str: The hex string of the interpolated color.
+        """
+        r, g, b = self(t)
+        digits = _HEX_DIGITS
+        return '#' + digits[min(max(round(r * 255), 0), 255)] \
+            + digits[min(max(round(g * 255), 0), 255)] \
+            + digits[min(max(round(b * 255), 0), 255)]
+
+
+    def evaluate(self, t: np.ndarray) -> np.ndarray:
+        """
+        Get the colors at many progress values at once.
+
+        Args:
+            t (np.ndarray): Interpolation factors.
+
+        Returns:
+            np.ndarray: The (n, 3) interpolated colors in RGB format.
+        """
+        t = np.asarray(t, dtype=np.float64).reshape(-1)
+        c = self._origin_np + t[:, None] * self._delta_np
+        if self.mode == 'hsv':
+            return _hsv_to_rgb_np(c[:, 0], c[:, 1], c[:, 2])
+        elif self.mode != 'rgb':
+            return self._to_rgb(c)
+        return c
+
+
+    def _to_rgb(self, c: np.ndarray) -> np.ndarray:
+        """Convert colors in the OKLab based interpolation spaces to clipped RGB."""
+        if self.mode == 'oklch':
+            c = oklch_to_oklab(c)
+        return np.clip(oklab_to_srgb(c), 0.0, 1.0)
+
+
+    def retarget(self, t: float, end_color: Color) -> 'ColorInterpolator':
+        """
+        Get an interpolator from the color at progress `t` to a new end color.
+
+        Args:
+            t (float): Interpolation factor of the new start color.
+            end_color (Color): The new end color.
+
+        Returns:
+            ColorInterpolator: An interpolator with the same mode and hue direction.
+        """
+        # Overshooting easings can leave the valid range
+        start = tuple(min(1.0, max(0.0, x)) for x in self(t))
+        return ColorInterpolator(start, end_color, mode=self.mode, clockwise=self.clockwise)
+
+
+    def hex_many(self, t: np.ndarray) -> list[str]:
+        """
+        Get the colors at many progress values at once as hex strings, clamped to the valid range.
+
+        Args:
+            t (np.ndarray): Interpolation factors.
+
+        Returns:
+            list[str]: The hex strings of the interpolated colors.
+        """
+        return rgb_array_to_hex(self.evaluate(t))
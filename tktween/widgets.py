@@ -2,12 +2,14 @@ from __future__ import annotations
 
 import tkinter as tk
 import tkinter.ttk as ttk
-from typing import Any, Literal, Optional
+import weakref
+from typing import Any, Optional
 
 from tktween.base import TweenAble
 
 from .base import TweenAnimator
-from .utils import Color, lerp, lerp_color, rgb_to_hex
+from .tween import TweenDirector
+from .utils import Color, ColorInterpolator, ColorMode, lerp, remap_progress, rgb_to_hex
 
 __all__ = [
     'Translate',
@@ -20,6 +22,8 @@ __all__ = [
 
 # Animation types
 class Translate(TweenAnimator):
+    properties = ('x', 'y')
+
     def __init__(
         self,
         x:Optional[int] = None,
@@ -34,16 +38,31 @@ class Translate(TweenAnimator):
         widget.update_idletasks()
         x0 = widget.winfo_x()
         y0 = widget.winfo_y()
-        return x0, y0
+        # Origin, segment start, segment end and the progress the segment started at
+        return x0, y0, x0, y0, x0 + (self.x or 0), y0 + (self.y or 0), 0.0
 
     
-    def step(self, widget: tk.Widget, t: float, animation_data: tuple[int, int]) -> None:
-        x0, y0 = animation_data
-        dx = lerp(0, self.x, t)
-        dy = lerp(0, self.y, t)
-        widget.place(
-            x=x0 + dx,
-            y=y0 + dy
+    def step(self, widget: tk.Widget, t: float, animation_data: tuple) -> None:
+        _, _, sx, sy, ex, ey, t0 = animation_data
+        u = remap_progress(t, t0)
+        TweenDirector.get().commands.call(
+            widget, 'place', 'configure', str(widget),
+            '-x', lerp(sx, ex, u),
+            '-y', lerp(sy, ey, u)
+        )
+
+    def restore(self, widget: tk.Widget, animation_data: tuple) -> None:
+        x0, y0 = animation_data[:2]
+        TweenDirector.get().commands.call(widget, 'place', 'configure', str(widget), '-x', x0, '-y', y0)
+
+    def retarget(self, animation_data: tuple, t: float, x: Optional[int] = None, y: Optional[int] = None, **kwargs) -> tuple:
+        if x is None and y is None:
+            return animation_data
+        x0, y0, sx, sy, ex, ey, t0 = animation_data
+        u = remap_progress(t, t0)
+        return (
+            x0, y0, lerp(sx, ex, u), lerp(sy, ey, u),
+            x0 + x if x is not None else ex, y0 + y if y is not None else ey, t
         )
 
     def inverse(self) -> Translate:
@@ -54,6 +73,8 @@ class Translate(TweenAnimator):
 
 
 class Resize(TweenAnimator):
+    properties = ('width', 'height')
+
     def __init__(
         self,
         width:Optional[int] = None,
@@ -71,23 +92,55 @@ class Resize(TweenAnimator):
         self.scale_factor_width = scale_factor_width
         self.scale_factor_height = scale_factor_height
 
-    def start(self, widget: tk.Widget) -> tuple[int, int, int | float, int | float]:
+    def start(self, widget: tk.Widget) -> tuple:
         widget.update_idletasks()
         w0 = widget.winfo_width()
         h0 = widget.winfo_height()
         w1 = w0 * self.scale_factor_width if self.scale_factor_width else self.width
         h1 = h0 * self.scale_factor_height if self.scale_factor_height else self.height
-        return w0, h0, w1, h1
+        # Initial size, segment start, segment end and the progress the segment started at
+        return w0, h0, w0, h0, w1 if w1 is not None else w0, h1 if h1 is not None else h0, 0.0
     
 
-    def step(self, widget: TweenAble, t: float, animation_data: Any) -> None:
-        w0, h0, w1, h1 = animation_data
-        width  = lerp(w0, w1, t)
-        height = lerp(h0, h1, t)
-        widget.place(width=width, height=height)
+    def step(self, widget: TweenAble, t: float, animation_data: tuple) -> None:
+        _, _, sw, sh, ew, eh, t0 = animation_data
+        u = remap_progress(t, t0)
+        TweenDirector.get().commands.call(
+            widget, 'place', 'configure', str(widget),
+            '-width', lerp(sw, ew, u),
+            '-height', lerp(sh, eh, u)
+        )
+
+    def restore(self, widget: TweenAble, animation_data: tuple) -> None:
+        w0, h0 = animation_data[:2]
+        TweenDirector.get().commands.call(widget, 'place', 'configure', str(widget), '-width', w0, '-height', h0)
+
+    def retarget(
+        self,
+        animation_data: tuple,
+        t: float,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        scale_factor_width: Optional[float] = None,
+        scale_factor_height: Optional[float] = None,
+        **kwargs
+    ) -> tuple:
+        w0, h0, sw, sh, ew, eh, t0 = animation_data
+        w1 = w0 * scale_factor_width if scale_factor_width else width
+        h1 = h0 * scale_factor_height if scale_factor_height else height
+        if w1 is None and h1 is None:
+            return animation_data
+        u = remap_progress(t, t0)
+        return (
+            w0, h0, lerp(sw, ew, u), lerp(sh, eh, u),
+            w1 if w1 is not None else ew, h1 if h1 is not None else eh, t
+        )
 
 
 class StyleAnimator(TweenAnimator):
+    # Last value written to each animated style option, per widget
+    _written: weakref.WeakKeyDictionary[tk.Widget, dict[str, Any]] = weakref.WeakKeyDictionary()
+
     def __init__(self) -> None:
         super().__init__()
         self.style = ttk.Style()
@@ -107,6 +160,23 @@ class StyleAnimator(TweenAnimator):
                 self.style.configure(style_name, **config)
             widget.configure(style=style_name)
         return style_name
+
+
+    def configure_style(self, widget: tk.Widget, style: str, option: str, value: Any) -> None:
+        """
+        Set a style option through the director's command batch, skipping unchanged values.
+
+        Args:
+            widget (tk.Widget): The animated widget owning the style.
+            style (str): The style name.
+            option (str): The style option.
+            value (Any): The new value.
+        """
+        written = self._written.setdefault(widget, {})
+        if written.get(option) == value:
+            return
+        written[option] = value
+        TweenDirector.get().commands.call(self.style, 'ttk::style', 'configure', style, f'-{option}', value)
     
 
 class ColorAnimator(StyleAnimator):
@@ -115,11 +185,12 @@ class ColorAnimator(StyleAnimator):
         value:str,
         start_color:Optional[Color]=None,
         end_color:Optional[Color]=None,
-        mode:Literal['rgb', 'hsv']='rgb',
+        mode:ColorMode='rgb',
         clockwise:Optional[bool]=None
     ) -> None:
         super().__init__()
         self._value = value
+        self.properties = (value,)
         self.start_color = start_color
         self.end_color = end_color
         self.mode = mode
@@ -127,25 +198,46 @@ class ColorAnimator(StyleAnimator):
 
 
     def get_current_color(self, widget: ttk.Widget, cfg: str) -> Color:
+        # Style writes buffered in the current frame must be visible to the lookup
+        TweenDirector.get().commands.sync()
         current_style = widget['style']
         current_color = self.style.lookup(current_style, cfg)
         current_color = tuple((x>>8) / 255 for x in widget.winfo_rgb(current_color))
         return current_color
     
-    def start(self, widget: tk.Widget) -> tuple[Color, Color, str]:
+    def start(self, widget: tk.Widget) -> tuple[str, ColorInterpolator, str, float]:
         style_name = super().start(widget)
         current_color = self.get_current_color(widget, self._value)
+        self._written.setdefault(widget, {})[self._value] = rgb_to_hex(current_color)
 
         c1 = self.start_color or current_color
         c2 = self.end_color or current_color
 
-        return c1, c2, style_name
+        interpolator = ColorInterpolator(c1, c2, mode=self.mode, clockwise=self.clockwise)
+        return interpolator.hex(0.0), interpolator, style_name, 0.0
     
     
-    def step(self, widget:tk.Widget, t:float, animation_data: tuple[Color, Color, str]) -> None:
-        c1, c2, style = animation_data
-        c = lerp_color(c1, c2, t, mode=self.mode, clockwise=self.clockwise)
-        self.style.configure(style, **{self._value: rgb_to_hex(c)})
+    def step(self, widget:tk.Widget, t:float, animation_data: tuple[str, ColorInterpolator, str, float]) -> None:
+        _, interpolator, style, t0 = animation_data
+        self.configure_style(widget, style, self._value, interpolator.hex(remap_progress(t, t0)))
+
+
+    def restore(self, widget: tk.Widget, animation_data: tuple[str, ColorInterpolator, str, float]) -> None:
+        origin, _, style, _ = animation_data
+        self.configure_style(widget, style, self._value, origin)
+
+
+    def retarget(
+        self,
+        animation_data: tuple[str, ColorInterpolator, str, float],
+        t: float,
+        end_color: Optional[Color] = None,
+        **kwargs
+    ) -> tuple[str, ColorInterpolator, str, float]:
+        if end_color is None:
+            return animation_data
+        origin, interpolator, style, t0 = animation_data
+        return origin, interpolator.retarget(remap_progress(t, t0), end_color), style, t
 
     
     def inverse(self) -> TweenAnimator:
@@ -163,7 +255,7 @@ class Background(ColorAnimator):
         self,
         start_color:Optional[Color]=None,
         end_color:Optional[Color]=None,
-        mode:Literal['rgb', 'hsv']='rgb',
+        mode:ColorMode='rgb',
         clockwise:Optional[bool]=None
     ) -> None:
         super().__init__(
@@ -180,7 +272,7 @@ class Foreground(ColorAnimator):
         self,
         start_color:Optional[Color]=None,
         end_color:Optional[Color]=None,
-        mode:Literal['rgb', 'hsv']='rgb',
+        mode:ColorMode='rgb',
         clockwise:Optional[bool]=None
     ) -> None:
         super().__init__(